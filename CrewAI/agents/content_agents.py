@@ -1,8 +1,17 @@
 from crewai import Agent
 
-def create_content_agents():
+def _llm_kwargs(llm):
+    """
+    Only pass an llm through when one is given, so crewai keeps its default model otherwise
+    """
+    return {"llm": llm} if llm is not None else {}
+
+def create_content_agents(llm=None):
     """
     Create and return the content creation agents
+    
+    Args:
+        llm: Optional LLM for the agents (defaults to crewai's OpenAI model)
     """
     planner = Agent(
         role="Content Planner",
@@ -15,7 +24,8 @@ def create_content_agents():
                   "Your work is the basis for "
                   "the Content Writer to write an article on this topic.",
         allow_delegation=False,
-        verbose=True
+        verbose=True,
+        **_llm_kwargs(llm)
     )
 
     writer = Agent(
@@ -37,7 +47,8 @@ def create_content_agents():
                   "when your statements are opinions "
                   "as opposed to objective statements.",
         allow_delegation=False,
-        verbose=True
+        verbose=True,
+        **_llm_kwargs(llm)
     )
 
     editor = Agent(
@@ -53,17 +64,19 @@ def create_content_agents():
                   "and also avoids major controversial topics "
                   "or opinions when possible.",
         allow_delegation=False,
-        verbose=True
+        verbose=True,
+        **_llm_kwargs(llm)
     )
 
     return planner, writer, editor
 
-def create_support_agents(customer):
+def create_support_agents(customer, llm=None):
     """
     Create and return the support agents
     
     Args:
         customer (str): The customer name for support agents
+        llm: Optional LLM for the agents (defaults to crewai's OpenAI model)
     """
     customer_support_agent = Agent(
         role="Senior Support Representative",
@@ -75,7 +88,8 @@ def create_support_agents(customer):
             "Make sure to provide full complete answers, and make no assumptions."
         ),
         allow_delegation=False,
-        verbose=True
+        verbose=True,
+        **_llm_kwargs(llm)
     )
 
     support_quality_assurance_agent = Agent(
@@ -88,7 +102,8 @@ def create_support_agents(customer):
             "You need to make sure that the support representative is providing full "
             "complete answers, and make no assumptions."
         ),
-        verbose=True  
+        verbose=True,
+        **_llm_kwargs(llm)
     )
 
     return customer_support_agent, support_quality_assurance_agent 
@@ -137,9 +152,12 @@ def customer_outreach_campaign_agents():
     )
 
 
-def create_travel_agents():
+def create_travel_agents(llm=None):
     """
     Create and return the travel agent team
+    
+    Args:
+        llm: Optional LLM for the agents (defaults to crewai's OpenAI model)
     """
     travel_planner_consultant = Agent(
         role="Travel Planner/Consultant",
@@ -147,7 +165,8 @@ def create_travel_agents():
         backstory="You are a travel planner and consultant who helps clients create the perfect travel itinerary. "
                   "You gather information about their preferences and suggest the best options, including flights, accommodations, and activities.",
         allow_delegation=False,
-        verbose=True
+        verbose=True,
+        **_llm_kwargs(llm)
     )
 
     travel_info_coordinator = Agent(
@@ -156,7 +175,8 @@ def create_travel_agents():
         backstory="You are responsible for collating information from the travel planner/consultant and presenting it to the client. "
                   "You ensure that the summary is clear and allows the user to make informed decisions.",
         allow_delegation=False,
-        verbose=True
+        verbose=True,
+        **_llm_kwargs(llm)
     )
 
     return travel_planner_consultant, travel_info_coordinator
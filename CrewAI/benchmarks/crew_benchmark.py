@@ -0,0 +1,214 @@
+"""
+Crew Latency Benchmark
+======================
+
+Runs each crew (content, support, travel, test travel) end to end against a
+local fake LLM and a local fake Serper/docs server with configurable injected
+latency, and reports wall time, time per task, time per tool and allocations.
+
+Because every provider is a local stand-in, the numbers isolate the overhead
+of our own code and of crewai from provider latency. Results are saved as JSON
+so a later run can be compared against them.
+
+Usage:
+    python benchmarks/crew_benchmark.py --llm-latency 0.05 --serper-latency 0.1
+    python benchmarks/crew_benchmark.py --crews travel --repeat 5 --baseline benchmarks/results/<file>.json
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(PROJECT_DIR, "benchmarks", "results")
+sys.path.insert(0, PROJECT_DIR)
+
+from benchmarks.fakes import FakeChatModel, FakeEmbeddingFunction, FakeSerperServer  # noqa: E402
+
+CREWS = ["content", "support", "travel", "test_travel"]
+
+CREW_INPUTS = {
+    "content": {"topic": "Artificial Intelligence"},
+    "support": {
+        "inquiry": "How can I add memory to my crew?",
+        "person": "Ike",
+        "customer": "Gister App",
+    },
+    "travel": {},
+    "test_travel": {},
+}
+
+# Arguments the fake LLM sends when it decides to call each tool
+TOOL_INPUTS = {
+    "Ticket Search Tool": {
+        "full_name": "Jane Doe",
+        "email": "jane.doe@example.com",
+        "traveling_from": "San Francisco",
+        "traveling_to": "Chicago",
+        "travel_date": "2024-05-01",
+        "return_date": "2024-05-05",
+        "flight_class": "Business",
+        "luggage_number": 1,
+        "travel_companions": 0,
+    },
+    "Travel Guide Tool": {"location": "Chicago", "travel_date": "2024-05-01"},
+    "Read website content": {},
+    "Search support documentation": {"search_query": "How can I add memory to my crew?"},
+}
+
+
+def configure_environment(server: FakeSerperServer):
+    """
+    Point the project at the local stand-ins. Must run before the project's
+    modules are imported, since settings are read at import time.
+    """
+    os.environ.setdefault("OPENAI_API_KEY", "benchmark-key")
+    os.environ.setdefault("SERPER_API_KEY", "benchmark-key")
+    os.environ["SERPER_SEARCH_URL"] = server.search_url
+    os.environ["SUPPORT_DOCS_URL"] = server.docs_url
+    os.environ["SEARCH_CACHE_ENABLED"] = "false"  # Measure real tool round-trips
+    os.environ["LLM_CACHE_ENABLED"] = "false"
+    os.environ["SNAPSHOT_STORE_PATH"] = ":memory:"  # Docs snapshots live for this run only
+    os.environ["RATE_LIMIT_ENABLED"] = "false"  # The local stand-ins have no quota
+    os.environ["SUPPORT_DOCS_INDEX_DIR"] = tempfile.mkdtemp(prefix="crew-benchmark-index-")
+    os.environ["OTEL_SDK_DISABLED"] = "true"  # No crewai telemetry calls
+
+
+def run_crew(name, llm, trace_alloc=False):
+    """
+    Build and kick off one crew, returning its timings (and allocation figures
+    when trace_alloc is set - tracing slows Python down, so those runs are not timed)
+    """
+    from crews.crew_templates import CREW_BUILDERS
+
+    builder_kwargs = {"llm": llm}
+    if name == "support":
+        builder_kwargs["memory"] = False  # Memory needs a live embeddings provider
+
+    if trace_alloc:
+        tracemalloc.start()
+    build_start = time.perf_counter()
+    crew = CREW_BUILDERS[name](**builder_kwargs)
+    build_time = time.perf_counter() - build_start
+
+    start = time.perf_counter()
+    crew.kickoff(inputs=CREW_INPUTS[name])
+    wall = time.perf_counter() - start
+
+    if trace_alloc:
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return {"alloc_peak_kib": peak / 1024, "alloc_retained_kib": current / 1024}
+
+    return {"build_s": build_time, "wall_s": wall}
+
+
+def summarize(samples, alloc, snapshot):
+    """
+    Aggregate repeated runs of one crew; per-task and per-tool figures come from
+    a snapshot of the metrics registry (utils.metrics), averaged over the runs
+    """
+    walls = [s["wall_s"] for s in samples]
+    return {
+        "runs": len(samples),
+        "wall_s_median": statistics.median(walls),
+        "wall_s_min": min(walls),
+        "build_s_median": statistics.median(s["build_s"] for s in samples),
+        "task_s_mean": {
+            series["labels"]["task"]: series["mean_s"] for series in snapshot.get("task", [])
+        },
+        "tool_s_mean": {
+            series["labels"]["tool"]: series["mean_s"] for series in snapshot.get("tool", [])
+        },
+        "tool_calls": {
+            series["labels"]["tool"]: series["count"] for series in snapshot.get("tool", [])
+        },
+        "serper_calls": sum(series["count"] for series in snapshot.get("serper", [])),
+        "alloc_peak_kib": alloc["alloc_peak_kib"],
+        "alloc_retained_kib": alloc["alloc_retained_kib"],
+    }
+
+
+def compare(results, baseline_path):
+    """Print the change in median wall time against a saved run"""
+    with open(baseline_path) as f:
+        baseline = json.load(f)["crews"]
+    print(f"\nComparison with {baseline_path}:")
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]["wall_s_median"]
+        after = result["wall_s_median"]
+        change = (after - before) / before * 100 if before else 0.0
+        print(f"  {name:12s} {before:8.3f}s -> {after:8.3f}s ({change:+.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end crew latency benchmark")
+    parser.add_argument("--crews", nargs="*", default=CREWS, choices=CREWS)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--llm-latency", type=float, default=0.0, help="Seconds per fake LLM call")
+    parser.add_argument("--serper-latency", type=float, default=0.0, help="Seconds per fake HTTP request")
+    parser.add_argument("--baseline", help="Saved results file to compare against")
+    parser.add_argument("--no-save", action="store_true")
+    args = parser.parse_args()
+
+    with FakeSerperServer(latency=args.serper_latency) as server:
+        configure_environment(server)
+
+        from utils.doc_index import set_embedding_function
+        from utils.metrics import get_metrics, install_task_metrics
+
+        set_embedding_function(FakeEmbeddingFunction())
+        install_task_metrics()
+        metrics = get_metrics()
+
+        results = {}
+        for name in args.crews:
+            llm = FakeChatModel(latency=args.llm_latency, tool_inputs=TOOL_INPUTS)
+            metrics.reset()
+            samples = [run_crew(name, llm) for _ in range(args.repeat)]
+            snapshot = metrics.snapshot()  # Taken before the slower allocation-tracing run
+            results[name] = summarize(samples, run_crew(name, llm, trace_alloc=True), snapshot)
+            results[name]["llm_calls"] = llm.calls
+
+            r = results[name]
+            tasks = ", ".join(f"{task}={t:.3f}s" for task, t in r["task_s_mean"].items())
+            tools = ", ".join(f"{tool}={t:.3f}s x{r['tool_calls'][tool]}" for tool, t in r["tool_s_mean"].items())
+            print(f"{name:12s} wall {r['wall_s_median']:.3f}s (build {r['build_s_median']:.3f}s), "
+                  f"tasks [{tasks}], tools [{tools or '-'}], peak {r['alloc_peak_kib']:.0f} KiB")
+
+        from utils.http import http_pool_stats
+
+        http_pool = {k: v for k, v in http_pool_stats().items() if k != "hosts"}
+        print(f"http pool: {http_pool['requests']} requests over "
+              f"{http_pool['connections_opened']} connections ({http_pool['reused']} reused), "
+              f"{http_pool['async_connections']} async connections")
+
+    report = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "http_pool": http_pool,
+        "config": {
+            "repeat": args.repeat,
+            "llm_latency": args.llm_latency,
+            "serper_latency": args.serper_latency,
+        },
+        "crews": results,
+    }
+    if not args.no_save:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        path = os.path.join(RESULTS_DIR, f"crew_benchmark_{datetime.now():%Y%m%d_%H%M%S}.json")
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nSaved results to {path}")
+    if args.baseline:
+        compare(results, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
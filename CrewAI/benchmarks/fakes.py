@@ -0,0 +1,188 @@
+"""
+Local Stand-ins for Benchmarks
+==============================
+
+A scripted chat model and a local HTTP server standing in for Serper and the
+support docs page, both with configurable injected latency, and an offline
+embedding function for the docs index. They let the
+benchmarks measure crew orchestration overhead without calling (or paying
+for) any external provider.
+"""
+import hashlib
+import json
+import math
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, List, Optional
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+# Appears in every fake search result, so the fake LLM knows a tool has already answered
+RESULT_MARKER = "BENCH-RESULT"
+
+FAKE_DOCS_HTML = (
+    "<html><body><h1>Creating a Crew and kicking it off</h1>"
+    "<p>Set memory=True on the Crew to give your agents short-term, long-term and entity memory.</p>"
+    "<p>Call crew.kickoff(inputs={...}) to start the crew. " + RESULT_MARKER + "</p>"
+    "</body></html>"
+)
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    Scripted chat model speaking crewai's ReAct format.
+
+    On the first step of a task whose agent has one of ``tool_inputs``' tools
+    available, it answers with an Action for that tool; once a tool result is
+    in the prompt (or when no scripted tool is available) it returns a Final
+    Answer. Every call sleeps ``latency`` seconds to simulate the provider.
+    """
+    latency: float = 0.0
+    tool_inputs: dict = {}
+    answer: str = "This is a benchmark answer produced by the fake LLM."
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-chat"
+
+    def _generate(self, messages: List[Any], stop: Optional[List[str]] = None,
+                  run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        prompt = "\n".join(str(message.content) for message in messages)
+        text = self._respond(prompt)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=text))])
+
+    def _respond(self, prompt: str) -> str:
+        if RESULT_MARKER not in prompt:
+            for tool_name, arguments in self.tool_inputs.items():
+                if tool_name in prompt:
+                    return (
+                        "Thought: I need to use a tool to answer this.\n"
+                        f"Action: {tool_name}\n"
+                        f"Action Input: {json.dumps(arguments)}"
+                    )
+        return f"Thought: I now know the final answer\nFinal Answer: {self.answer}"
+
+
+class FakeEmbeddingFunction:
+    """
+    Offline Chroma embedding function: hashed bag-of-words vectors, so similar
+    texts get similar embeddings without calling an embeddings provider.
+
+    Args:
+        dimensions (int): Length of the vectors
+    """
+
+    def __init__(self, dimensions: int = 64):
+        self.dimensions = dimensions
+        self.calls = 0
+
+    def __call__(self, input: List[str]) -> List[List[float]]:
+        self.calls += 1
+        return [self._embed(text) for text in input]
+
+    def _embed(self, text: str) -> List[float]:
+        vector = [0.0] * self.dimensions
+        for word in text.lower().split():
+            digest = hashlib.md5(word.encode("utf-8")).digest()
+            vector[int.from_bytes(digest[:4], "little") % self.dimensions] += 1.0
+        norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+        return [v / norm for v in vector]
+
+
+class FakeSerperServer:
+    """
+    Local HTTP server answering Serper-style POST /search requests and GET requests
+    for the support docs page, after an injected delay.
+
+    Args:
+        latency (float): Seconds to wait before answering each request
+        n_results (int): Number of organic results returned per search
+    """
+
+    def __init__(self, latency: float = 0.0, n_results: int = 5):
+        self.latency = latency
+        self.n_results = n_results
+        self.requests = 0
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    @property
+    def search_url(self) -> str:
+        return f"{self.base_url}/search"
+
+    @property
+    def docs_url(self) -> str:
+        return f"{self.base_url}/docs"
+
+    def start(self):
+        """Start serving on a free localhost port in a background thread"""
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep-alive, like the real endpoints
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                query = json.loads(body or b"{}").get("q", "")
+                self._reply("application/json", json.dumps(fake.results_for(query)))
+
+            def do_GET(self):
+                self._reply("text/html", FAKE_DOCS_HTML)
+
+            def _reply(self, content_type, payload):
+                fake.requests += 1
+                if fake.latency:
+                    time.sleep(fake.latency)
+                data = payload.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass  # Keep benchmark output clean
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Shut the server down"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def results_for(self, query: str) -> dict:
+        """Build a Serper-shaped response for a query"""
+        return {
+            "searchParameters": {"q": query},
+            "organic": [
+                {
+                    "title": f"Result {i} for {query}",
+                    "link": f"https://example.com/{i}",
+                    "snippet": f"{RESULT_MARKER} snippet {i} about {query}.",
+                    "position": i,
+                }
+                for i in range(1, self.n_results + 1)
+            ],
+        }
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,157 @@
+"""
+Memory Retrieval Benchmark
+==========================
+
+Measures how crew memory retrieval latency, write latency and file size grow
+with the number of stored items, for the bounded memory store
+(utils/memory_store.py) and, with ``--chroma``, for a Chroma collection like
+crewai's default memory storage (using offline fake embeddings, so only the
+storage cost is measured).
+
+Items are synthetic support-conversation notes spread over several customer
+namespaces; queries are drawn from the same vocabulary.
+
+Usage:
+    python benchmarks/memory_benchmark.py
+    python benchmarks/memory_benchmark.py --sizes 1000 10000 50000 --queries 500 --chroma
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(PROJECT_DIR, "benchmarks", "results")
+sys.path.insert(0, PROJECT_DIR)
+
+from utils.memory_store import MemoryStore  # noqa: E402
+
+VOCABULARY = (
+    "crew memory agent task tool kickoff inquiry billing invoice refund account login password "
+    "export import dashboard integration webhook api key limit quota upgrade plan team member "
+    "permission error timeout retry schedule report customer support docs setting"
+).split()
+
+
+def make_note(rng: random.Random, i: int) -> str:
+    """A synthetic memory item: a short note built from the shared vocabulary"""
+    words = " ".join(rng.choice(VOCABULARY) for _ in range(rng.randint(12, 30)))
+    return f"Conversation {i}: the customer mentioned {words}."
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def file_size(path):
+    # The database plus its write-ahead log
+    return sum(os.path.getsize(p) for p in (path, path + "-wal") if os.path.exists(p))
+
+
+def bench_memory_store(size, queries, namespaces, seed):
+    """Fill a fresh MemoryStore with ``size`` items and time writes and searches"""
+    rng = random.Random(seed)
+    path = os.path.join(tempfile.mkdtemp(prefix="memory-benchmark-"), "memory.sqlite3")
+    store = MemoryStore(path, max_entries=size, max_total_entries=size)
+
+    start = time.perf_counter()
+    for i in range(size):
+        store.save(f"customer-{i % namespaces}", "short_term", make_note(rng, i), {"agent": "support"})
+    write_s = (time.perf_counter() - start) / size
+
+    latencies = []
+    for _ in range(queries):
+        query = " ".join(rng.choice(VOCABULARY) for _ in range(6))
+        start = time.perf_counter()
+        store.search(f"customer-{rng.randrange(namespaces)}", "short_term", query, limit=3)
+        latencies.append(time.perf_counter() - start)
+    store.compact()
+    store.close()
+    return latencies, write_s, file_size(path)
+
+
+def bench_chroma(size, queries, namespaces, seed):
+    """Same workload on a persistent Chroma collection with fake embeddings"""
+    import chromadb
+    from benchmarks.fakes import FakeEmbeddingFunction
+
+    rng = random.Random(seed)
+    path = tempfile.mkdtemp(prefix="memory-benchmark-chroma-")
+    collection = chromadb.PersistentClient(path=path).get_or_create_collection(
+        "short_term", embedding_function=FakeEmbeddingFunction()
+    )
+
+    start = time.perf_counter()
+    for i in range(size):
+        collection.add(ids=[str(i)], documents=[make_note(rng, i)],
+                       metadatas=[{"namespace": f"customer-{i % namespaces}"}])
+    write_s = (time.perf_counter() - start) / size
+
+    latencies = []
+    for _ in range(queries):
+        query = " ".join(rng.choice(VOCABULARY) for _ in range(6))
+        start = time.perf_counter()
+        collection.query(query_texts=[query], n_results=3,
+                         where={"namespace": f"customer-{rng.randrange(namespaces)}"})
+        latencies.append(time.perf_counter() - start)
+    size_bytes = sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, names in os.walk(path) for name in names
+    )
+    return latencies, write_s, size_bytes
+
+
+def summarize(latencies, write_s, size_bytes):
+    return {
+        "search_ms_median": statistics.median(latencies) * 1000,
+        "search_ms_p95": percentile(latencies, 0.95) * 1000,
+        "write_ms_mean": write_s * 1000,
+        "size_kib": size_bytes / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory retrieval latency against store size")
+    parser.add_argument("--sizes", nargs="*", type=int, default=[100, 1000, 10000])
+    parser.add_argument("--queries", type=int, default=200, help="Searches timed per size")
+    parser.add_argument("--namespaces", type=int, default=20, help="Customers the items are spread over")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--chroma", action="store_true", help="Also measure a Chroma collection")
+    parser.add_argument("--no-save", action="store_true")
+    args = parser.parse_args()
+
+    backends = {"memory_store": bench_memory_store}
+    if args.chroma:
+        backends["chroma"] = bench_chroma
+
+    results = {}
+    for name, bench in backends.items():
+        results[name] = {}
+        for size in args.sizes:
+            r = summarize(*bench(size, args.queries, args.namespaces, args.seed))
+            results[name][str(size)] = r
+            print(f"{name:12s} {size:7d} items: search {r['search_ms_median']:.2f} ms median, "
+                  f"{r['search_ms_p95']:.2f} ms p95, write {r['write_ms_mean']:.2f} ms, "
+                  f"{r['size_kib']:.0f} KiB")
+
+    report = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "config": {"queries": args.queries, "namespaces": args.namespaces, "seed": args.seed},
+        "backends": results,
+    }
+    if not args.no_save:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        path = os.path.join(RESULTS_DIR, f"memory_benchmark_{datetime.now():%Y%m%d_%H%M%S}.json")
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nSaved results to {path}")
+
+
+if __name__ == "__main__":
+    main()
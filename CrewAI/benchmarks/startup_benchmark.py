@@ -0,0 +1,130 @@
+"""
+Startup Benchmark
+=================
+
+Measures the cold import time of the project's modules and verifies that
+importing them performs no network I/O.
+
+Each module is imported in a fresh interpreter with ``-X importtime`` and with
+socket connections disabled, so the numbers reflect a worker's cold start and
+any import-time network call shows up as a failure.
+
+Usage:
+    python benchmarks/startup_benchmark.py                # default module list
+    python benchmarks/startup_benchmark.py main config.settings --top 15
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_MODULES = [
+    "config.settings",
+    "config.topics",
+    "config.llm_config",
+    "main",
+    "tools.content_tools",
+    "tools.serper_search",
+    "agents.content_agents",
+    "tasks.content_tasks",
+    "crews.crew_templates",
+]
+
+# Runs in the child interpreter: any attempt to open a connection fails the import
+_IMPORT_SNIPPET = """
+import socket, sys
+def _no_network(*args, **kwargs):
+    raise RuntimeError("network I/O attempted during import")
+socket.socket.connect = _no_network
+socket.create_connection = _no_network
+__import__(sys.argv[1])  # Goes through the import statement machinery, so -X importtime sees it
+"""
+
+
+def measure_import(module: str) -> dict:
+    """
+    Import a module in a fresh interpreter and collect its import timings
+
+    Args:
+        module (str): Dotted module name, relative to the project directory
+
+    Returns:
+        dict: wall time, total cumulative import time and the per-module breakdown
+    """
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _IMPORT_SNIPPET, module],
+        cwd=PROJECT_DIR,
+        capture_output=True,
+        text=True
+    )
+    wall = time.perf_counter() - start
+
+    imports = []
+    errors = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            errors.append(line)
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # Header line
+        name = parts[2].rstrip()
+        imports.append({
+            "module": name.strip(),
+            "depth": (len(name) - len(name.lstrip())) // 2,
+            "self_us": int(parts[0]),
+            "cumulative_us": int(parts[1]),
+        })
+
+    # Children are listed before their parent: keep only the target's own subtree,
+    # not the interpreter start-up or the snippet's socket import
+    target_index = next(
+        (i for i in range(len(imports) - 1, -1, -1)
+         if imports[i]["module"] == module and imports[i]["depth"] == 0),
+        None
+    )
+    subtree = []
+    if target_index is not None:
+        first = target_index
+        while first > 0 and imports[first - 1]["depth"] > 0:
+            first -= 1
+        subtree = imports[first:target_index + 1]
+
+    return {
+        "module": module,
+        "ok": proc.returncode == 0,
+        "wall_s": wall,
+        "import_s": subtree[-1]["cumulative_us"] / 1e6 if subtree else 0.0,
+        "imports": subtree,
+        "error": "\n".join(errors[-5:]) if proc.returncode else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report cold import time per module")
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--top", type=int, default=5, help="Slowest dependencies to list per module")
+    args = parser.parse_args()
+
+    failed = False
+    for module in args.modules:
+        result = measure_import(module)
+        if not result["ok"]:
+            failed = True
+            print(f"✗ {module}: import failed\n{result['error']}\n")
+            continue
+
+        print(f"✓ {module}: {result['import_s']:.3f}s import, {result['wall_s']:.3f}s wall")
+        slowest = sorted(result["imports"], key=lambda i: i["self_us"], reverse=True)[:args.top]
+        for entry in slowest:
+            print(f"    {entry['self_us'] / 1000:8.1f} ms  {entry['module']}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+LLM Completion Cache
+====================
+
+A LangChain cache backed by the project's PersistentCache (SQLite), so
+identical prompts sent to the same model with the same parameters are answered
+from disk instead of being billed and waited on again.
+
+Entries are keyed by a hash of the model/parameter string LangChain builds for
+each LLM plus the full prompt. The store is bounded by age (TTL) and size (LRU).
+
+Replay mode makes reruns deterministic: cached completions are returned even
+when expired, and a prompt that was never recorded raises CompletionCacheMiss
+instead of calling the provider.
+"""
+import hashlib
+import threading
+
+from langchain_core.caches import BaseCache
+from langchain_core.load import dumps, loads
+
+from utils.cache import PersistentCache
+
+_CACHE_KIND = "completion"
+
+
+class CompletionCacheMiss(LookupError):
+    """Raised in replay mode when a prompt has no recorded completion"""
+
+
+class CompletionCache(BaseCache):
+    """
+    LangChain BaseCache implementation on top of PersistentCache
+
+    Args:
+        path (str): Location of the SQLite file
+        ttl (float): Maximum age of a completion in seconds (None keeps them forever)
+        max_entries (int): Upper bound on stored completions before LRU eviction
+        replay (bool): Serve only recorded completions and fail on misses
+    """
+
+    def __init__(self, path: str, ttl: float = None, max_entries: int = 2000, replay: bool = False):
+        self.replay = replay
+        self.store = PersistentCache(
+            path,
+            ttls={_CACHE_KIND: ttl},
+            max_entries=max_entries,
+            stale_for=None if replay else 0.0  # Replay serves recorded completions of any age
+        )
+
+    def lookup(self, prompt: str, llm_string: str):
+        generations = self.store.get(self._key(prompt, llm_string), _CACHE_KIND, allow_stale=self.replay)
+        if generations is None:
+            if self.replay:
+                raise CompletionCacheMiss(f"No recorded completion for prompt: {prompt[:80]!r}")
+            return None
+        return [loads(generation) for generation in generations]
+
+    def update(self, prompt: str, llm_string: str, return_val) -> None:
+        self.store.set(
+            self._key(prompt, llm_string),
+            [dumps(generation) for generation in return_val],
+            _CACHE_KIND
+        )
+
+    def clear(self, **kwargs) -> None:
+        self.store.clear()
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and size of the cache"""
+        return self.store.stats()
+
+    @staticmethod
+    def _key(prompt: str, llm_string: str) -> str:
+        # llm_string already encodes the model name and its parameters
+        return hashlib.sha256(f"{llm_string}\0{prompt}".encode("utf-8")).hexdigest()
+
+
+_completion_cache = None
+_completion_cache_lock = threading.Lock()
+
+def get_completion_cache() -> CompletionCache:
+    """
+    Return the process-wide completion cache configured in settings
+    """
+    global _completion_cache
+    from config.settings import LLM_CACHE_PATH, LLM_CACHE_TTL, LLM_CACHE_MAX_ENTRIES, LLM_CACHE_REPLAY
+
+    with _completion_cache_lock:
+        if _completion_cache is None:
+            _completion_cache = CompletionCache(
+                LLM_CACHE_PATH,
+                ttl=LLM_CACHE_TTL,
+                max_entries=LLM_CACHE_MAX_ENTRIES,
+                replay=LLM_CACHE_REPLAY
+            )
+    return _completion_cache
+
+def enable_llm_cache() -> CompletionCache:
+    """
+    Install the completion cache as LangChain's global cache.
+
+    This covers every LLM that does not set its own cache, including the
+    default OpenAI model crewai creates for agents without an explicit llm.
+    """
+    from langchain.globals import set_llm_cache
+
+    cache = get_completion_cache()
+    set_llm_cache(cache)
+    return cache
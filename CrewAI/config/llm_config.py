@@ -1,14 +1,18 @@
+import logging
 import os
-from langchain_community.llms import HuggingFaceHub
-from langchain_community.chat_models import ChatCohere
+import threading
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 def get_huggingface_llm():
     """
     Initialize and return HuggingFace LLM
     """
+    from langchain_community.llms import HuggingFaceHub  # Imported on demand to keep start-up fast
+
     return HuggingFaceHub(
         repo_id="HuggingFaceH4/zephyr-7b-beta",
         huggingfacehub_api_token=os.getenv('HUGGINGFACE_API_TOKEN'),
@@ -29,18 +33,165 @@ def get_cohere_llm():
     """
     Initialize and return Cohere LLM
     """
+    from langchain_community.chat_models import ChatCohere  # Imported on demand to keep start-up fast
+
     return ChatCohere(
         cohere_api_key=os.getenv('COHERE_API_KEY')
     )
 
-def get_llm(provider: str = "openai"):
+def rate_limited(llm, provider: str):
+    """
+    Pace an LLM's calls through the shared rate limiter under the provider's
+    RATE_LIMITS entry, unless RATE_LIMIT_ENABLED is off. Configuration dicts
+    (Mistral) are returned unchanged.
+    """
+    from config.settings import RATE_LIMIT_ENABLED
+
+    if not RATE_LIMIT_ENABLED or llm is None or isinstance(llm, dict):
+        return llm
+    from utils.rate_limited_llm import pace_llm
+
+    return pace_llm(llm, provider)
+
+def get_streaming_llm():
+    """
+    Initialize and return the default OpenAI chat model with token streaming enabled.
+    Streamed tokens are published as "token" events (see utils.events).
+    """
+    from langchain_openai import ChatOpenAI
+    from config.settings import DEFAULT_MODEL, TEMPERATURE
+    from utils.token_stream import TokenStreamHandler
+
+    return rate_limited(ChatOpenAI(
+        model=DEFAULT_MODEL,
+        temperature=TEMPERATURE,
+        streaming=True,
+        callbacks=[TokenStreamHandler()]
+    ), "openai")
+
+def get_openai_llm():
+    """
+    Initialize and return the default OpenAI chat model
+    """
+    from langchain_openai import ChatOpenAI
+    from config.settings import DEFAULT_MODEL, TEMPERATURE
+
+    return ChatOpenAI(model=DEFAULT_MODEL, temperature=TEMPERATURE)
+
+def get_mistral_llm():
+    """
+    Initialize and return a chat model for Mistral's OpenAI-compatible API
+    """
+    from langchain_openai import ChatOpenAI
+
+    config = get_mistral_config()
+    return ChatOpenAI(
+        openai_api_key=config["api_key"],
+        openai_api_base=config["api_base"],
+        model_name=config["model_name"]
+    )
+
+# Router backends and the environment variable each one needs to be usable
+ROUTER_BACKENDS = {
+    "openai": (get_openai_llm, "OPENAI_API_KEY"),
+    "cohere": (get_cohere_llm, "COHERE_API_KEY"),
+    "mistral": (get_mistral_llm, "MISTRAL_API_KEY"),
+    "huggingface": (get_huggingface_llm, "HUGGINGFACE_API_TOKEN"),
+}
+
+_llm_router = None
+_llm_router_built = False
+_llm_router_lock = threading.Lock()
+
+def get_llm_router():
+    """
+    Return the process-wide LatencyRouter over the LLM_ROUTER_BACKENDS whose
+    API key is set, creating it on first use
+
+    Returns None, with a warning, when none of the backends has its API key
+    set, so callers fall back to the default model.
+
+    Raises:
+        ValueError: If LLM_ROUTER_BACKENDS names an unknown backend
+    """
+    global _llm_router, _llm_router_built
+    from config.llm_router import LatencyRouter
+    from config.settings import (
+        LLM_ROUTER_BACKENDS, LLM_ROUTER_WINDOW, LLM_ROUTER_ERROR_THRESHOLD, LLM_ROUTER_MIN_SAMPLES,
+        LLM_ROUTER_COOLDOWN, LLM_ROUTER_HEDGE, LLM_ROUTER_HEDGE_QUANTILE
+    )
+
+    names = [n.strip().lower() for n in LLM_ROUTER_BACKENDS if n.strip()]
+    unknown = [name for name in names if name not in ROUTER_BACKENDS]
+    if unknown:
+        raise ValueError(
+            f"Unknown LLM_ROUTER_BACKENDS entries: {', '.join(unknown)} "
+            f"(choose from {', '.join(ROUTER_BACKENDS)})"
+        )
+
+    with _llm_router_lock:
+        if not _llm_router_built:
+            backends = {}
+            for name in names:
+                factory, key = ROUTER_BACKENDS[name]
+                if os.getenv(key):
+                    backends[name] = rate_limited(factory(), name)
+            if backends:
+                _llm_router = LatencyRouter(
+                    backends,
+                    window=LLM_ROUTER_WINDOW,
+                    error_threshold=LLM_ROUTER_ERROR_THRESHOLD,
+                    min_samples=LLM_ROUTER_MIN_SAMPLES,
+                    cooldown=LLM_ROUTER_COOLDOWN,
+                    hedge=LLM_ROUTER_HEDGE,
+                    hedge_quantile=LLM_ROUTER_HEDGE_QUANTILE
+                )
+            else:
+                logger.warning("No LLM_ROUTER_BACKENDS entry has its API key set: using the default model")
+            _llm_router_built = True
+    return _llm_router
+
+def get_routed_llm():
+    """
+    Return a chat model sending each call to the fastest healthy backend of the router,
+    or None (crewai's default model) when no backend is configured
+    """
+    from config.routed_llm import RoutedChatModel
+
+    router = get_llm_router()
+    return RoutedChatModel(router=router) if router is not None else None
+
+def get_llm(provider: str = "openai", cache: bool = None):
     """
     Factory function to get the specified LLM
+    
+    Args:
+        provider (str): The LLM provider name ("router" spreads calls over all
+            configured providers by latency and health, see get_llm_router)
+        cache (bool): Attach the persistent completion cache to the returned LLM
+            (defaults to LLM_CACHE_ENABLED). The Mistral configuration is a plain
+            dict and the default OpenAI model is created by crewai, so both are
+            covered by enable_llm_cache() instead.
+
+    The returned LLM is paced by the shared rate limiter (see rate_limited);
+    the router's backends are paced individually.
     """
     providers = {
         "huggingface": get_huggingface_llm,
         "cohere": get_cohere_llm,
-        "mistral": get_mistral_config
+        "mistral": get_mistral_config,
+        "router": get_routed_llm
     }
     
-    return providers.get(provider.lower(), lambda: None)() 
\ No newline at end of file
+    llm = providers.get(provider.lower(), lambda: None)()
+    
+    if cache is None:
+        from config.settings import LLM_CACHE_ENABLED
+        cache = LLM_CACHE_ENABLED
+    if cache and llm is not None and not isinstance(llm, dict):
+        from config.llm_cache import get_completion_cache
+        llm.cache = get_completion_cache()
+    if provider.lower() != "router":
+        llm = rate_limited(llm, provider.lower())
+    
+    return llm 
\ No newline at end of file
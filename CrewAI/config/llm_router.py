@@ -0,0 +1,224 @@
+"""
+LLM Router
+==========
+
+Spreads LLM calls over several configured backends (OpenAI, Cohere, Mistral,
+HuggingFace) by measured latency and health.
+
+The router keeps a rolling window of the latest calls to each backend and
+sends every call to the fastest healthy one (lowest median latency; backends
+without samples yet keep their declared order, so the first one is the
+default). A backend whose error rate in the window reaches
+``error_threshold`` is skipped for ``cooldown`` seconds after its last error,
+and a failed call falls through to the next backend.
+
+With hedging enabled, a call still running after the primary backend's p95
+latency is sent to the second backend as well, and the first answer wins.
+The slower call is left to finish in the background and only updates the
+latency figures, so one slow provider no longer stalls the crew.
+
+config/routed_llm.RoutedChatModel exposes the router as a LangChain chat
+model, usable as any agent's ``llm``.
+"""
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import List, Optional
+
+
+class BackendStats:
+    """
+    Rolling window of one backend's call latencies and outcomes
+
+    Args:
+        window (int): Number of recent calls kept
+    """
+
+    def __init__(self, window: int = 50):
+        self.samples = deque(maxlen=window)  # (latency in seconds, succeeded)
+        self.last_error_at = None
+
+    def record(self, latency: float, ok: bool):
+        self.samples.append((latency, ok))
+        if not ok:
+            self.last_error_at = time.monotonic()
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Latency quantile of the successful calls in the window, None without samples"""
+        latencies = sorted(latency for latency, ok in self.samples if ok)
+        if not latencies:
+            return None
+        return latencies[min(int(len(latencies) * q), len(latencies) - 1)]
+
+    @property
+    def error_rate(self) -> float:
+        if not self.samples:
+            return 0.0
+        return sum(not ok for _, ok in self.samples) / len(self.samples)
+
+
+class LatencyRouter:
+    """
+    Picks the fastest healthy backend for each call, with fallback and optional hedging
+
+    Args:
+        backends (dict): Backend name -> backend object, in order of preference
+        window (int): Recent calls kept per backend
+        error_threshold (float): Error rate at which a backend is considered unhealthy
+        min_samples (int): Calls needed before a backend's error rate or p95 is trusted
+        cooldown (float): Seconds an unhealthy backend is skipped after its last error
+        hedge (bool): Send slow calls to a second backend as well
+        hedge_quantile (float): Latency quantile of the primary after which a call is hedged
+    """
+
+    def __init__(self, backends: dict, window: int = 50, error_threshold: float = 0.5,
+                 min_samples: int = 5, cooldown: float = 30, hedge: bool = False,
+                 hedge_quantile: float = 0.95):
+        if not backends:
+            raise ValueError("LatencyRouter needs at least one backend")
+        self.backends = dict(backends)
+        self.error_threshold = error_threshold
+        self.min_samples = min_samples
+        self.cooldown = cooldown
+        self.hedge = hedge
+        self.hedge_quantile = hedge_quantile
+        self.counts = {"calls": 0, "fallbacks": 0, "hedged": 0, "hedge_wins": 0}
+        self._stats = {name: BackendStats(window) for name in self.backends}
+        self._order = {name: i for i, name in enumerate(self.backends)}
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def is_healthy(self, name: str) -> bool:
+        """Whether a backend may receive calls"""
+        with self._lock:
+            stats = self._stats[name]
+            if len(stats.samples) < self.min_samples or stats.error_rate < self.error_threshold:
+                return True
+            return time.monotonic() - stats.last_error_at >= self.cooldown
+
+    def ranked(self) -> List[str]:
+        """Backend names, best first: healthy before unhealthy, then by median latency"""
+        healthy = {name: self.is_healthy(name) for name in self.backends}
+        with self._lock:
+            medians = {name: self._stats[name].quantile(0.5) for name in self.backends}
+        return sorted(
+            self.backends,
+            key=lambda name: (
+                not healthy[name],
+                medians[name] is None,  # Backends with no successful call yet keep their order
+                medians[name] or 0.0,
+                self._order[name],
+            )
+        )
+
+    def record(self, name: str, latency: float, ok: bool):
+        """Add one call's outcome to a backend's window"""
+        with self._lock:
+            self._stats[name].record(latency, ok)
+
+    def call(self, invoke):
+        """
+        Run ``invoke(backend)`` on the best backend, falling back to the next
+        ones on errors and hedging slow calls when enabled
+
+        Args:
+            invoke (callable): Performs the call on a backend object and returns its result
+
+        Returns:
+            The first successful result
+
+        Raises:
+            Exception: The last backend's error, if every backend failed
+        """
+        with self._lock:
+            self.counts["calls"] += 1
+        order = self.ranked()
+        threshold = self._hedge_threshold(order[0]) if self.hedge and len(order) > 1 else None
+        if threshold is not None:
+            return self._hedged_call(invoke, order, threshold)
+
+        error = None
+        for i, name in enumerate(order):
+            if i:
+                with self._lock:
+                    self.counts["fallbacks"] += 1
+            try:
+                return self._timed(name, invoke)
+            except Exception as e:
+                error = e
+        raise error
+
+    def snapshot(self) -> dict:
+        """Return each backend's health, latency quantiles and error rate, plus the call counters"""
+        healthy = {name: self.is_healthy(name) for name in self.backends}
+        with self._lock:
+            backends = {
+                name: {
+                    "healthy": healthy[name],
+                    "samples": len(stats.samples),
+                    "p50_s": stats.quantile(0.5),
+                    "p95_s": stats.quantile(0.95),
+                    "error_rate": stats.error_rate,
+                }
+                for name, stats in self._stats.items()
+            }
+            return {"backends": backends, **self.counts}
+
+    def _hedge_threshold(self, name):
+        with self._lock:
+            stats = self._stats[name]
+            if sum(ok for _, ok in stats.samples) < self.min_samples:
+                return None
+            return stats.quantile(self.hedge_quantile)
+
+    def _timed(self, name, invoke):
+        start = time.perf_counter()
+        try:
+            result = invoke(self.backends[name])
+        except Exception:
+            self.record(name, time.perf_counter() - start, False)
+            raise
+        self.record(name, time.perf_counter() - start, True)
+        return result
+
+    def _hedged_call(self, invoke, order, threshold):
+        executor = self._get_executor()
+        # Calls run with the caller's context (current task, event listeners)
+        primary = executor.submit(contextvars.copy_context().run, self._timed, order[0], invoke)
+        done, _ = wait([primary], timeout=threshold)
+        if done and primary.exception() is None:
+            return primary.result()
+
+        # Slow (or failed) primary: race the second backend against it
+        with self._lock:
+            self.counts["hedged"] += 1
+        second = executor.submit(contextvars.copy_context().run, self._timed, order[1], invoke)
+        pending = {primary: order[0], second: order[1]}
+        error = None
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = pending.pop(future)
+                if future.exception() is None:
+                    if name != order[0]:
+                        with self._lock:
+                            self.counts["hedge_wins"] += 1
+                    return future.result()
+                error = future.exception()
+
+        # Both failed: fall back to the remaining backends in order
+        for name in order[2:]:
+            try:
+                return self._timed(name, invoke)
+            except Exception as e:
+                error = e
+        raise error
+
+    def _get_executor(self):
+        # A pool of its own: LLM calls must not wait behind tool I/O on the shared pool
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="llm-hedge")
+            return self._executor
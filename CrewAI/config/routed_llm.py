@@ -0,0 +1,73 @@
+"""
+Routed Chat Model
+=================
+
+A LangChain chat model that sends each call to the backend picked by a
+LatencyRouter (config/llm_router.py), so crewai agents use the router like
+any other ``llm``.
+"""
+from typing import Any, List, Optional
+
+from langchain_core.callbacks import CallbackManager
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, get_buffer_string
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+
+def invoke_backend(backend, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                   callbacks: Any = None, **kwargs) -> ChatResult:
+    """
+    Call a chat model or a completion model (e.g. HuggingFaceHub) with chat
+    messages and return the answer as a ChatResult, keeping the backend's
+    llm_output (token usage, model name)
+    """
+    if isinstance(backend, BaseChatModel):
+        result = backend.generate([messages], stop=stop, callbacks=callbacks, **kwargs)
+        message = result.generations[0][0].message
+    else:
+        result = backend.generate([get_buffer_string(messages)], stop=stop, callbacks=callbacks, **kwargs)
+        message = AIMessage(content=result.generations[0][0].text)
+    return ChatResult(generations=[ChatGeneration(message=message)], llm_output=result.llm_output)
+
+
+def _child_callbacks(run_manager) -> Optional[CallbackManager]:
+    # Callbacks for a backend call nested under the routed run (as ParentRunManager.get_child does)
+    if run_manager is None:
+        return None
+    manager = CallbackManager(handlers=[], parent_run_id=run_manager.run_id)
+    manager.set_handlers(run_manager.inheritable_handlers)
+    manager.add_tags(run_manager.inheritable_tags)
+    manager.add_metadata(run_manager.inheritable_metadata)
+    return manager
+
+
+class RoutedChatModel(BaseChatModel):
+    """
+    Chat model delegating every call to the fastest healthy backend of a router
+
+    Args:
+        router (LatencyRouter): Router whose backends are LangChain chat or completion models
+    """
+    router: Any = None
+
+    @property
+    def _llm_type(self) -> str:
+        return "latency-routed"
+
+    @property
+    def _identifying_params(self) -> dict:
+        return {"backends": list(self.router.backends)}
+
+    def _generate(self, messages: List[Any], stop: Optional[List[str]] = None,
+                  run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        # The backend's run is nested under this one, so callbacks (token streaming, tracing) see it
+        callbacks = _child_callbacks(run_manager)
+        return self.router.call(lambda backend: invoke_backend(backend, messages, stop, callbacks, **kwargs))
+
+    def _combine_llm_outputs(self, llm_outputs: List[Optional[dict]]) -> dict:
+        # Token usage summed over the prompts of one generate() call, as ChatOpenAI reports it
+        token_usage = {}
+        for output in llm_outputs:
+            for key, value in ((output or {}).get("token_usage") or {}).items():
+                token_usage[key] = token_usage.get(key, 0) + value
+        return {"token_usage": token_usage}
@@ -4,26 +4,166 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+# Project root (the CrewAI/ directory)
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 # API Keys
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
 SERPER_API_KEY = os.getenv('SERPER_API_KEY')
 
+# Service Endpoints (overridable, e.g. to point the benchmarks at local stand-ins)
+SERPER_SEARCH_URL = os.getenv('SERPER_SEARCH_URL', "https://google.serper.dev/search")
+SUPPORT_DOCS_URL = os.getenv('SUPPORT_DOCS_URL', "https://docs.crewai.com/how-to/Creating-a-Crew-and-kick-it-off/")
+
 # Model Settings
 DEFAULT_MODEL = "gpt-4-turbo"
 TEMPERATURE = 0.7
 MAX_TOKENS = 1500
 
+# LLM Router Settings (latency-aware routing over several providers, see config/llm_router.py)
+LLM_ROUTER_ENABLED = os.getenv('LLM_ROUTER_ENABLED', 'false').lower() == 'true'  # Agents use get_llm("router")
+LLM_ROUTER_BACKENDS = os.getenv('LLM_ROUTER_BACKENDS', 'openai,cohere,mistral,huggingface').split(',')  # Preference order
+LLM_ROUTER_WINDOW = 50  # Recent calls per backend used for latency and error rates
+LLM_ROUTER_ERROR_THRESHOLD = 0.5  # Error rate at which a backend is skipped
+LLM_ROUTER_MIN_SAMPLES = 5  # Calls before a backend's error rate or p95 is trusted
+LLM_ROUTER_COOLDOWN = 30  # Seconds an unhealthy backend is skipped after its last error
+LLM_ROUTER_HEDGE = os.getenv('LLM_ROUTER_HEDGE', 'false').lower() == 'true'  # Race slow calls on a second backend
+LLM_ROUTER_HEDGE_QUANTILE = 0.95  # Primary latency quantile after which a call is hedged
+
+# Tool Output Compaction Settings (token caps before tool output enters a prompt, see utils/compaction.py)
+COMPACTION_ENABLED = os.getenv('COMPACTION_ENABLED', 'true').lower() == 'true'
+TOOL_OUTPUT_MAX_TOKENS = MAX_TOKENS  # Default cap per tool call
+TASK_TOOL_OUTPUT_MAX_TOKENS = {  # Per-task caps
+    "search_tickets": MAX_TOKENS,
+    "travel_guide": MAX_TOKENS,
+    "support_inquiry": MAX_TOKENS // 2,  # Already retrieves only the relevant docs chunks
+    "summarize_travel_info": MAX_TOKENS // 2,
+}
+
 # Application Settings
 DEBUG_MODE = True
 VERBOSE_OUTPUT = 2  # 0: None, 1: Basic, 2: Detailed
 
+# Batch Settings
+BATCH_MAX_CONCURRENCY = int(os.getenv('BATCH_MAX_CONCURRENCY', '4'))  # Content crews running at once
+
+# Metrics Settings
+METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'true').lower() == 'true'  # Record task, tool, Serper and rate limit timings
+
+# Crew Template Settings
+CREW_POOL_MAX_IDLE = 4  # Built crews kept per template for reuse between kickoffs
+STREAM_QUEUE_SIZE = 1000  # Events a streamed crew may queue ahead of its reader (token chunks beyond are dropped)
+
+# LLM Completion Cache Settings
+LLM_CACHE_ENABLED = os.getenv('LLM_CACHE_ENABLED', 'false').lower() == 'true'
+LLM_CACHE_REPLAY = os.getenv('LLM_CACHE_REPLAY', 'false').lower() == 'true'  # Only serve recorded completions
+LLM_CACHE_PATH = os.getenv('LLM_CACHE_PATH', os.path.join(BASE_DIR, "db", "llm_cache.sqlite3"))
+LLM_CACHE_TTL = 7 * 24 * 3600  # Seconds before a completion is considered stale
+LLM_CACHE_MAX_ENTRIES = 2000
+
+# Search Cache Settings
+SEARCH_CACHE_ENABLED = os.getenv('SEARCH_CACHE_ENABLED', 'true').lower() == 'true'
+SEARCH_CACHE_PATH = os.getenv('SEARCH_CACHE_PATH', os.path.join(BASE_DIR, "db", "search_cache.sqlite3"))
+SEARCH_CACHE_MAX_ENTRIES = 5000
+SEARCH_CACHE_DEFAULT_TTL = 24 * 3600
+SEARCH_CACHE_STALE_FOR = 7 * 24 * 3600  # Seconds an expired result is kept as a fallback when Serper fails
+SEARCH_CACHE_TTLS = {  # Seconds each kind of query stays fresh
+    "weather": 3600,
+    "flights": 30 * 60,
+    "hotels": 6 * 3600,
+    "attractions": 7 * 24 * 3600,
+}
+
+# HTTP Transport Settings (shared keep-alive connection pool, see utils/http.py)
+HTTP_POOL_CONNECTIONS = 10  # Hosts with their own connection pool
+HTTP_POOL_MAXSIZE = 32  # Kept-alive connections per host (matches the I/O thread pool)
+HTTP_ASYNC_MAX_CONNECTIONS = 100  # Open connections per async client (one client per event loop)
+HTTP_POOL_BLOCK = False  # Open extra, non-pooled connections instead of waiting when a pool is busy
+HTTP_CONNECT_TIMEOUT = 5  # Seconds to establish a connection
+HTTP_READ_TIMEOUT = 30  # Seconds to wait for a response when the caller sets no timeout
+
+# Page Snapshot Settings (local copies of scraped pages, see utils/snapshots.py)
+SNAPSHOT_STORE_PATH = os.getenv('SNAPSHOT_STORE_PATH', os.path.join(BASE_DIR, "db", "page_snapshots.sqlite3"))
+SNAPSHOT_DEFAULT_MAX_AGE = 24 * 3600  # Seconds a snapshot stays fresh when the page sends no max-age
+SNAPSHOT_MIN_REFRESH_INTERVAL = 15 * 60  # Minimum seconds between two revalidations of a page
+SNAPSHOT_FETCH_TIMEOUT = 15
+
+# Support Docs Index Settings (chunked retrieval, see utils/doc_index.py)
+SUPPORT_DOCS_INDEX_DIR = os.getenv('SUPPORT_DOCS_INDEX_DIR', os.path.join(BASE_DIR, "db", "support_docs_index"))
+SUPPORT_DOCS_COLLECTION = "support_docs"
+SUPPORT_DOCS_TOP_K = 4  # Chunks returned per question
+SUPPORT_DOCS_REFRESH_INTERVAL = SNAPSHOT_MIN_REFRESH_INTERVAL  # Seconds between two ingestions of a page by the tool
+DOC_CHUNK_SIZE = 1000  # Maximum characters per chunk
+DOC_CHUNK_OVERLAP = 150  # Characters repeated between consecutive chunks
+EMBEDDING_MODEL = "text-embedding-ada-002"
+
+# Embedding Cache Settings (vectors keyed by model and text hash, see utils/embedding_cache.py)
+EMBEDDING_CACHE_ENABLED = os.getenv('EMBEDDING_CACHE_ENABLED', 'true').lower() == 'true'
+EMBEDDING_CACHE_PATH = os.getenv('EMBEDDING_CACHE_PATH', os.path.join(BASE_DIR, "db", "embedding_cache.sqlite3"))
+EMBEDDING_CACHE_MAX_ENTRIES = 200000  # About 1.2 GB of 1536-dimension vectors
+
+# Crew Memory Settings (bounded short-term and entity memory, see utils/memory_store.py)
+MEMORY_STORE_PATH = os.getenv('MEMORY_STORE_PATH', os.path.join(BASE_DIR, "db", "crew_memory.sqlite3"))
+MEMORY_TTL = 7 * 24 * 3600  # Seconds a memory item is kept after it was last saved
+MEMORY_MAX_ENTRIES = 500  # Items kept per namespace (customer), least recently used evicted first
+MEMORY_MAX_TOTAL_ENTRIES = 20000  # Items kept across all namespaces
+MEMORY_COMPACT_EVERY = 200  # Writes between purges of expired items and vacuuming
+
+# Support Answer Cache Settings (semantic cache of approved answers, see utils/answer_cache.py)
+ANSWER_CACHE_ENABLED = os.getenv('ANSWER_CACHE_ENABLED', 'true').lower() == 'true'
+ANSWER_CACHE_THRESHOLD = float(os.getenv('ANSWER_CACHE_THRESHOLD', 0.95))  # Cosine similarity of inquiries treated as the same
+ANSWER_CACHE_MAX_ENTRIES = 500  # Answers kept per customer, least recently served replaced first
+ANSWER_CACHE_TTL = 24 * 3600  # Seconds an answer is served, so documentation changes are picked up
+
+# Directory Index Settings (manifest behind IndexedDirectoryReadTool, see utils/dir_index.py)
+DIRECTORY_INDEX_PATH = os.getenv('DIRECTORY_INDEX_PATH', os.path.join(BASE_DIR, "db", "directory_index.sqlite3"))
+DIRECTORY_INDEX_MAX_AGE = 60  # Seconds a directory listing is served from the manifest before a rescan
+DIRECTORY_INDEX_HASH_MAX_BYTES = 64 * 1024 * 1024  # Larger files are listed but not hashed
+
+# Flight Search Settings
+FLEXIBLE_DATE_WINDOW_DAYS = 3  # Days searched on each side of the travel date when dates are flexible
+FLEXIBLE_DATE_MAX_OPTIONS = 5  # Ranked options listed in the flexible-date summary
+
+# Search Concurrency Settings
+TRAVEL_GUIDE_CONCURRENT = True  # Run the weather, hotel and attraction searches at once
+SEARCH_DEFAULT_TIMEOUT = 15  # Seconds before a single search is reported as unavailable
+SEARCH_TIMEOUTS = {  # Per query kind overrides
+    "weather": 10,
+    "hotels": 15,
+    "attractions": 15,
+}
+
+# Resilience Settings (deadlines, retries and circuit breaking for tool I/O, see utils/resilience.py)
+# Each search's deadline, retries included, is its SEARCH_TIMEOUTS entry
+SEARCH_ATTEMPT_TIMEOUT = 6  # Seconds a single attempt may take before it is retried
+RETRY_MAX_ATTEMPTS = 3  # Attempts per call, including the first one
+RETRY_BASE_DELAY = 0.2  # Seconds of backoff before the first retry (full jitter, doubled each time)
+RETRY_MAX_DELAY = 2.0
+RETRY_BUDGET_RATIO = 0.1  # Retries allowed per request over the window, process-wide
+RETRY_BUDGET_MIN_RETRIES = 10  # Retries always allowed per window
+RETRY_BUDGET_WINDOW = 10  # Seconds
+CIRCUIT_FAILURE_THRESHOLD = 5  # Consecutive transient failures that open a provider's circuit
+CIRCUIT_RESET_TIMEOUT = 30  # Seconds before a trial call is let through an open circuit
+
+# Rate Limit Settings (token buckets shared by all processes, see utils/rate_limit.py)
+RATE_LIMIT_ENABLED = os.getenv('RATE_LIMIT_ENABLED', 'true').lower() == 'true'
+RATE_LIMIT_PATH = os.getenv('RATE_LIMIT_PATH', os.path.join(BASE_DIR, "db", "rate_limits.sqlite3"))
+RATE_LIMITS = {  # Per provider quotas: requests ("rpm") and tokens ("tpm") per minute
+    "serper": {"rpm": int(os.getenv('SERPER_RPM', 300))},
+    "openai": {"rpm": int(os.getenv('OPENAI_RPM', 500)), "tpm": int(os.getenv('OPENAI_TPM', 300000))},
+    "cohere": {"rpm": int(os.getenv('COHERE_RPM', 100))},
+    "mistral": {"rpm": int(os.getenv('MISTRAL_RPM', 300))},
+    "huggingface": {"rpm": int(os.getenv('HUGGINGFACE_RPM', 60))},
+}
+RATE_LIMIT_BURST = 1.0  # Seconds of request quota that may go out at once after an idle period
+RATE_LIMIT_TOKEN_BURST = 60.0  # Seconds of token quota a bucket holds (also the largest single call)
+RATE_LIMIT_MAX_WAIT = 120  # Seconds an LLM call may queue for its quota before failing
+RATE_LIMIT_COMPLETION_TOKENS = 500  # Completion tokens reserved per LLM call without max_tokens
+
 # Validate required settings
 def validate_settings():
     """Validate that all required settings are present"""
     if not OPENAI_API_KEY:
         raise ValueError("OPENAI_API_KEY is not set in environment variables")
     if not SERPER_API_KEY:
-        raise ValueError("SERPER_API_KEY is not set in environment variables")
-
-# Initialize settings validation
-validate_settings() 
\ No newline at end of file
+        raise ValueError("SERPER_API_KEY is not set in environment variables") 
\ No newline at end of file
@@ -0,0 +1,113 @@
+"""
+Crew Pool Module
+================
+
+A pool of built crews of one shape, reused across kickoffs.
+
+A Crew object carries per-run state, so a template never runs two kickoffs
+on the same crew at the same time. A kickoff checks out an idle crew
+(building a new one only when none is idle), runs it, and hands it back for
+the next kickoff.
+
+Before a crew is handed out, the state a kickoff leaves behind is reset:
+
+- the crew's tool cache (crewai's CacheHandler, an unbounded dict with no
+  expiry) is replaced by an empty one on the crew and on each of its agents,
+  so tool results are only reused within one run and the persistent caches'
+  TTLs keep applying across runs,
+- every task's output is cleared, so no task can read the previous run's
+  output of a task it depends on,
+- every task's tools are restored to those it was built with (crewai appends
+  the delegation tools to a task's list on each kickoff),
+- every agent's token counters are zeroed, so ``crew.usage_metrics`` covers
+  one run only.
+"""
+import threading
+from contextlib import contextmanager
+
+
+_TOKEN_COUNTERS = ("total_tokens", "prompt_tokens", "completion_tokens", "successful_requests")
+
+
+def task_tools(crew):
+    """
+    Return a copy of each task's tool list, to restore with reset_crew_state
+    """
+    return [list(task.tools or []) for task in crew.tasks]
+
+
+def reset_crew_state(crew, tools=None):
+    """
+    Clear what a previous kickoff left on a crew: its tool cache, task outputs,
+    delegation tools and token counters
+
+    Args:
+        crew: The crew to reset
+        tools (list): The tasks' tool lists as built (see task_tools)
+    """
+    handler = getattr(crew, "_cache_handler", None)
+    if getattr(crew, "cache", False) and handler is not None:
+        crew._cache_handler = type(handler)()
+        for agent in crew.agents:
+            agent.set_cache_handler(crew._cache_handler)
+    for position, task in enumerate(crew.tasks):
+        task.output = None
+        if tools is not None:
+            task.tools = list(tools[position])
+    for agent in crew.agents:
+        # Zeroed in place: the TokenCalcHandler on the agent's LLM holds this object
+        token_process = getattr(agent, "_token_process", None)
+        if token_process is not None:
+            for counter in _TOKEN_COUNTERS:
+                setattr(token_process, counter, 0)
+
+
+class CrewTemplate:
+    """
+    A reusable crew shape with a pool of built crews.
+
+    Args:
+        name (str): The template name
+        builder (callable): Zero-argument function returning a new Crew
+        max_idle (int): Maximum number of idle crews kept for reuse
+    """
+
+    def __init__(self, name, builder, max_idle=4):
+        self.name = name
+        self.builder = builder
+        self.max_idle = max_idle
+        self.built = 0
+        self._idle = []  # (crew, its tasks' tools as built)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def checkout(self):
+        """
+        Borrow a crew for exclusive use during one kickoff, with no state
+        left over from earlier kickoffs
+        """
+        with self._lock:
+            crew, tools = self._idle.pop() if self._idle else (None, None)
+        if crew is None:
+            crew = self.builder()
+            tools = task_tools(crew)
+            with self._lock:
+                self.built += 1
+        else:
+            reset_crew_state(crew, tools)
+        try:
+            yield crew
+        finally:
+            with self._lock:
+                if len(self._idle) < self.max_idle:
+                    self._idle.append((crew, tools))
+
+    def kickoff(self, inputs=None):
+        """
+        Run the crew shape with the given inputs
+
+        Args:
+            inputs (dict): Values interpolated into the agents and tasks
+        """
+        with self.checkout() as crew:
+            return crew.kickoff(inputs=inputs or {})
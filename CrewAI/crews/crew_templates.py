@@ -0,0 +1,168 @@
+"""
+Crew Templates Module
+=====================
+
+Builds each crew shape (agents, tasks and their tools) once per process and
+reuses it across kickoffs with different inputs.
+
+A Crew object carries per-run state (interpolated task descriptions, task
+outputs, tool cache, memory), so a template never runs two kickoffs on the
+same crew at the same time. Instead it keeps a small pool of built crews
+(crews/crew_pool.py), reset before each reuse. Tools are shared by every
+crew through tools.content_tools.get_shared_tool.
+"""
+import threading
+
+from crewai import Crew
+from crews.crew_pool import CrewTemplate
+from crews.task_graph import crew_agents, schedule_tasks
+from agents.content_agents import create_content_agents, create_support_agents, create_travel_agents
+from tasks.content_tasks import create_content_tasks, customer_support_task, create_travel_tasks, test_travel_agent_task
+from config.llm_config import get_routed_llm, get_streaming_llm
+from utils.events import on_agent_step
+from utils.memory_store import use_bounded_memory
+from utils.metrics import install_task_metrics
+from config.settings import (
+    VERBOSE_OUTPUT, CREW_POOL_MAX_IDLE, LLM_CACHE_ENABLED, LLM_CACHE_REPLAY, METRICS_ENABLED,
+    LLM_ROUTER_ENABLED, validate_settings
+)
+
+
+def default_llm(llm=None, streaming=False):
+    """
+    Return the LLM a builder should give its agents: the given one, else the
+    token-streaming OpenAI model when streaming, else the latency router when
+    LLM_ROUTER_ENABLED is set, else None (crewai's default OpenAI model)
+    """
+    if llm is not None:
+        return llm
+    if streaming:
+        return get_streaming_llm()
+    if LLM_ROUTER_ENABLED:
+        return get_routed_llm()
+    return None
+
+
+def build_content_crew(llm=None, streaming=False):
+    """
+    Build the planner/writer/editor crew
+
+    Args:
+        llm: Optional LLM for the agents (see default_llm)
+        streaming (bool): Use the token-streaming OpenAI model when no llm is given
+    """
+    llm = default_llm(llm, streaming)
+    planner, writer, editor = create_content_agents(llm=llm)
+    tasks = schedule_tasks(create_content_tasks(planner, writer, editor))
+    return Crew(
+        agents=crew_agents(tasks),
+        tasks=tasks,
+        verbose=VERBOSE_OUTPUT,
+        step_callback=on_agent_step
+    )
+
+def build_support_crew(customer="Gister App", llm=None, streaming=False, memory=True):
+    """
+    Build the support/QA crew for a customer
+
+    Args:
+        customer (str): The customer company name baked into the agents' backstories
+        llm: Optional LLM for the agents (see default_llm)
+        streaming (bool): Use the token-streaming OpenAI model when no llm is given
+        memory (bool): Enable crew memory, kept in the bounded memory store
+            under the customer's namespace
+    """
+    llm = default_llm(llm, streaming)
+    support_agent, qa_agent = create_support_agents(customer=customer, llm=llm)
+    tasks = schedule_tasks(customer_support_task(
+        support_agent=support_agent,
+        qa_agent=qa_agent
+    ))  # Returns list of [support_inquiry, quality_review]
+    crew = Crew(
+        agents=crew_agents(tasks),
+        tasks=tasks,
+        verbose=VERBOSE_OUTPUT,
+        step_callback=on_agent_step,
+        memory=False  # Support crew memory is attached below, without crewai's Chroma storage
+    )
+    if memory:
+        use_bounded_memory(crew, namespace=customer)
+    return crew
+
+def build_travel_crew(llm=None, streaming=False):
+    """
+    Build the travel planning crew
+
+    Args:
+        llm: Optional LLM for the agents (see default_llm)
+        streaming (bool): Use the token-streaming OpenAI model when no llm is given
+    """
+    llm = default_llm(llm, streaming)
+    travel_planner_consultant, travel_info_coordinator = create_travel_agents(llm=llm)
+    # search_tickets and travel_guide run concurrently, joined by summarize_travel_info
+    tasks = schedule_tasks(create_travel_tasks(travel_planner_consultant, travel_info_coordinator, inputs={}))
+    return Crew(
+        agents=crew_agents(tasks),
+        tasks=tasks,
+        verbose=VERBOSE_OUTPUT,
+        step_callback=on_agent_step
+    )
+
+def build_test_travel_crew(llm=None, streaming=False):
+    """
+    Build the travel crew used for testing with default travel details
+
+    Args:
+        llm: Optional LLM for the agents (see default_llm)
+        streaming (bool): Use the token-streaming OpenAI model when no llm is given
+    """
+    llm = default_llm(llm, streaming)
+    travel_planner_consultant, travel_info_coordinator = create_travel_agents(llm=llm)
+    tasks = schedule_tasks(test_travel_agent_task(travel_planner_consultant, travel_info_coordinator))
+    return Crew(
+        agents=crew_agents(tasks),
+        tasks=tasks,
+        verbose=VERBOSE_OUTPUT,
+        step_callback=on_agent_step
+    )
+
+# Crew shapes available through get_crew_template
+CREW_BUILDERS = {
+    "content": build_content_crew,
+    "support": build_support_crew,
+    "travel": build_travel_crew,
+    "test_travel": build_test_travel_crew,
+}
+
+
+_templates = {}
+_templates_lock = threading.Lock()
+
+def get_crew_template(name, **params):
+    """
+    Return the process-wide template for a crew shape, creating it on first use
+
+    Settings are validated once, when the template is created, and the
+    completion cache is installed if LLM_CACHE_ENABLED (or replay) is set.
+    Task metrics are recorded when METRICS_ENABLED is set.
+
+    Args:
+        name (str): One of the CREW_BUILDERS keys
+        **params: Builder arguments (e.g. customer for the support crew);
+            each distinct set of arguments gets its own template
+    """
+    if name not in CREW_BUILDERS:
+        raise ValueError(f"Unknown crew template: {name}")
+
+    key = (name, tuple(sorted(params.items())))
+    with _templates_lock:
+        if key not in _templates:
+            validate_settings()
+            if LLM_CACHE_ENABLED or LLM_CACHE_REPLAY:
+                from config.llm_cache import enable_llm_cache
+                enable_llm_cache()
+            if METRICS_ENABLED:
+                install_task_metrics()
+            builder = CREW_BUILDERS[name]
+            _templates[key] = CrewTemplate(name, lambda: builder(**params), max_idle=CREW_POOL_MAX_IDLE)
+        return _templates[key]
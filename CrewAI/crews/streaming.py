@@ -0,0 +1,162 @@
+"""
+Crew Streaming Module
+=====================
+
+Runs a crew template in a background thread and hands its events (see
+utils.events) to the caller as they happen, either through a generator or an
+async iterator. Events are not retained once consumed, so intermediate task
+outputs can be released as soon as the caller has processed them.
+
+Events wait in a bounded queue (STREAM_QUEUE_SIZE). When the caller falls
+behind, token chunks are dropped and the crew waits for room for any other
+event. When the caller stops reading (``break``, ``close()``/``aclose()`` or
+task cancellation), no more events are queued and the crew is stopped when
+its next task starts (tasks are ObservedTasks, which emit task_started). The
+LLM or tool call already in flight is not cancelled: it runs to the end, and
+its quota is spent.
+"""
+import asyncio
+import concurrent.futures
+import queue
+import threading
+
+from utils.events import bind_sink, emit
+
+_DONE = object()
+
+
+class StreamStopped(Exception):
+    """Raised when a task starts in a crew whose stream is no longer read"""
+
+
+def _run_template(template, inputs, sink, done):
+    """Kick off the template with every event routed to ``sink``"""
+    with bind_sink(sink):
+        try:
+            emit("crew_started", crew=template.name)
+            result = template.kickoff(inputs=inputs)
+            emit("crew_finished", crew=template.name, result=result)
+        except Exception as e:
+            emit("crew_failed", crew=template.name, error=repr(e))
+        finally:
+            done()
+
+
+def _stoppable_sink(put, stopped):
+    """Sink handing events to ``put`` until ``stopped`` is set, then stopping the crew at its next task"""
+    def sink(event):
+        if stopped.is_set():
+            if event["type"] == "task_started":
+                raise StreamStopped(f"Stream closed before task '{event.get('task')}'")
+            return
+        put(event, event["type"] == "token")
+    return sink
+
+
+def _keep(event, final_task, tokens):
+    # Token chunks are only forwarded for the final task unless all tokens were requested
+    if event["type"] != "token" or tokens == "all":
+        return True
+    return tokens == "final" and event.get("task") == final_task
+
+
+def _queue_size():
+    from config.settings import STREAM_QUEUE_SIZE
+    return STREAM_QUEUE_SIZE
+
+
+def stream_crew(template, inputs, final_task=None, tokens="final"):
+    """
+    Run a crew template and yield its events as they happen
+
+    Args:
+        template: A CrewTemplate (see crews.crew_pool)
+        inputs (dict): The kickoff inputs
+        final_task (str): Name of the task whose tokens are forwarded
+        tokens (str): "final" (tokens of final_task only), "all" or "none"
+
+    Yields:
+        dict: Events, ending with crew_finished (carrying the result) or crew_failed
+    """
+    events = queue.Queue(maxsize=_queue_size())
+    stopped = threading.Event()
+
+    def put(event, drop_when_full=False):
+        while not stopped.is_set():
+            try:
+                events.put(event, block=not drop_when_full, timeout=0.1)
+                return
+            except queue.Full:
+                if drop_when_full:
+                    return
+
+    worker = threading.Thread(
+        target=_run_template,
+        args=(template, inputs, _stoppable_sink(put, stopped), lambda: put(_DONE)),
+        name=f"stream-{template.name}",
+        daemon=True
+    )
+    worker.start()
+
+    try:
+        while True:
+            event = events.get()
+            if event is _DONE:
+                break
+            if _keep(event, final_task, tokens):
+                yield event
+    finally:
+        stopped.set()
+
+
+async def astream_crew(template, inputs, final_task=None, tokens="final"):
+    """
+    Async iterator version of stream_crew for asyncio servers.
+    The crew runs in a worker thread; the event loop is never blocked.
+    """
+    loop = asyncio.get_running_loop()
+    events = asyncio.Queue(maxsize=_queue_size())
+    stopped = threading.Event()
+
+    def put_if_room(event):
+        if not events.full():
+            events.put_nowait(event)
+
+    def put(event, drop_when_full=False):
+        if drop_when_full:
+            try:
+                loop.call_soon_threadsafe(put_if_room, event)
+            except RuntimeError:
+                pass  # The consumer's event loop is closed
+            return
+        waiter = events.put(event)
+        try:
+            future = asyncio.run_coroutine_threadsafe(waiter, loop)
+        except RuntimeError:
+            waiter.close()  # The consumer's event loop is closed
+            return
+        while not stopped.is_set():
+            try:
+                future.result(timeout=0.1)
+                return
+            except concurrent.futures.TimeoutError:
+                continue
+        future.cancel()
+
+    worker = threading.Thread(
+        target=_run_template,
+        args=(template, inputs, _stoppable_sink(put, stopped), lambda: put(_DONE)),
+        name=f"astream-{template.name}",
+        daemon=True
+    )
+    worker.start()
+
+    try:
+        while True:
+            event = await events.get()
+            if event is _DONE:
+                break
+            if _keep(event, final_task, tokens):
+                yield event
+    finally:
+        stopped.set()
@@ -0,0 +1,133 @@
+"""
+Task Graph Module
+=================
+
+Runs independent tasks of a sequential crew concurrently.
+
+Each task may declare the tasks it needs (``ObservedTask.depends_on``); a
+task that declares nothing depends on the task before it, as in a plain
+sequential crew. ``schedule_tasks`` maps that graph onto crewai's own
+primitives:
+
+- tasks are put in dependency order,
+- a task's ``context`` is set to the tasks it depends on, so it waits for
+  them and receives exactly their outputs,
+- a task that can overlap with another one (neither depends on the other,
+  directly or not) and that a later task waits for gets ``async_execution``,
+  so crewai starts it in a thread and moves on to the next task.
+
+For the travel crew this runs search_tickets and travel_guide side by side
+and joins them in summarize_travel_info. Chains (content, support) are left
+exactly as sequential as before.
+
+Two tasks that may run at the same time must not share an Agent object
+(crewai keeps per-execution state on the agent), so the later one gets its
+own copy of the agent; ``crew_agents`` lists every agent the crew needs.
+The copy has its own token counters and a copy of the LLM that feeds them,
+so ``crew.usage_metrics`` counts each task once; tools, tool cache and RPM
+limits stay shared with the original agent.
+"""
+from typing import List
+
+
+def _dependencies(tasks) -> dict:
+    names = [task.name for task in tasks]
+    if None in names or len(set(names)) != len(names):
+        raise ValueError("Every scheduled task needs a unique name")
+
+    dependencies = {}
+    for i, task in enumerate(tasks):
+        declared = getattr(task, "depends_on", None)
+        if declared is None:
+            declared = [names[i - 1]] if i else []
+        unknown = set(declared) - set(names)
+        if unknown:
+            raise ValueError(f"Task {task.name!r} depends on unknown tasks: {sorted(unknown)}")
+        dependencies[task.name] = list(declared)
+    return dependencies
+
+
+def _topological_order(tasks, dependencies) -> list:
+    # Kahn's algorithm, keeping the declared order among tasks that are ready together
+    remaining = list(tasks)
+    done, order = set(), []
+    while remaining:
+        ready = next((t for t in remaining if set(dependencies[t.name]) <= done), None)
+        if ready is None:
+            raise ValueError(f"Task dependencies form a cycle among {[t.name for t in remaining]}")
+        remaining.remove(ready)
+        done.add(ready.name)
+        order.append(ready)
+    return order
+
+
+def _copy_agent(agent):
+    """Copy an agent with its own token counting (see the module docstring)"""
+    from crewai.utilities.token_counter_callback import TokenCalcHandler, TokenProcess
+
+    token_process = TokenProcess()
+    update = {}
+    llm = getattr(agent, "llm", None)
+    callbacks = getattr(llm, "callbacks", None)
+    # crewai counts an agent's tokens with a TokenCalcHandler on its LLM: swap in one for the copy
+    if isinstance(callbacks, list) and hasattr(llm, "model_name"):
+        callbacks = [callback for callback in callbacks if not isinstance(callback, TokenCalcHandler)]
+        update["llm"] = llm.copy(update={
+            "callbacks": callbacks + [TokenCalcHandler(llm.model_name, token_process)]
+        })
+    copy = agent.model_copy(update=update)
+    copy._token_process = token_process
+    return copy
+
+
+def schedule_tasks(tasks: list) -> list:
+    """
+    Apply the tasks' declared dependencies so independent tasks run concurrently
+
+    Args:
+        tasks (list): Named tasks (ObservedTask), optionally declaring depends_on
+
+    Returns:
+        list: The same tasks in execution order, with context, async_execution
+            and (where needed) a private agent copy set
+
+    Raises:
+        ValueError: If names are missing or duplicated, or the dependencies are
+            unknown or cyclic
+    """
+    dependencies = _dependencies(tasks)
+    order = _topological_order(tasks, dependencies)
+    by_name = {task.name: task for task in order}
+
+    ancestors = {}
+    for task in order:
+        ancestors[task.name] = set()
+        for dependency in dependencies[task.name]:
+            ancestors[task.name] |= {dependency} | ancestors[dependency]
+
+    def overlaps(a, b):
+        return a.name not in ancestors[b.name] and b.name not in ancestors[a.name]
+
+    has_dependents = {d for deps in dependencies.values() for d in deps}
+    for i, task in enumerate(order):
+        task.context = [by_name[d] for d in dependencies[task.name]] or None
+        # The last task stays synchronous: its output is the crew's result
+        task.async_execution = (
+            i < len(order) - 1
+            and task.name in has_dependents
+            and any(overlaps(task, other) for other in order if other is not task)
+        )
+
+    for j, task in enumerate(order):
+        if any(overlaps(other, task) and other.agent is task.agent for other in order[:j]):
+            task.agent = _copy_agent(task.agent)
+    return order
+
+
+def crew_agents(tasks: list) -> List:
+    """Return the distinct agents of the tasks, in task order"""
+    agents = []
+    for task in tasks:
+        if task.agent is not None and all(task.agent is not agent for agent in agents):
+            agents.append(task.agent)
+    return agents
@@ -1,10 +1,9 @@
 import warnings
 import os
-from crewai import Crew
-from agents.content_agents import create_content_agents, create_support_agents, create_travel_agents
-from tasks.content_tasks import create_content_tasks, customer_support_task, create_travel_tasks, test_travel_agent_task
-from config.topics import get_topic, get_all_topics
-from config.settings import VERBOSE_OUTPUT, validate_settings
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, NamedTuple, Optional
+from config.topics import CONTENT_TOPICS, get_topic, get_all_topics
+from config.settings import BATCH_MAX_CONCURRENCY, validate_settings
 
 # Suppress warnings
 warnings.filterwarnings('ignore')
@@ -14,6 +13,14 @@ def check_environment():
     if 'OPENAI_API_KEY' not in os.environ:
         raise ValueError("OPENAI_API_KEY not found in environment variables")
 
+def get_crew_template(name, **params):
+    """
+    Return a crew template, loading crewai and the agent/task/tool modules on first use
+    so that importing this module stays cheap
+    """
+    from crews import crew_templates
+    return crew_templates.get_crew_template(name, **params)
+
 def create_content_crew(topic):
     """
     Create and run a crew for content creation
@@ -21,110 +28,169 @@ def create_content_crew(topic):
     Args:
         topic (str): The topic to create content about
     """
-    # Validate settings before proceeding
-    validate_settings()
-    
-    # 1. Create agents
-    planner, writer, editor = create_content_agents()
+    # Agents, tasks and tools are built once per process by the template
+    return get_crew_template("content").kickoff(inputs={"topic": topic})
+
+class TopicResult(NamedTuple):
+    """Outcome of one topic in a batch run - exactly one of result/error is set"""
+    topic: str
+    result: Any = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+def kickoff_many(topics=None, category=None, max_concurrency=BATCH_MAX_CONCURRENCY):
+    """
+    Run content crews for several topics in a bounded worker pool
     
-    # 2. Create tasks with the agents
-    tasks = create_content_tasks(planner, writer, editor)
+    Results are yielded as each topic finishes (not in input order). A failing
+    topic is yielded with its error instead of aborting the rest of the batch.
+    The arguments and settings are checked when this is called, before any crew runs.
     
-    # 3. Create and run crew
-    content_crew = Crew(
-        agents=[planner, writer, editor],
-        tasks=tasks,
-        verbose=VERBOSE_OUTPUT
-    )
+    Args:
+        topics (list): The topics to create content about (defaults to the category's topics)
+        category (str): A CONTENT_TOPICS category to use when no topics are given,
+            or None for every topic
+        max_concurrency (int): Maximum number of crews running at the same time
+        
+    Returns:
+        Iterator of TopicResult: Each topic with either its crew result or the exception raised
+
+    Raises:
+        ValueError: If the category is unknown or a required setting is missing
+    """
+    if topics is None:
+        if category is not None and category not in CONTENT_TOPICS:
+            raise ValueError(f"Unknown topic category: {category} (choose from {', '.join(CONTENT_TOPICS)})")
+        topics = get_all_topics(category)
     
-    # 4. Execute with topic input
-    return content_crew.kickoff(inputs={"topic": topic})
+    # Fail fast on missing keys instead of once per topic
+    validate_settings()
+    return _run_batch(topics, max_concurrency)
+
+def _run_batch(topics, max_concurrency):
+    # The generator behind kickoff_many, kept separate so its checks run when it is called
+    executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="content-crew")
+    try:
+        futures = {executor.submit(create_content_crew, topic): topic for topic in topics}
+        for future in as_completed(futures):
+            topic = futures[future]
+            try:
+                yield TopicResult(topic=topic, result=future.result())
+            except Exception as e:
+                yield TopicResult(topic=topic, error=e)
+    finally:
+        # If the caller stops consuming early, drop topics that have not started yet
+        executor.shutdown(wait=False, cancel_futures=True)
 
 def create_support_crew(inquiry, person, customer="Gister App"):
     """
     Create and run a crew for customer support
     
+    Near-duplicates of an inquiry the customer's crew already answered are
+    served from the answer cache (utils.answer_cache) without running the crew.
+    
     Args:
         inquiry (str): The customer inquiry
         person (str): The person making the inquiry
         customer (str): The customer company name
     """
-    # Validate settings before proceeding
-    validate_settings()
-    
-    print("Starting support crew creation...")  # Debug print
-    
-    # 1. Create agents
-    support_agent, qa_agent = create_support_agents(customer=customer)
-    print("Agents created successfully")  # Debug print
-    
-    # 2. Create tasks with agents and tools
-    tasks = customer_support_task(
-        support_agent=support_agent,
-        qa_agent=qa_agent
-    )  # Returns list of [support_inquiry, quality_review]
-    print("Tasks created successfully")  # Debug print
-    
-    # 3. Create and run crew
-    support_crew = Crew(
-        agents=[support_agent, qa_agent],
-        tasks=tasks,  # Pass the list of tasks directly
-        verbose=VERBOSE_OUTPUT,
-        memory=True  # Support crew needs memory for context
-    )
+    from utils.answer_cache import get_answer_cache
+
+    answer_cache = get_answer_cache()
+    if answer_cache is not None:
+        answer = answer_cache.lookup(customer, inquiry, person)
+        if answer is not None:
+            return answer
+
+    # The support agents are specific to the customer, so each customer gets its own template
+    support_crew = get_crew_template("support", customer=customer)
     
-    # 4. Execute with inquiry inputs
-    return support_crew.kickoff(inputs={
+    # Execute with inquiry inputs
+    result = support_crew.kickoff(inputs={
         "inquiry": inquiry,
         "person": person,
         "customer": customer
     })
+    if answer_cache is not None:
+        answer_cache.store(customer, inquiry, person, result)
+    return result
 
-def create_travel_crew(inputs):
-    """
-    Create and run a crew for travel planning
+def stream_content_crew(topic, tokens="final"):
     """
-    # Validate settings before proceeding
-    validate_settings()
-    
-    # 1. Create agents
-    travel_planner_consultant, travel_info_coordinator = create_travel_agents()
-    
-    # 2. Create tasks with the agents and inputs
-    tasks = create_travel_tasks(travel_planner_consultant, travel_info_coordinator, inputs)
+    Run a content crew and yield its events as they happen (task started,
+    tool call, token chunks from the editor, task finished, crew finished)
     
-    # 3. Create and run crew
-    travel_crew = Crew(
-        agents=[travel_planner_consultant, travel_info_coordinator],
-        tasks=tasks,
-        verbose=VERBOSE_OUTPUT
+    Args:
+        topic (str): The topic to create content about
+        tokens (str): "final" (editor tokens only), "all" or "none"
+    """
+    from crews.streaming import stream_crew
+    return stream_crew(
+        get_crew_template("content", streaming=True),
+        inputs={"topic": topic},
+        final_task="edit",
+        tokens=tokens
     )
+
+def stream_support_crew(inquiry, person, customer="Gister App", tokens="final"):
+    """
+    Run a support crew and yield its events as they happen, with token
+    chunks from the QA agent's final answer
     
-    # 4. Execute with travel inputs
-    return travel_crew.kickoff(inputs=inputs)  # Pass the inputs to the kickoff
+    Args:
+        inquiry (str): The customer inquiry
+        person (str): The person making the inquiry
+        customer (str): The customer company name
+        tokens (str): "final" (QA agent tokens only), "all" or "none"
+    """
+    from crews.streaming import stream_crew
+    return stream_crew(
+        get_crew_template("support", customer=customer, streaming=True),
+        inputs={"inquiry": inquiry, "person": person, "customer": customer},
+        final_task="quality_review",
+        tokens=tokens
+    )
+
+def astream_content_crew(topic, tokens="final"):
+    """
+    Async iterator version of stream_content_crew
+    """
+    from crews.streaming import astream_crew
+    return astream_crew(
+        get_crew_template("content", streaming=True),
+        inputs={"topic": topic},
+        final_task="edit",
+        tokens=tokens
+    )
+
+def astream_support_crew(inquiry, person, customer="Gister App", tokens="final"):
+    """
+    Async iterator version of stream_support_crew
+    """
+    from crews.streaming import astream_crew
+    return astream_crew(
+        get_crew_template("support", customer=customer, streaming=True),
+        inputs={"inquiry": inquiry, "person": person, "customer": customer},
+        final_task="quality_review",
+        tokens=tokens
+    )
+
+def create_travel_crew(inputs):
+    """
+    Create and run a crew for travel planning
+    """
+    # Execute with travel inputs
+    return get_crew_template("travel").kickoff(inputs=inputs)  # Pass the inputs to the kickoff
 
 def create_test_travel_crew():
     """
     Create and run a test crew for travel planning
     """
-    # Validate settings before proceeding
-    validate_settings()
-    
-    # Create agents for testing
-    travel_planner_consultant, travel_info_coordinator = create_travel_agents()
-    
-    # Create the test travel task
-    tasks = test_travel_agent_task(travel_planner_consultant, travel_info_coordinator)
-    
-    # Create and run crew
-    test_travel_crew = Crew(
-        agents=[travel_planner_consultant, travel_info_coordinator],
-        tasks=tasks,
-        verbose=VERBOSE_OUTPUT
-    )
-    
     # Execute the test crew
-    return test_travel_crew.kickoff(inputs={})  # No specific inputs needed for the test
+    return get_crew_template("test_travel").kickoff(inputs={})  # No specific inputs needed for the test
 
 if __name__ == "__main__":
     # Example usage for content creation
@@ -39,18 +39,18 @@ Notes:
 - Tools assigned to Task: Exclusively used for that specific task
 """
 
-from crewai import Task
-from tools.content_tools import create_test_research_tools, create_research_tools, create_directory_tools
+from tasks.observed_task import ObservedTask
+from tools.content_tools import get_shared_tool
 from tools.directories import travel_assistant_guide  
-from tools.ticket_search_tool import TicketSearchTool
-from tools.travel_guide_tool import TravelGuideTool
 
 
 def create_content_tasks(planner, writer, editor):
     """
     Create and return the content creation tasks
     """
-    plan = Task(
+    plan = ObservedTask(
+        name="plan",
+        depends_on=[],
         description=(
             "1. Prioritize the latest trends, key players, "
                 "and noteworthy news on {topic}.\n"
@@ -66,7 +66,9 @@ def create_content_tasks(planner, writer, editor):
         agent=planner,
     )
 
-    write = Task(
+    write = ObservedTask(
+        name="write",
+        depends_on=["plan"],
         description=(
             "1. Use the content plan to craft a compelling "
                 "blog post on {topic}.\n"
@@ -85,7 +87,9 @@ def create_content_tasks(planner, writer, editor):
         agent=writer,
     )
 
-    edit = Task(
+    edit = ObservedTask(
+        name="edit",
+        depends_on=["write"],
         description=("Proofread the given blog post for "
                      "grammatical errors and "
                      "alignment with the brand's voice."),
@@ -109,15 +113,22 @@ def customer_support_task(support_agent, qa_agent):
     Returns:
         list: List of tasks for the support workflow
     """
-    docs_scrape_tool = create_test_research_tools()[0]
+    from tools.support_docs_tool import SupportDocsSearchTool  # Heavy import, only needed when the support crew is built
 
-    support_inquiry = Task(
+    # Shared across crews; returns only the docs passages relevant to the inquiry
+    # instead of the whole page (the page itself comes from the local snapshot store)
+    docs_search_tool = get_shared_tool(SupportDocsSearchTool)
+
+    support_inquiry = ObservedTask(
+        name="support_inquiry",
+        depends_on=[],
         description=(
             "{customer} just reached out with a super important ask:\n"
             "{inquiry}\n\n"
             "{person} from {customer} is the one that reached out. "
             "Make sure to use everything you know "
-            "to provide the best support possible."
+            "to provide the best support possible. "
+            "Search the support documentation for the inquiry to find the relevant passages. "
             "You must strive to provide a complete "
             "and accurate response to the customer's inquiry."
         ),
@@ -132,11 +143,13 @@ def customer_support_task(support_agent, qa_agent):
             "leaving no questions unanswered, and maintain a helpful and friendly "
             "tone throughout."
         ),
-        tools=[docs_scrape_tool],
+        tools=[docs_search_tool],
         agent=support_agent
     )
 
-    quality_review = Task(
+    quality_review = ObservedTask(
+        name="quality_review",
+        depends_on=["support_inquiry"],
         description=(
             "Review the response drafted by the Senior Support Representative for {customer}'s inquiry. "
             "Ensure that the answer is comprehensive, accurate, and adheres to the "
@@ -177,9 +190,13 @@ def create_travel_tasks(travel_planner_consultant, travel_info_coordinator, inpu
     Returns:
         list: List of travel-related tasks
     """
+    from tools.ticket_search_tool import TicketSearchTool
+    from tools.travel_guide_tool import TravelGuideTool
     
     # Task 1: Gather Travel Information
-    gather_info = Task(
+    gather_info = ObservedTask(
+        name="gather_info",
+        depends_on=[],
         description=(
             "Gather all necessary travel information from the user:\n"
             "1. Full Name\n"
@@ -202,33 +219,40 @@ def create_travel_tasks(travel_planner_consultant, travel_info_coordinator, inpu
     )
 
     # Task 2: Search for Tickets
-    search_tickets = Task(
+    search_tickets = ObservedTask(
+        name="search_tickets",
+        depends_on=["gather_info"],
         description=(
             "Use the TicketSearchTool to find available tickets based on the gathered information.\n"
+            "For a round trip, pass the return date in the same call: both legs are searched together.\n"
             "Ensure to check for the best options and provide a summary of the findings."
         ),
         expected_output="A list of available tickets based on the user's travel preferences.",
-        tools=[TicketSearchTool()],
+        tools=[get_shared_tool(TicketSearchTool)],
         agent=travel_planner_consultant,
         allow_delegation=False,
         verbose=True
     )
 
     # Task 3: Use Travel Guide Tool
-    travel_guide = Task(
+    travel_guide = ObservedTask(
+        name="travel_guide",
+        depends_on=["gather_info"],
         description=(
             "Use the TravelGuideTool to gather information about the weather, accommodations, and attractions "
             "at the departure and destination locations."
         ),
         expected_output="Weather conditions, hotel options, and tourist attractions at the specified locations.",
-        tools=[TravelGuideTool()],
+        tools=[get_shared_tool(TravelGuideTool)],
         agent=travel_planner_consultant,
         allow_delegation=False,
         verbose=True
     )
 
     # Task 4: Summarize Travel Information
-    summarize_travel_info = Task(
+    summarize_travel_info = ObservedTask(
+        name="summarize_travel_info",
+        depends_on=["search_tickets", "travel_guide"],
         description=(
             "Collate the information gathered from the ticket search and travel guide tasks.\n"
             "Present a comprehensive summary to the user, including:\n"
@@ -256,9 +280,11 @@ def test_travel_agent_task(travel_planner_consultant, travel_info_coordinator):
     Returns:
         list: List of tasks for the travel agent workflow
     """
+    from tools.ticket_search_tool import TicketSearchTool
+    from tools.travel_guide_tool import TravelGuideTool
     
-    # Create an instance of TicketSearchTool
-    ticket_search_tool = TicketSearchTool()
+    # Reuse the shared TicketSearchTool instance
+    ticket_search_tool = get_shared_tool(TicketSearchTool)
 
     # Default travel details
     travel_details = ticket_search_tool._get_travel_details(
@@ -278,7 +304,9 @@ def test_travel_agent_task(travel_planner_consultant, travel_info_coordinator):
     )
 
     # Task 1: Gather Travel Information (using the method to get details)
-    gather_info = Task(
+    gather_info = ObservedTask(
+        name="gather_info",
+        depends_on=[],
         description=(
             "Process the following travel details and provide a summary:\n"
             f"Full Name: {travel_details['full_name']}\n"
@@ -293,14 +321,16 @@ def test_travel_agent_task(travel_planner_consultant, travel_info_coordinator):
             f"Preferred Flight: {travel_details['preferred_flight']}\n"
         ),
         expected_output="A summary of travel options based on the provided details.",
-        tools=[TicketSearchTool()],
+        tools=[get_shared_tool(TicketSearchTool)],
         agent=travel_planner_consultant,
         allow_delegation=False,
         verbose=True
     )
 
     # Task 2: Summarize Travel Information
-    summarize_travel_info = Task(
+    summarize_travel_info = ObservedTask(
+        name="summarize_travel_info",
+        depends_on=["gather_info"],
         description=(
             "Collate the information gathered from the ticket search and travel guide tasks.\n"
             "Present a comprehensive summary to the user, including:\n"
@@ -310,7 +340,7 @@ def test_travel_agent_task(travel_planner_consultant, travel_info_coordinator):
             "Ensure the summary is clear and allows the user to make an informed decision."
         ),
         expected_output="A comprehensive summary of travel options, weather, accommodations, and attractions.",
-        tools=[TravelGuideTool()],
+        tools=[get_shared_tool(TravelGuideTool)],
         agent=travel_info_coordinator,
         allow_delegation=False,
         verbose=True
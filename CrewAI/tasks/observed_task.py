@@ -0,0 +1,75 @@
+"""
+Observed Task Module
+====================
+
+A crewai Task that reports its lifecycle (task_started, task_finished,
+task_failed) through utils.events, so crew runs can be streamed and measured.
+
+The task also carries the caller's context (event sink, current task) into
+the worker thread crewai starts for ``async_execution`` tasks, so events from
+asynchronous tasks reach the same run as everything else.
+
+crewai runs an async task in a bare thread, where an exception is lost: the
+task that joins it would read whatever output the task still holds. So each
+run starts by clearing the output, and a failed async task stores a failure
+notice as its output, for the tasks that depend on it to see.
+"""
+import contextvars
+import time
+from typing import Any, List, Optional
+
+from crewai import Task
+from crewai.tasks.task_output import TaskOutput
+from pydantic import PrivateAttr
+
+from utils.events import emit, task_scope
+
+
+class ObservedTask(Task):
+    """
+    crewai Task emitting lifecycle events
+
+    Args:
+        name (str): Short identifier used in events and metrics (e.g. "plan")
+        depends_on (list): Names of the tasks whose output this task needs; None
+            means the previous task (see crews/task_graph.py)
+        (all other arguments are the regular crewai Task arguments)
+    """
+    name: Optional[str] = None
+    depends_on: Optional[List[str]] = None
+
+    _run_context: Any = PrivateAttr(default=None)
+
+    def execute(self, agent=None, context=None, tools=None):
+        # Never leave an earlier run's output for the tasks that depend on this one
+        self.output = None
+        # Captured here, on the caller's thread, for _execute to run in
+        self._run_context = contextvars.copy_context()
+        return super().execute(agent=agent, context=context, tools=tools)
+
+    def _execute(self, agent, task, context, tools):
+        run_context = self._run_context or contextvars.copy_context()
+        return run_context.run(self._observed_execute, agent, task, context, tools)
+
+    def _observed_execute(self, agent, task, context, tools):
+        task_name = self.name or self.description.split("\n")[0][:60]
+        agent_role = getattr(agent, "role", None)
+
+        with task_scope(task_name, agent_role):
+            start = time.perf_counter()
+            try:
+                # A stopped stream raises here (see crews/streaming.py), before any work is done
+                emit("task_started")
+                result = super()._execute(agent, task, context, tools)
+            except Exception as e:
+                emit("task_failed", duration=time.perf_counter() - start, error=repr(e))
+                if not self.async_execution:
+                    raise
+                # Nobody receives an async task's exception: report it to the dependent tasks
+                self.output = TaskOutput(
+                    description=self.description,
+                    raw_output=f"Task '{task_name}' failed and produced no output: {e!r}"
+                )
+                return self.output.raw_output
+            emit("task_finished", duration=time.perf_counter() - start, output=result)
+        return result
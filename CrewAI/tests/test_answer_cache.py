@@ -0,0 +1,76 @@
+import re
+import unittest
+from unittest import mock
+from utils.answer_cache import AnswerCache, personalize, to_template
+
+VOCABULARY = ["how", "do", "i", "add", "memory", "to", "my", "a", "crew", "delete", "agent", "tools"]
+
+def bag_of_words(texts):
+    """Embedding function counting vocabulary words"""
+    return [[re.findall(r"\w+", text).count(word) for word in VOCABULARY] for text in texts]
+
+class TestAnswerCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = AnswerCache(bag_of_words, threshold=0.85, max_entries=2)
+
+    def test_similar_inquiry_is_answered_for_the_new_person(self):
+        """Test that a near-duplicate inquiry gets the stored answer, addressed to its own person"""
+        self.cache.store("Acme", "How do I add memory to my crew?", "Ann", "Hi Ann, set memory=True. {docs}")
+        answer = self.cache.lookup("Acme", "how do i add memory to a crew", "Bob")
+        self.assertEqual(answer, "Hi Bob, set memory=True. {docs}")
+        self.assertIsNone(self.cache.lookup("Acme", "how do i delete an agent", "Bob"))
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_answers_are_per_customer(self):
+        """Test that one customer's answers are never served to another"""
+        self.cache.store("Acme", "how do i add memory to my crew", "Ann", "Acme answer")
+        self.assertIsNone(self.cache.lookup("Globex", "how do i add memory to my crew", "Ann"))
+
+    def test_least_recently_served_is_replaced(self):
+        """Test that a full customer replaces the answer served least recently"""
+        with mock.patch("utils.answer_cache.time.time") as clock:
+            for now, (inquiry, answer) in enumerate([("add memory to my crew", "memory"),
+                                                      ("delete agent", "delete")]):
+                clock.return_value = now
+                self.cache.store("Acme", inquiry, "", answer)
+            clock.return_value = 2
+            self.assertEqual(self.cache.lookup("Acme", "add memory to my crew", ""), "memory")
+            clock.return_value = 3
+            self.cache.store("Acme", "add tools", "", "tools")
+        self.assertIsNone(self.cache.lookup("Acme", "delete agent", ""))
+        self.assertEqual(self.cache.lookup("Acme", "add memory to my crew", ""), "memory")
+        self.assertEqual(self.cache.stats()["entries"], 2)
+
+    def test_expired_answers_are_dropped(self):
+        """Test that answers older than the TTL are no longer served"""
+        cache = AnswerCache(bag_of_words, threshold=0.85, ttl=60)
+        with mock.patch("utils.answer_cache.time.time", return_value=1000):
+            cache.store("Acme", "add memory to my crew", "", "memory")
+        with mock.patch("utils.answer_cache.time.time", return_value=1061):
+            self.assertIsNone(cache.lookup("Acme", "add memory to my crew", ""))
+        self.assertEqual(cache.stats()["entries"], 0)
+
+    def test_template_only_replaces_whole_names(self):
+        """Test that the person's name is only templated where it is a whole word"""
+        template = to_template("Dear Al, see Alerts.", "Al")
+        self.assertEqual(personalize(template, "Bea"), "Dear Bea, see Alerts.")
+
+    def test_template_replaces_each_part_of_the_name(self):
+        """Test that a first or last name used on its own does not leak to the next person"""
+        template = to_template("Hi Jane, Ms. Doe's plan (Jane Doe) is set. {x}", "Jane Doe")
+        self.assertEqual(personalize(template, "Bob Smith"), "Hi Bob, Ms. Smith's plan (Bob Smith) is set. {x}")
+        self.assertEqual(personalize(to_template("Hi Jane A. Doe", "Jane A. Doe"), "Cher"), "Hi Cher")
+
+    def test_embedding_failure_is_a_miss(self):
+        """Test that a failing embedder neither fails the request nor stores the answer"""
+        def broken(texts):
+            raise ConnectionError("embedding API down")
+
+        cache = AnswerCache(broken, threshold=0.85)
+        with self.assertLogs("utils.answer_cache", level="WARNING"):
+            self.assertIsNone(cache.lookup("Acme", "add memory to my crew", "Ann"))
+            cache.store("Acme", "add memory to my crew", "Ann", "memory")
+        self.assertEqual((cache.stats()["entries"], cache.stats()["errors"]), (0, 2))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import threading
+import time
+import unittest
+from unittest import mock
+import main
+
+class CrewStandIn:
+    """Stand-in for create_content_crew tracking how many crews run at once"""
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.running = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, topic):
+        with self._lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        try:
+            time.sleep(0.05)
+            if topic in self.failing:
+                raise RuntimeError(f"{topic} failed")
+            return f"article on {topic}"
+        finally:
+            with self._lock:
+                self.running -= 1
+
+class TestKickoffMany(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch("main.validate_settings")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def run_batch(self, crew, **kwargs):
+        with mock.patch("main.create_content_crew", side_effect=crew):
+            return {outcome.topic: outcome for outcome in main.kickoff_many(**kwargs)}
+
+    def test_concurrency_is_bounded(self):
+        """Test that no more than max_concurrency crews run at the same time"""
+        crew = CrewStandIn()
+        outcomes = self.run_batch(crew, topics=[f"topic {i}" for i in range(6)], max_concurrency=2)
+        self.assertEqual(len(outcomes), 6)
+        self.assertEqual(crew.peak, 2)
+
+    def test_failing_topic_is_isolated(self):
+        """Test that a failing topic is reported without affecting the others"""
+        outcomes = self.run_batch(CrewStandIn(failing={"Blockchain"}), category="technology")
+        self.assertEqual(len(outcomes), 5)
+        self.assertFalse(outcomes["Blockchain"].ok)
+        self.assertEqual(str(outcomes["Blockchain"].error), "Blockchain failed")
+        self.assertEqual(outcomes["Cybersecurity"].result, "article on Cybersecurity")
+        self.assertEqual(sum(outcome.ok for outcome in outcomes.values()), 4)
+
+    def test_unknown_category_is_rejected(self):
+        """Test that a misspelt category fails on the call instead of running an empty batch"""
+        with self.assertRaises(ValueError) as raised:
+            main.kickoff_many(category="tecnology")
+        self.assertIn("tecnology", str(raised.exception))
+
+if __name__ == '__main__':
+    unittest.main()
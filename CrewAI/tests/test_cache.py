@@ -0,0 +1,68 @@
+import time
+import unittest
+from utils.cache import PersistentCache, normalize_query
+
+class TestPersistentCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = PersistentCache(":memory:", ttls={"weather": 60, "static": None}, max_entries=3,
+                                     stale_for=60, evict_every=1)
+
+    def tearDown(self):
+        self.cache.close()
+
+    def test_normalize_query(self):
+        """Test that spacing and case differences share a key"""
+        self.assertEqual(normalize_query("  Weather in  Paris "), "weather in paris")
+
+    def test_hit_and_miss_counters(self):
+        """Test that lookups are counted as hits and misses"""
+        self.assertIsNone(self.cache.get("q", "weather"))
+        self.cache.set("q", ["result"], "weather")
+        self.assertEqual(self.cache.get("q", "weather"), ["result"])
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+
+    def test_kinds_are_separate(self):
+        """Test that the same key under another kind is a miss"""
+        self.cache.set("q", "a", "weather")
+        self.assertIsNone(self.cache.get("q", "static"))
+
+    def test_expired_entries(self):
+        """Test that expired entries miss unless stale reads are allowed"""
+        self.cache.ttls["weather"] = -1
+        self.cache.set("q", "old", "weather")
+        self.assertIsNone(self.cache.get("q", "weather"))
+        self.assertEqual(self.cache.get("q", "weather", allow_stale=True), "old")
+
+    def test_long_expired_entries_are_purged(self):
+        """Test that entries expired for longer than stale_for are deleted, not just hidden"""
+        self.cache.set("fresh", "new", "weather")
+        self.cache.ttls["weather"] = -120
+        self.cache.set("q", "old", "weather")
+        self.assertIsNone(self.cache.get("q", "weather", allow_stale=True))
+        stats = self.cache.stats()
+        self.assertEqual((stats["purged"], stats["entries"], stats["evictions"]), (1, 1, 0))
+
+    def test_eviction_runs_every_n_writes(self):
+        """Test that the size bound is enforced every evict_every writes"""
+        cache = PersistentCache(":memory:", ttls={"static": None}, max_entries=1, evict_every=3)
+        self.addCleanup(cache.close)
+        cache.set("a", "a", "static")
+        cache.set("b", "b", "static")
+        self.assertEqual(cache.stats()["entries"], 2)
+        cache.set("c", "c", "static")
+        self.assertEqual((cache.stats()["entries"], cache.stats()["evictions"]), (1, 2))
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first"""
+        for key in ("a", "b", "c"):
+            self.cache.set(key, key, "static")
+            time.sleep(0.001)
+        self.cache.get("a", "static")
+        self.cache.set("d", "d", "static")
+        self.assertIsNone(self.cache.get("b", "static"))
+        self.assertEqual(self.cache.get("a", "static"), "a")
+        self.assertEqual(self.cache.stats()["evictions"], 1)
+
+if __name__ == '__main__':
+    unittest.main()
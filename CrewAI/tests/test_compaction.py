@@ -0,0 +1,68 @@
+import asyncio
+import unittest
+from unittest import mock
+from utils.compaction import compact_output, compact_text, compacted, estimate_tokens, strip_fields
+
+def serper_text(results):
+    return "\nSearch results: " + "\n".join(
+        f"Title: {title}\nLink: {link}\nSnippet: {snippet}\n---" for title, link, snippet in results
+    ) + "\n"
+
+class TestCompaction(unittest.TestCase):
+    def test_strips_boilerplate_and_duplicates(self):
+        """Test that separators, cookie lines and repeated results are dropped"""
+        text = serper_text([
+            ("Chicago weather", "https://w.example/chi", "Sunny, 21C"),
+            ("Chicago weather", "https://w.example/chi", "Sunny, 21C"),
+        ]) + "We use cookies, see our cookie policy\n"
+        compacted = compact_text(text, 1000)
+        self.assertEqual(compacted.count("https://w.example/chi"), 1)
+        self.assertNotIn("---", compacted)
+        self.assertNotIn("cookie", compacted)
+
+    def test_keeps_most_relevant_blocks_within_budget(self):
+        """Test that over-budget output keeps the blocks matching the query, in order"""
+        results = [(f"Result {i}", f"https://r.example/{i}", f"Hotels in {'Chicago' if i % 4 == 0 else 'Boston'} downtown deals")
+                   for i in range(40)]
+        compacted = compact_text(serper_text(results), 100, query="hotels in Chicago")
+        self.assertLessEqual(estimate_tokens(compacted), 110)
+        self.assertIn("Chicago", compacted)
+        self.assertNotIn("Boston", compacted.split("[")[0])
+        self.assertIn("less relevant passages omitted", compacted)
+
+    def test_list_keeps_short_items(self):
+        """Test that headers in a list result survive while the long item is compacted"""
+        long_item = serper_text([(f"R{i}", f"https://r.example/{i}", "x " * 50) for i in range(50)])
+        compacted = compact_output(["Found tickets:", "Search Results:", long_item], 200)
+        self.assertEqual(compacted[:2], ["Found tickets:", "Search Results:"])
+        self.assertLess(estimate_tokens(compacted[2]), 220)
+
+    def test_strip_fields(self):
+        """Test that bookkeeping fields of raw responses are removed recursively"""
+        raw = {"searchParameters": {"q": "x"}, "organic": [{"title": "T", "position": 1}]}
+        self.assertEqual(strip_fields(raw), {"organic": [{"title": "T"}]})
+
+class SearchTool:
+    """Tool returning many search results, synchronously and asynchronously"""
+    results = serper_text([(f"R{i}", f"https://r.example/{i}", "hotel deals " * 20) for i in range(50)])
+
+    @compacted
+    def _run(self, query):
+        return self.results
+
+    @compacted
+    async def _arun(self, query):
+        return self.results
+
+class TestCompactedDecorator(unittest.TestCase):
+    def test_sync_and_async_outputs_are_compacted(self):
+        """Test that _run and _arun outputs are both cut to the budget"""
+        tool = SearchTool()
+        with mock.patch("config.settings.TOOL_OUTPUT_MAX_TOKENS", 100):
+            sync_output = tool._run("hotels")
+            async_output = asyncio.run(tool._arun("hotels"))
+        self.assertLessEqual(estimate_tokens(sync_output), 110)
+        self.assertEqual(async_output, sync_output)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import asyncio
+import contextvars
+import time
+import unittest
+from utils.concurrency import afan_out, fan_out, run_sync
+
+class TestFanOut(unittest.TestCase):
+    def test_results_keep_order(self):
+        """Test that outcomes come back in submission order"""
+        calls = [lambda d=d: (time.sleep(d), d)[1] for d in (0.05, 0.0, 0.02)]
+        self.assertEqual(fan_out(calls), [0.05, 0.0, 0.02])
+
+    def test_slow_call_times_out_alone(self):
+        """Test that one slow call does not hold back the others"""
+        start = time.monotonic()
+        outcomes = fan_out(
+            [lambda: "fast", lambda: time.sleep(1)],
+            timeouts=[1, 0.05]
+        )
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual(outcomes[0], "fast")
+        self.assertIsInstance(outcomes[1], TimeoutError)
+
+    def test_exceptions_are_returned(self):
+        """Test that a failing call is reported rather than raised"""
+        outcomes = fan_out([lambda: 1 / 0])
+        self.assertIsInstance(outcomes[0], ZeroDivisionError)
+
+class TestAsyncHelpers(unittest.TestCase):
+    def test_afan_out_times_out_alone(self):
+        """Test that a slow coroutine is cancelled without holding back the others"""
+        async def sleep_then(delay, value):
+            await asyncio.sleep(delay)
+            return value
+
+        outcomes = asyncio.run(afan_out(
+            [sleep_then(0.01, "fast"), sleep_then(1, "slow"), sleep_then(0, 1 / 1)],
+            timeouts=[1, 0.05, None]
+        ))
+        self.assertEqual(outcomes[0], "fast")
+        self.assertIsInstance(outcomes[1], TimeoutError)
+        self.assertEqual(outcomes[2], 1.0)
+
+    def test_afan_out_keeps_the_coroutines_own_timeouts(self):
+        """Test that a TimeoutError raised by the coroutine itself is returned unchanged"""
+        error = TimeoutError("serper quota would need a 90s wait")
+
+        async def fail():
+            raise error
+
+        self.assertIs(asyncio.run(afan_out([fail()]))[0], error)
+
+    def test_run_sync_result_and_context(self):
+        """Test that run_sync returns the result and carries the caller's context"""
+        current = contextvars.ContextVar("current", default=None)
+
+        async def read_current():
+            await asyncio.sleep(0)
+            return current.get()
+
+        current.set("caller")
+        self.assertEqual(run_sync(read_current()), "caller")
+
+    def test_run_sync_raises(self):
+        """Test that the coroutine's exception reaches the caller"""
+        async def fail():
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            run_sync(fail())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+import os
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+os.environ.setdefault("OPENAI_API_KEY", "test-key")  # crewai's default LLM needs a key to be built
+
+from crewai import Agent, Crew, Task
+from crews.crew_pool import CrewTemplate
+
+class FakeCacheHandler:
+    def __init__(self):
+        self.entries = {}
+
+class FakeAgent:
+    def __init__(self):
+        self.cache_handler = None
+
+    def set_cache_handler(self, handler):
+        self.cache_handler = handler
+
+class FakeCrew:
+    """Crew recording its kickoffs, with crewai's per-run state"""
+    def __init__(self):
+        self.cache = True
+        self._cache_handler = FakeCacheHandler()
+        self.agents = [FakeAgent(), FakeAgent()]
+        for agent in self.agents:
+            agent.set_cache_handler(self._cache_handler)
+        self.tasks = [SimpleNamespace(output=None, tools=[]), SimpleNamespace(output=None, tools=[])]
+        self.kickoffs = []
+
+    def kickoff(self, inputs):
+        self.kickoffs.append(inputs)
+        seen = dict(self._cache_handler.entries)
+        self._cache_handler.entries[inputs["topic"]] = "tool result"
+        for task in self.tasks:
+            task.output = inputs["topic"]
+        return seen
+
+class TestCrewTemplate(unittest.TestCase):
+    def setUp(self):
+        self.template = CrewTemplate("content", FakeCrew, max_idle=1)
+
+    def test_idle_crew_is_reused(self):
+        """Test that sequential kickoffs build one crew and reuse it"""
+        self.template.kickoff({"topic": "a"})
+        self.template.kickoff({"topic": "b"})
+        self.assertEqual(self.template.built, 1)
+        with self.template.checkout() as crew:
+            self.assertEqual(crew.kickoffs, [{"topic": "a"}, {"topic": "b"}])
+
+    def test_reused_crew_starts_clean(self):
+        """Test that tool results and task outputs do not carry over between kickoffs"""
+        self.template.kickoff({"topic": "a"})
+        self.assertEqual(self.template.kickoff({"topic": "a"}), {})
+        with self.template.checkout() as crew:
+            self.assertEqual([task.output for task in crew.tasks], [None, None])
+            self.assertEqual(crew._cache_handler.entries, {})
+            self.assertTrue(all(agent.cache_handler is crew._cache_handler for agent in crew.agents))
+
+    def test_concurrent_checkouts_get_separate_crews(self):
+        """Test that a busy crew is never handed out twice and the idle pool stays bounded"""
+        both_out = threading.Barrier(2)
+        crews = []
+
+        def borrow():
+            with self.template.checkout() as crew:
+                crews.append(crew)
+                both_out.wait(timeout=5)
+
+        workers = [threading.Thread(target=borrow) for _ in range(2)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        self.assertIsNot(crews[0], crews[1])
+        self.assertEqual(self.template.built, 2)
+        self.assertEqual(len(self.template._idle), 1)
+
+def delegating_crew():
+    """Two-agent crew whose reviewer may delegate, like the support crew's QA agent"""
+    support = Agent(role="support", goal="goal", backstory="backstory", allow_delegation=False)
+    reviewer = Agent(role="reviewer", goal="goal", backstory="backstory")
+    return Crew(agents=[support, reviewer], tasks=[
+        Task(description="answer", expected_output="answer", agent=support),
+        Task(description="review", expected_output="review", agent=reviewer),
+    ])
+
+def counting_agent(agent, task, context=None, tools=None):
+    """Stand-in for Agent.execute_task counting tokens as crewai's token handler does"""
+    agent._token_process.sum_prompt_tokens(10)
+    agent._token_process.sum_successful_requests(1)
+    return task.description
+
+class TestPooledCrewReuse(unittest.TestCase):
+    def test_reused_crew_keeps_its_tools_and_counts_one_run(self):
+        """Test that repeated kickoffs neither pile up delegation tools nor carry over token usage"""
+        template = CrewTemplate("support", delegating_crew, max_idle=1)
+        tool_counts, metrics = [], []
+        with mock.patch("crewai.crew.Telemetry"), \
+                mock.patch.object(Agent, "execute_task", side_effect=counting_agent, autospec=True):
+            for _ in range(4):
+                with template.checkout() as crew:
+                    crew.kickoff()
+                    tool_counts.append(len(crew.tasks[1].tools))
+                    metrics.append(crew.usage_metrics)
+        self.assertEqual(template.built, 1)
+        self.assertEqual(tool_counts, [2] * 4)
+        self.assertEqual(metrics, [metrics[0]] * 4)
+        self.assertEqual(metrics[0]["total_tokens"], 20)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from utils import dir_index
+from utils.dir_index import DirectoryIndex
+
+def write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(text)
+
+class TestDirectoryIndex(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        write(os.path.join(self.root, "a.txt"), "alpha")
+        write(os.path.join(self.root, "sub", "b.txt"), "beta")
+        self.index = DirectoryIndex(":memory:", max_age=0)
+
+    def test_lists_tree_with_hashes(self):
+        """Test that every file is listed with its size and content hash"""
+        files = self.index.list_files(self.root)
+        self.assertEqual([f["path"] for f in files], ["a.txt", os.path.join("sub", "b.txt")])
+        self.assertEqual(files[0]["size"], 5)
+        self.assertEqual(len(files[0]["hash"]), 64)
+
+    def test_rescan_only_reads_changed_files(self):
+        """Test that unchanged files are not hashed again and deletions are dropped"""
+        self.index.scan(self.root)
+        write(os.path.join(self.root, "sub", "b.txt"), "beta, edited")
+        write(os.path.join(self.root, "c.txt"), "gamma")
+        os.remove(os.path.join(self.root, "a.txt"))
+        with mock.patch("utils.dir_index.file_hash", wraps=dir_index.file_hash) as hashed:
+            counts = self.index.scan(self.root)
+        self.assertEqual(counts, {"hashed": 2, "unchanged": 0, "removed": 1})
+        self.assertEqual(sorted(os.path.basename(c.args[0]) for c in hashed.call_args_list), ["b.txt", "c.txt"])
+        self.assertEqual(self.index.scan(self.root), {"hashed": 0, "unchanged": 2, "removed": 0})
+
+    def test_recent_scan_is_served_from_manifest(self):
+        """Test that a tree scanned within max_age is not walked again"""
+        index = DirectoryIndex(":memory:", max_age=60)
+        index.list_files(self.root)
+        with mock.patch("utils.dir_index.scan_tree") as walk:
+            self.assertEqual(len(index.list_files(self.root)), 2)
+        walk.assert_not_called()
+        self.assertEqual(index.stats["cached"], 1)
+
+    def test_large_files_are_not_hashed(self):
+        """Test that files above hash_max_bytes are listed without a hash"""
+        index = DirectoryIndex(":memory:", max_age=0, hash_max_bytes=3)
+        files = index.list_files(self.root)
+        self.assertTrue(all(f["hash"] is None for f in files))
+
+if __name__ == '__main__':
+    unittest.main()
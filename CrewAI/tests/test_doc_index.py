@@ -0,0 +1,106 @@
+import re
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from utils import doc_index
+from utils.doc_index import DocIndex, chunk_text, content_hash, ingest_support_docs
+
+VOCABULARY = ["memory", "crew", "agent", "task", "tool", "delegation", "kickoff", "process"]
+
+class BagOfWords:
+    """Chroma embedding function counting vocabulary words, recording what it embeds"""
+    def __init__(self):
+        self.embedded = []
+
+    def __call__(self, input):
+        self.embedded.extend(input)
+        return [[float(re.findall(r"\w+", text.lower()).count(word)) + 0.01 for word in VOCABULARY]
+                for text in input]
+
+class TestChunkText(unittest.TestCase):
+    def test_chunks_respect_size_and_sentences(self):
+        """Test that chunks stay under the size limit and end on sentence boundaries"""
+        text = " ".join(f"Sentence number {i} explains one thing." for i in range(40))
+        chunks = chunk_text(text, chunk_size=200, overlap=0)
+        self.assertGreater(len(chunks), 1)
+        for chunk in chunks:
+            self.assertLessEqual(len(chunk), 200)
+            self.assertTrue(chunk.endswith("."))
+        self.assertEqual(" ".join(chunks), text)
+
+    def test_overlap_repeats_previous_tail(self):
+        """Test that each chunk starts with the last sentence of the previous one"""
+        text = " ".join(f"Fact {i} is here." for i in range(30))
+        chunks = chunk_text(text, chunk_size=120, overlap=30)
+        for previous, chunk in zip(chunks, chunks[1:]):
+            first_sentence = chunk.split(". ")[0] + "."
+            self.assertTrue(previous.endswith(first_sentence))
+
+    def test_long_sentence_is_split(self):
+        """Test that a sentence longer than a chunk is cut on word boundaries"""
+        chunks = chunk_text("word " * 100, chunk_size=50, overlap=0)
+        self.assertTrue(all(len(chunk) <= 50 for chunk in chunks))
+        self.assertEqual(sum(chunk.count("word") for chunk in chunks), 100)
+
+    def test_unchanged_text_keeps_chunk_hashes(self):
+        """Test that chunk ids (content hashes) only change for edited chunks"""
+        text = " ".join(f"Paragraph {i} has content." for i in range(30))
+        edited = text.replace("Paragraph 29 has", "Paragraph 29 now has")
+        before = {content_hash(c) for c in chunk_text(text, 200, 0)}
+        after = {content_hash(c) for c in chunk_text(edited, 200, 0)}
+        self.assertEqual(len(after - before), 1)
+
+class TestDocIndex(unittest.TestCase):
+    def setUp(self):
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path, ignore_errors=True)
+        self.embedder = BagOfWords()
+        self.index = DocIndex(path, "docs", embedding_function=self.embedder, chunk_size=60, overlap=0)
+        self.page = ("Memory lets a crew remember earlier runs. "
+                     "Delegation lets an agent hand a task to another agent. "
+                     "Kickoff starts the process of the crew.")
+
+    def test_search_returns_relevant_chunks(self):
+        """Test that a question gets the chunk about it, with its source"""
+        self.assertEqual(self.index.ingest("docs", self.page), {"added": 3, "removed": 0, "unchanged": 0})
+        [best] = self.index.search("how does delegation work", k=1)
+        self.assertIn("Delegation", best["text"])
+        self.assertEqual((best["source"], best["position"]), ("docs", 1))
+
+    def test_reingest_only_embeds_changed_chunks(self):
+        """Test that re-ingesting an edited page embeds the edited chunk and drops the old one"""
+        self.index.ingest("docs", self.page)
+        self.embedder.embedded.clear()
+        self.assertEqual(self.index.ingest("docs", self.page), {"added": 0, "removed": 0, "unchanged": 3})
+
+        edited = self.page.replace("Kickoff starts", "Kickoff begins")
+        self.assertEqual(self.index.ingest("docs", edited), {"added": 1, "removed": 1, "unchanged": 2})
+        self.assertEqual(self.embedder.embedded, ["Kickoff begins the process of the crew."])
+
+class TestIngestSupportDocs(unittest.TestCase):
+    def setUp(self):
+        self.index = mock.Mock()
+        self.store = mock.Mock(**{"get_text.return_value": "page"})
+        for target, value in (("utils.doc_index.get_support_docs_index", self.index),
+                              ("utils.snapshots.get_snapshot_store", self.store)):
+            patcher = mock.patch(target, return_value=value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch.dict(doc_index._ingested_at, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_recently_ingested_pages_are_skipped(self):
+        """Test that a page is not read or re-ingested again within max_age"""
+        with mock.patch("utils.doc_index.time.time", return_value=1000):
+            self.assertEqual(list(ingest_support_docs(["a"], max_age=60)), ["a"])
+        with mock.patch("utils.doc_index.time.time", return_value=1030):
+            self.assertEqual(ingest_support_docs(["a"], max_age=60), {})
+            self.assertEqual(list(ingest_support_docs(["a"])), ["a"])  # No max_age: always
+        with mock.patch("utils.doc_index.time.time", return_value=1100):
+            self.assertEqual(list(ingest_support_docs(["a"], max_age=60)), ["a"])
+        self.assertEqual(self.store.get_text.call_count, 3)
+
+if __name__ == '__main__':
+    unittest.main()
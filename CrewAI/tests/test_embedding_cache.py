@@ -0,0 +1,57 @@
+import os
+import tempfile
+import unittest
+from utils.embedding_cache import CachedEmbeddingFunction, EmbeddingCache
+
+class CountingEmbedder:
+    """Embedding function recording which texts it was asked to embed"""
+    def __init__(self):
+        self.embedded = []
+
+    def __call__(self, input):
+        self.embedded.extend(input)
+        return [[float(len(text)), 0.5] for text in input]
+
+class TestEmbeddingCache(unittest.TestCase):
+    def test_only_new_texts_are_embedded(self):
+        """Test that cached chunks are not sent to the provider again"""
+        embedder = CountingEmbedder()
+        embed = CachedEmbeddingFunction(embedder, "model-a", EmbeddingCache(":memory:"))
+        first = embed(["alpha", "beta"])
+        second = embed(["beta", "gamma", "alpha"])
+        self.assertEqual(embedder.embedded, ["alpha", "beta", "gamma"])
+        self.assertEqual(second, [first[1], [5.0, 0.5], first[0]])
+
+    def test_duplicates_in_one_call(self):
+        """Test that a text repeated within a batch is embedded once"""
+        embedder = CountingEmbedder()
+        embed = CachedEmbeddingFunction(embedder, "model-a", EmbeddingCache(":memory:"))
+        self.assertEqual(len(embed(["same", "same", "other"])), 3)
+        self.assertEqual(embedder.embedded, ["same", "other"])
+
+    def test_model_is_part_of_the_key(self):
+        """Test that another model does not reuse the vectors"""
+        cache = EmbeddingCache(":memory:")
+        embedder = CountingEmbedder()
+        CachedEmbeddingFunction(embedder, "model-a", cache)(["alpha"])
+        CachedEmbeddingFunction(embedder, "model-b", cache)(["alpha"])
+        self.assertEqual(embedder.embedded, ["alpha", "alpha"])
+
+    def test_persists_across_processes(self):
+        """Test that vectors written to disk are reused by a new cache on the same file"""
+        path = os.path.join(tempfile.mkdtemp(), "embeddings.sqlite3")
+        CachedEmbeddingFunction(CountingEmbedder(), "model-a", EmbeddingCache(path))(["alpha"])
+        embedder = CountingEmbedder()
+        vectors = CachedEmbeddingFunction(embedder, "model-a", EmbeddingCache(path))(["alpha"])
+        self.assertEqual(embedder.embedded, [])
+        self.assertEqual(vectors, [[5.0, 0.5]])
+
+    def test_lru_bound(self):
+        """Test that the cache keeps at most max_entries vectors"""
+        cache = EmbeddingCache(":memory:", max_entries=2)
+        embed = CachedEmbeddingFunction(CountingEmbedder(), "model-a", cache)
+        embed(["a1", "a2", "a3"])
+        self.assertEqual(cache.stats()["entries"], 2)
+
+if __name__ == '__main__':
+    unittest.main()
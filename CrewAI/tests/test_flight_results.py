@@ -0,0 +1,61 @@
+import unittest
+from datetime import date
+from tools.flight_results import (
+    date_window, extract_price, merge_results, rank_options, summarize_date_window
+)
+
+def result(title, link, snippet=""):
+    return {"title": title, "link": link, "snippet": snippet}
+
+class TestFlightResults(unittest.TestCase):
+    def test_date_window(self):
+        """Test the window spans N days on each side, across month ends"""
+        self.assertEqual(
+            date_window("2024-03-01", 1, earliest=date(2024, 1, 1)),
+            ["2024-02-29", "2024-03-01", "2024-03-02"]
+        )
+        with self.assertRaises(ValueError):
+            date_window("next friday", 1)
+
+    def test_date_window_skips_past_dates(self):
+        """Test that dates before today (or the given earliest date) are left out"""
+        self.assertEqual(date_window("2024-03-01", 2, earliest=date(2024, 3, 1)),
+                         ["2024-03-01", "2024-03-02", "2024-03-03"])
+        self.assertEqual(date_window("2000-01-01", 3), [])
+
+    def test_extract_price(self):
+        """Test that the lowest quoted price is used"""
+        self.assertEqual(extract_price(result("Fares from $1,249", "x", "or $980.50 one way")), 980.5)
+        self.assertIsNone(extract_price(result("Cheap flights", "x")))
+
+    def test_merge_dedupes_across_dates(self):
+        """Test that the same page found for several dates becomes one option"""
+        options = merge_results({
+            "2024-05-01": [result("LAX to JFK", "https://air.example/lax-jfk?ref=1", "from $300")],
+            "2024-05-02": [result("LAX to JFK", "https://air.example/lax-jfk/", "from $250")],
+        })
+        self.assertEqual(len(options), 1)
+        self.assertEqual(options[0]["price"], 250)
+        self.assertEqual(options[0]["dates"], ["2024-05-01", "2024-05-02"])
+
+    def test_rank_puts_unpriced_last(self):
+        """Test ranking by price with unpriced options at the end"""
+        ranked = rank_options(merge_results({"2024-05-01": [
+            result("No price", "https://a.example"),
+            result("Pricey", "https://b.example", "$500"),
+            result("Cheap", "https://c.example", "$120"),
+        ]}))
+        self.assertEqual([o["title"] for o in ranked], ["Cheap", "Pricey", "No price"])
+
+    def test_summary_reports_failed_dates(self):
+        """Test the per-date lines, including a date whose lookup timed out"""
+        summary = summarize_date_window({
+            "2024-05-01": [result("Cheap", "https://c.example", "$120")],
+            "2024-05-02": TimeoutError("timed out after 15s"),
+        })
+        self.assertIn("- 2024-05-01: 1 options, from $120", summary)
+        self.assertIn("- 2024-05-02: unavailable (timed out after 15s)", summary)
+        self.assertIn("1. Cheap - $120 - https://c.example (2024-05-01)", summary)
+
+if __name__ == '__main__':
+    unittest.main()
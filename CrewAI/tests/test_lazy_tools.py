@@ -0,0 +1,93 @@
+import importlib.util
+import unittest
+
+@unittest.skipUnless(importlib.util.find_spec("crewai_tools"), "crewai_tools is not installed")
+class TestLazyTool(unittest.TestCase):
+    def setUp(self):
+        from typing import Optional, Type
+        from crewai_tools import BaseTool
+        from pydantic.v1 import BaseModel, Field
+
+        class FixedReadSchema(BaseModel):
+            pass
+
+        class ReadSchema(FixedReadSchema):
+            path: str = Field(..., description="Path to read")
+
+        builds = self.builds = []
+
+        class ReadTool(BaseTool):
+            """Reshapes itself when bound to a path, like ScrapeWebsiteTool or FileReadTool"""
+            name: str = "Read"
+            description: str = "Reads a path."
+            args_schema: Type[BaseModel] = ReadSchema
+            path: Optional[str] = None
+
+            def __init__(self, path: Optional[str] = None, **kwargs):
+                super().__init__(**kwargs)
+                builds.append(path)
+                if path is not None:
+                    self.path = path
+                    self.description = f"Reads {path}."
+                    self.args_schema = FixedReadSchema
+                    self._generate_description()
+
+            def _run(self, **kwargs):
+                return f"read {kwargs.get('path', self.path)}"
+
+        class SearchTool(BaseTool):
+            name: str = "Search"
+            description: str = "Searches."
+            args_schema: Type[BaseModel] = ReadSchema
+            n_results: int = 3
+
+            def _run(self, **kwargs):
+                builds.append("search")
+                return f"{self.n_results} results"
+
+        self.ReadTool, self.SearchTool = ReadTool, SearchTool
+
+    def assert_advertises_like(self, proxy, tool):
+        self.assertEqual((proxy.name, proxy.description, proxy.args_schema),
+                         (tool.name, tool.description, tool.args_schema))
+
+    def test_proxy_is_built_on_first_call(self):
+        """Test that a tool without constructor arguments is only built when called"""
+        from tools.lazy_tools import LazyTool
+
+        proxy = LazyTool.for_class(self.ReadTool)
+        self.assertFalse(proxy.is_built)
+        self.assertEqual(self.builds, [])
+        self.assertEqual(proxy._run(path="a.txt"), "read a.txt")
+        self.assertEqual(self.builds, [None])
+        self.assert_advertises_like(proxy, self.ReadTool())
+
+    def test_reshaping_constructor_arguments(self):
+        """Test that a tool bound by its constructor advertises its bound description and schema"""
+        from tools.lazy_tools import LazyTool
+
+        proxy = LazyTool.for_class(self.ReadTool, path="notes.txt")
+        self.assert_advertises_like(proxy, self.ReadTool(path="notes.txt"))
+        self.assertEqual(proxy.args_schema.schema()["properties"], {})
+        self.assertEqual(proxy._run(), "read notes.txt")
+
+    def test_field_arguments_stay_lazy(self):
+        """Test that plain field arguments keep the proxy lazy and reach the built tool"""
+        from tools.lazy_tools import LazyTool
+
+        proxy = LazyTool.for_class(self.SearchTool, n_results=5, name="Web Search")
+        self.assertFalse(proxy.is_built)
+        self.assert_advertises_like(proxy, self.SearchTool(n_results=5, name="Web Search"))
+        self.assertEqual(proxy._run(path="x"), "5 results")
+
+    def test_cache_function_is_forwarded(self):
+        """Test that the proxy tells crewai when results may be cached, like the tool would"""
+        from tools.lazy_tools import LazyTool
+
+        never = lambda args, result: False
+        self.assertIs(LazyTool.for_class(self.SearchTool, cache_function=never).cache_function, never)
+        self.assertIs(LazyTool.for_class(self.ReadTool, path="a", cache_function=never).cache_function, never)
+        self.assertTrue(LazyTool.for_class(self.SearchTool).cache_function({}, "result"))
+
+if __name__ == '__main__':
+    unittest.main()
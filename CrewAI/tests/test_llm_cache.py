@@ -0,0 +1,49 @@
+import unittest
+from langchain_core.language_models import FakeListChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, Generation
+from config.llm_cache import CompletionCache, CompletionCacheMiss
+
+GPT4 = "model_name=gpt-4;temperature=0.7"
+GPT4_COLD = "model_name=gpt-4;temperature=0.0"
+
+class TestCompletionCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = CompletionCache(":memory:", ttl=60)
+
+    def tearDown(self):
+        self.cache.store.close()
+
+    def test_lookup_update_round_trip(self):
+        """Test that stored generations come back as equal LangChain objects"""
+        generations = [ChatGeneration(message=AIMessage(content="Plan: outline first")), Generation(text="raw")]
+        self.assertIsNone(self.cache.lookup("plan an article", GPT4))
+        self.cache.update("plan an article", GPT4, generations)
+        self.assertEqual(self.cache.lookup("plan an article", GPT4), generations)
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+
+    def test_keys_are_scoped_by_llm_string(self):
+        """Test that the same prompt for another model or parameters is a miss"""
+        self.cache.update("plan an article", GPT4, [Generation(text="warm")])
+        self.assertIsNone(self.cache.lookup("plan an article", GPT4_COLD))
+        self.assertIsNone(self.cache.lookup("plan an article ", GPT4))
+
+    def test_replay_serves_expired_and_fails_on_misses(self):
+        """Test that replay mode returns expired completions and never falls through to the provider"""
+        cache = CompletionCache(":memory:", ttl=-1, replay=True)
+        self.addCleanup(cache.store.close)
+        cache.update("plan an article", GPT4, [Generation(text="recorded")])
+        self.assertEqual(cache.lookup("plan an article", GPT4), [Generation(text="recorded")])
+        with self.assertRaises(CompletionCacheMiss):
+            cache.lookup("write the article", GPT4)
+
+    def test_model_is_answered_from_cache(self):
+        """Test that a chat model using the cache only calls the provider once per prompt"""
+        llm = FakeListChatModel(responses=["first", "second"], cache=self.cache)
+        self.assertEqual(llm.invoke("hello").content, "first")
+        self.assertEqual(llm.invoke("hello").content, "first")
+        self.assertEqual(llm.invoke("goodbye").content, "second")
+
+if __name__ == '__main__':
+    unittest.main()
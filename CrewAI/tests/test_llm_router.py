@@ -0,0 +1,143 @@
+import time
+import unittest
+from unittest import mock
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.language_models import FakeListLLM
+from langchain_core.language_models.chat_models import SimpleChatModel
+from config import llm_config
+from config.llm_router import LatencyRouter
+from config.routed_llm import RoutedChatModel
+
+class Backend:
+    """Stand-in provider answering its name after a delay, or failing"""
+    def __init__(self, name, delay=0.0, fail=False):
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError(f"{self.name} is down")
+        return self.name
+
+def call(router):
+    return router.call(lambda backend: backend())
+
+class TestLatencyRouter(unittest.TestCase):
+    def test_declared_order_until_measured(self):
+        """Test that the first backend is the default before any latency is known"""
+        router = LatencyRouter({"openai": Backend("openai"), "cohere": Backend("cohere")})
+        self.assertEqual(call(router), "openai")
+
+    def test_routes_to_fastest(self):
+        """Test that calls go to the backend with the lowest median latency"""
+        router = LatencyRouter({"openai": Backend("openai"), "cohere": Backend("cohere")})
+        for _ in range(5):
+            router.record("openai", 2.0, True)
+            router.record("cohere", 0.5, True)
+        self.assertEqual(router.ranked(), ["cohere", "openai"])
+        self.assertEqual(call(router), "cohere")
+
+    def test_fallback_and_unhealthy_backend(self):
+        """Test that failures fall through and a failing backend is skipped during its cooldown"""
+        down = Backend("openai", fail=True)
+        router = LatencyRouter({"openai": down, "cohere": Backend("cohere")}, min_samples=1, cooldown=60)
+        for _ in range(5):
+            self.assertEqual(call(router), "cohere")
+        self.assertFalse(router.is_healthy("openai"))
+        self.assertEqual(down.calls, 1)  # Skipped after its first failure
+        self.assertEqual(router.snapshot()["fallbacks"], 1)
+
+    def test_all_backends_fail(self):
+        """Test that the last error is raised when no backend answers"""
+        router = LatencyRouter({"a": Backend("a", fail=True), "b": Backend("b", fail=True)})
+        with self.assertRaises(ConnectionError):
+            call(router)
+
+    def test_hedges_slow_call(self):
+        """Test that a call slower than the primary's p95 is raced on the second backend"""
+        slow = Backend("openai", delay=0.5)
+        router = LatencyRouter({"openai": slow, "cohere": Backend("cohere")},
+                               min_samples=3, hedge=True, hedge_quantile=0.95)
+        for _ in range(5):
+            router.record("openai", 0.05, True)
+            router.record("cohere", 0.1, True)
+        start = time.perf_counter()
+        self.assertEqual(call(router), "cohere")
+        self.assertLess(time.perf_counter() - start, 0.4)
+        self.assertEqual(router.snapshot()["hedge_wins"], 1)
+
+    def test_fast_call_is_not_hedged(self):
+        """Test that a call answered within the threshold uses one backend only"""
+        second = Backend("cohere")
+        router = LatencyRouter({"openai": Backend("openai"), "cohere": second}, min_samples=3, hedge=True)
+        for _ in range(5):
+            router.record("openai", 0.5, True)
+        self.assertEqual(call(router), "openai")
+        self.assertEqual(second.calls, 0)
+
+class UsageChatModel(SimpleChatModel):
+    """Chat model answering "pong" and reporting its token usage"""
+    def _call(self, messages, stop=None, run_manager=None, **kwargs):
+        return "pong"
+
+    def _combine_llm_outputs(self, llm_outputs):
+        return {"token_usage": {"total_tokens": 7 * len(llm_outputs)}, "model_name": "usage"}
+
+    @property
+    def _llm_type(self):
+        return "usage"
+
+class RunRecorder(BaseCallbackHandler):
+    def __init__(self):
+        self.started = []
+
+    def on_chat_model_start(self, serialized, messages, **kwargs):
+        self.started.append(kwargs["parent_run_id"])
+
+    def on_llm_start(self, serialized, prompts, **kwargs):
+        self.started.append(kwargs["parent_run_id"])
+
+class TestRoutedChatModel(unittest.TestCase):
+    def test_keeps_llm_output_and_callbacks(self):
+        """Test that the backend's usage and callback runs reach the routed model's caller"""
+        recorder = RunRecorder()
+        llm = RoutedChatModel(router=LatencyRouter({"usage": UsageChatModel()}))
+        result = llm.generate([[("human", "ping")]], callbacks=[recorder])
+        self.assertEqual(result.generations[0][0].text, "pong")
+        self.assertEqual(result.llm_output["token_usage"], {"total_tokens": 7})
+        routed_run, backend_run = recorder.started
+        self.assertIsNone(routed_run)
+        self.assertIsNotNone(backend_run)  # Nested under the routed call
+
+    def test_completion_backend(self):
+        """Test that completion models answer chat messages through the router"""
+        llm = RoutedChatModel(router=LatencyRouter({"hf": FakeListLLM(responses=["done"])}))
+        self.assertEqual(llm.invoke("hello").content, "done")
+
+class TestRouterConfiguration(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.multiple(llm_config, _llm_router=None, _llm_router_built=False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_unknown_backend_is_a_configuration_error(self):
+        """Test that a misspelt backend name is reported by name"""
+        with mock.patch("config.settings.LLM_ROUTER_BACKENDS", ["openai", "antrhopic"]):
+            with self.assertRaises(ValueError) as raised:
+                llm_config.get_llm_router()
+        self.assertIn("antrhopic", str(raised.exception))
+
+    def test_no_configured_backend_falls_back_to_default_model(self):
+        """Test that without any backend API key the crews get crewai's default model"""
+        with mock.patch("config.settings.LLM_ROUTER_BACKENDS", ["cohere", "mistral", ""]), \
+                mock.patch.dict("os.environ", {"COHERE_API_KEY": "", "MISTRAL_API_KEY": ""}):
+            with self.assertLogs("config.llm_config", level="WARNING"):
+                self.assertIsNone(llm_config.get_routed_llm())
+            self.assertIsNone(llm_config.get_llm("router"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+os.environ.setdefault("OPENAI_API_KEY", "test-key")  # crewai's default LLM needs a key to be built
+
+from crewai import Agent, Crew, Task
+from crewai.memory.short_term.short_term_memory_item import ShortTermMemoryItem
+from utils.memory_store import MemoryStorage, MemoryStore, use_bounded_memory
+
+class TestMemoryStore(unittest.TestCase):
+    def setUp(self):
+        self.store = MemoryStore(":memory:", compact_every=0)
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_search_ranks_and_scores(self):
+        """Test that items are matched by their terms and shaped like crewai results"""
+        self.store.save("acme", "short_term", "The customer wants to add memory to a crew", {"agent": "support"})
+        self.store.save("acme", "short_term", "Billing runs on the first of the month")
+        results = self.store.search("acme", "short_term", "How do I add memory to my crew?")
+        self.assertEqual(len(results), 1)
+        self.assertIn("memory", results[0]["context"])
+        self.assertEqual(results[0]["metadata"]["agent"], "support")
+        self.assertEqual(results[0]["metadata"]["score"], 1.0)
+
+    def test_namespaces_and_kinds_are_isolated(self):
+        """Test that one customer's memories never surface for another"""
+        self.store.save("acme", "short_term", "acme crew memory settings")
+        self.store.save("globex", "short_term", "globex crew memory settings")
+        self.store.save("acme", "entities", "acme crew entity")
+        results = self.store.search("acme", "short_term", "crew memory")
+        self.assertEqual([r["context"] for r in results], ["acme crew memory settings"])
+        self.store.reset("acme", "short_term")
+        self.assertEqual(self.store.search("acme", "short_term", "crew"), [])
+        self.assertEqual(len(self.store.search("globex", "short_term", "crew")), 1)
+
+    def test_repeated_items_are_stored_once(self):
+        """Test that saving the same text again refreshes instead of duplicating"""
+        for _ in range(3):
+            self.store.save("acme", "short_term", "same observation about crews")
+        self.assertEqual(self.store.size()["entries"], 1)
+
+    def test_lru_eviction(self):
+        """Test that a namespace keeps its most recently used items"""
+        store = MemoryStore(":memory:", ttl=None, max_entries=2, compact_every=0)
+        with mock.patch("utils.memory_store.time.time") as clock:
+            for now, action in enumerate([
+                lambda: store.save("acme", "short_term", "first crew note"),
+                lambda: store.save("acme", "short_term", "second crew note"),
+                lambda: store.search("acme", "short_term", "first"),  # "second" is now the least recent
+                lambda: store.save("acme", "short_term", "third crew note"),
+            ]):
+                clock.return_value = 1000 + now
+                action()
+        contents = {r["context"] for r in store.search("acme", "short_term", "crew note", limit=5)}
+        self.assertEqual(contents, {"first crew note", "third crew note"})
+        self.assertEqual(store.stats["evicted"], 1)
+
+    def test_ttl_and_compaction(self):
+        """Test that expired items are hidden, then purged by compaction"""
+        store = MemoryStore(":memory:", ttl=10, compact_every=0)
+        with mock.patch("utils.memory_store.time.time", return_value=100):
+            store.save("acme", "short_term", "old crew note")
+        with mock.patch("utils.memory_store.time.time", return_value=200):
+            store.save("acme", "short_term", "new crew note")
+            self.assertEqual([r["context"] for r in store.search("acme", "short_term", "crew note")],
+                             ["new crew note"])
+            self.assertEqual(store.compact(), 1)
+        self.assertEqual(store.size()["entries"], 1)
+
+    def test_compaction_shrinks_file(self):
+        """Test that periodic compaction gives deleted pages back to the file system"""
+        path = os.path.join(tempfile.mkdtemp(), "memory.sqlite3")
+        store = MemoryStore(path, max_entries=10, compact_every=50)
+        for i in range(400):
+            store.save("acme", "short_term", f"note {i} " + "padding text " * 50)
+        self.assertEqual(store.size()["entries"], 10)
+        self.assertGreater(store.stats["compactions"], 0)
+        self.assertLess(store.size()["bytes"], 200 * 1024)
+        store.close()
+
+    def test_crewai_storage_adapter(self):
+        """Test the save/search/reset interface crewai's Memory classes call"""
+        storage = MemoryStorage(self.store, "acme", "short_term")
+        storage.save("Ike asked about crew memory", {"agent": "support"})
+        self.assertEqual(len(storage.search("crew memory", limit=3, score_threshold=0.35)), 1)
+        self.assertEqual(storage.search("crew memory", filter={"agent": "qa"}), [])
+        storage.reset()
+        self.assertEqual(storage.search("crew memory"), [])
+
+class TestBoundedCrewMemory(unittest.TestCase):
+    def test_crew_memory_skips_chroma(self):
+        """Test that a crew gets bounded memory without building crewai's Chroma storage"""
+        store = MemoryStore(":memory:", compact_every=0)
+        self.addCleanup(store.close)
+        agent = Agent(role="support", goal="goal", backstory="backstory")
+        with mock.patch("crewai.crew.Telemetry"):
+            crew = Crew(agents=[agent], tasks=[Task(description="d", expected_output="o", agent=agent)])
+
+        with mock.patch("crewai.memory.storage.rag_storage.RAGStorage.__init__") as rag_storage, \
+                mock.patch("crewai.memory.LongTermMemory"), \
+                mock.patch("utils.memory_store.get_memory_store", return_value=store):
+            use_bounded_memory(crew, namespace="acme")
+        rag_storage.assert_not_called()
+        self.assertTrue(crew.memory)
+
+        crew._short_term_memory.save(ShortTermMemoryItem(data="Ike asked about crew memory", agent="support"))
+        self.assertEqual(len(crew._short_term_memory.search("crew memory")), 1)
+        self.assertEqual(len(store.search("acme", "short_term", "crew memory")), 1)
+
+if __name__ == '__main__':
+    unittest.main()
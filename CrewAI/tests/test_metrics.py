@@ -0,0 +1,105 @@
+import asyncio
+import unittest
+from unittest import mock
+from utils.metrics import MetricsRegistry, get_metrics, instrument_tool, payload_size
+
+class TestMetricsRegistry(unittest.TestCase):
+    def setUp(self):
+        self.metrics = MetricsRegistry(buckets=(0.1, 1))
+
+    def test_snapshot_aggregates(self):
+        """Test that observations are aggregated per label set"""
+        self.metrics.observe("task", 0.5, payload_bytes=10, task="plan")
+        self.metrics.observe("task", 1.5, error=True, task="plan")
+        self.metrics.observe("task", 0.2, task="edit")
+        series = {s["labels"]["task"]: s for s in self.metrics.snapshot()["task"]}
+        self.assertEqual(series["plan"]["count"], 2)
+        self.assertEqual(series["plan"]["errors"], 1)
+        self.assertEqual(series["plan"]["payload_bytes"], 10)
+        self.assertAlmostEqual(series["plan"]["mean_s"], 1.0)
+        self.assertEqual(series["edit"]["max_s"], 0.2)
+
+    def test_timer_records_errors(self):
+        """Test that the timer marks failed blocks as errors and re-raises"""
+        with self.assertRaises(ValueError):
+            with self.metrics.timer("tool", tool="search"):
+                raise ValueError("boom")
+        self.assertEqual(self.metrics.snapshot()["tool"][0]["errors"], 1)
+
+    def test_prometheus_format(self):
+        """Test the Prometheus exposition output"""
+        self.metrics.observe("tool", 0.05, tool='Travel "Guide"')
+        text = self.metrics.to_prometheus()
+        self.assertIn("# TYPE crewai_tool_duration_seconds histogram", text)
+        self.assertIn('crewai_tool_duration_seconds_bucket{tool="Travel \\"Guide\\"",le="0.1"} 1', text)
+        self.assertIn('crewai_tool_duration_seconds_bucket{tool="Travel \\"Guide\\"",le="+Inf"} 1', text)
+        self.assertIn('crewai_tool_duration_seconds_count{tool="Travel \\"Guide\\""} 1', text)
+
+    def test_prometheus_families_are_grouped(self):
+        """Test that each family's samples directly follow its own TYPE line"""
+        self.metrics.observe("tool", 0.05, tool="search")
+        self.metrics.observe("tool", 0.5, tool="scrape", error=True)
+        family = None
+        for line in self.metrics.to_prometheus().splitlines():
+            if line.startswith("# TYPE"):
+                family = line.split()[2]
+            elif not line.startswith("#"):
+                name = line.split("{")[0]
+                self.assertIn(name, (family, f"{family}_bucket", f"{family}_sum", f"{family}_count"))
+
+    def test_payload_size(self):
+        """Test payload sizes of strings and lists"""
+        self.assertEqual(payload_size(["ab", "cd"]), 4)
+        self.assertEqual(payload_size(None), 0)
+
+    def test_disabled_registry_records_nothing(self):
+        """Test that METRICS_ENABLED=false turns recording off"""
+        metrics = MetricsRegistry(enabled=None)
+        with mock.patch("config.settings.METRICS_ENABLED", False):
+            with metrics.timer("serper", kind="weather"):
+                pass
+        metrics.observe("tool", 0.1, tool="search")
+        self.assertEqual(metrics.snapshot(), {})
+
+class TestInstrumentTool(unittest.TestCase):
+    class Tool:
+        name = "Probe Tool"
+
+        @instrument_tool
+        def _run(self, text):
+            return self.inner(text)
+
+        @instrument_tool
+        def inner(self, text):
+            return text
+
+        @instrument_tool
+        async def _arun(self, text):
+            await asyncio.sleep(0)
+            return self._run(text)
+
+    def setUp(self):
+        get_metrics().reset()
+
+    def tool_series(self):
+        return get_metrics().snapshot()["tool"]
+
+    def test_nested_calls_recorded_once(self):
+        """Test that a wrapper calling the same tool is counted as one call"""
+        self.Tool()._run("abc")
+        self.assertEqual(self.tool_series()[0]["count"], 1)
+        self.assertEqual(self.tool_series()[0]["payload_bytes"], 3)
+
+    def test_async_run(self):
+        """Test that coroutine methods are timed too"""
+        self.assertEqual(asyncio.run(self.Tool()._arun("abcd")), "abcd")
+        self.assertEqual(self.tool_series()[0]["count"], 1)
+
+    def test_not_recorded_when_disabled(self):
+        """Test that instrumented tools are not timed while metrics are off"""
+        with mock.patch.object(get_metrics(), "enabled", False):
+            self.Tool()._run("abc")
+        self.assertEqual(get_metrics().snapshot(), {})
+
+if __name__ == '__main__':
+    unittest.main()
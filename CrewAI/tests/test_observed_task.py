@@ -0,0 +1,52 @@
+import os
+import unittest
+from unittest import mock
+
+os.environ.setdefault("OPENAI_API_KEY", "test-key")  # crewai's default LLM needs a key to be built
+
+from crewai import Agent
+from crewai.tasks.task_output import TaskOutput
+from tasks.observed_task import ObservedTask
+
+def agent(role="coordinator"):
+    return Agent(role=role, goal="goal", backstory="backstory")
+
+def observed_task(name, **kwargs):
+    return ObservedTask(name=name, description=f"{name} description", expected_output="output",
+                        agent=kwargs.pop("agent", None) or agent(), **kwargs)
+
+def run_agent(results):
+    """Stand-in for Agent.execute_task returning (or raising) a result per task name"""
+    def execute_task(task, context=None, tools=None):
+        result = results[task.name]
+        if isinstance(result, Exception):
+            raise result
+        return result if context is None else f"{result} <- {context}"
+    return execute_task
+
+class TestObservedTask(unittest.TestCase):
+    def test_failed_async_task_reports_to_dependents(self):
+        """Test that a dependent task sees the failure of an async task instead of a stale output"""
+        search = observed_task("search_tickets", async_execution=True)
+        summary = observed_task("summarize", context=[search])
+        search.output = TaskOutput(description="previous run", raw_output="last customer's tickets")
+
+        results = {"search_tickets": RuntimeError("Serper down"), "summarize": "summary"}
+        with mock.patch.object(Agent, "execute_task", side_effect=run_agent(results)):
+            search.execute()
+            answer = summary.execute()
+
+        self.assertNotIn("last customer's tickets", answer)
+        self.assertIn("Task 'search_tickets' failed", answer)
+        self.assertIn("Serper down", answer)
+
+    def test_failed_sync_task_raises(self):
+        """Test that a synchronous task still raises its error"""
+        task = observed_task("plan")
+        with mock.patch.object(Agent, "execute_task", side_effect=run_agent({"plan": ValueError("bad")})):
+            with self.assertRaises(ValueError):
+                task.execute()
+        self.assertIsNone(task.output)
+
+if __name__ == '__main__':
+    unittest.main()
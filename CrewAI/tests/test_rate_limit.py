@@ -0,0 +1,145 @@
+import asyncio
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+from langchain_core.caches import InMemoryCache
+from langchain_core.language_models import FakeListChatModel
+from utils.metrics import get_metrics
+from utils.rate_limit import RateLimiter, RateLimitTimeout
+from utils.rate_limited_llm import pace_llm
+from utils.resilience import CircuitBreaker, Deadline, call_with_retries, is_transient, is_unavailable
+
+LIMITS = {"serper": {"rpm": 60}, "openai": {"rpm": 600, "tpm": 600}}
+
+class TestRateLimiter(unittest.TestCase):
+    def setUp(self):
+        self.limiter = RateLimiter(":memory:", LIMITS)
+        clock = mock.patch("utils.rate_limit.time.time", return_value=1000.0)
+        clock.start()
+        self.addCleanup(clock.stop)
+
+    def test_requests_queue_at_the_quota_rate(self):
+        """Test that requests beyond the burst wait one refill interval each, in order"""
+        waits = [self.limiter.reserve("serper") for _ in range(3)]
+        self.assertEqual(waits, [0.0, 1.0, 2.0])
+        self.assertEqual(self.limiter.reserve("unlimited"), 0.0)
+
+    def test_max_wait_reserves_nothing(self):
+        """Test that a call refused for waiting too long leaves the queue unchanged"""
+        self.limiter.reserve("serper")
+        with self.assertRaises(RateLimitTimeout):
+            self.limiter.reserve("serper", max_wait=0.5)
+        self.assertEqual(self.limiter.reserve("serper"), 1.0)
+
+    def test_tokens_are_settled(self):
+        """Test that token estimates are paced and refunded once the real usage is known"""
+        self.assertEqual(self.limiter.reserve("openai", tokens=600), 0.0)
+        self.assertEqual(self.limiter.reserve("openai", tokens=10), 1.0)
+        self.limiter.settle("openai", -20)
+        self.assertEqual(self.limiter.reserve("openai", tokens=10), 0.0)
+
+    def test_token_bucket_holds_a_minute_of_quota(self):
+        """Test that a call may use a whole idle minute of TPM, and a bigger one fails at once"""
+        self.assertEqual(self.limiter.reserve("openai", tokens=590), 0.0)
+        with self.assertRaises(RateLimitTimeout):
+            self.limiter.reserve("openai", tokens=601)
+        self.assertEqual(self.limiter.reserve("openai", tokens=10), 0.0)
+
+    def test_failed_settle_rolls_back(self):
+        """Test that an SQLite error while settling leaves no transaction open"""
+        with mock.patch.object(self.limiter, "_store", side_effect=sqlite3.OperationalError("disk I/O error")):
+            with self.assertRaises(sqlite3.OperationalError):
+                self.limiter.settle("openai", 10)
+        self.assertFalse(self.limiter._conn.in_transaction)
+        self.assertEqual(self.limiter.reserve("openai", tokens=10), 0.0)
+
+    def test_acquire_sleeps_and_records_wait(self):
+        """Test that acquire sleeps through the reserved wait and records it"""
+        get_metrics().reset()
+        with mock.patch("utils.rate_limit.time.sleep") as sleep:
+            self.limiter.acquire("serper")
+            self.limiter.acquire("serper")
+        sleep.assert_called_once_with(1.0)
+        series = get_metrics().snapshot()["rate_limit_wait"][0]
+        self.assertEqual((series["labels"], series["count"], series["max_s"]), ({"provider": "serper"}, 2, 1.0))
+
+    def test_aacquire_waits_without_blocking(self):
+        """Test that the async acquire reserves off the loop and sleeps through the wait"""
+        async def acquire_twice():
+            with mock.patch("utils.rate_limit.asyncio.sleep") as sleep:
+                waits = [await self.limiter.aacquire("serper") for _ in range(2)]
+            return waits, sleep
+
+        waits, sleep = asyncio.run(acquire_twice())
+        self.assertEqual(waits, [0.0, 1.0])
+        sleep.assert_called_once_with(1.0)
+
+class TestRateLimitedLLM(unittest.TestCase):
+    def setUp(self):
+        self.limiter = RateLimiter(":memory:", LIMITS)
+        self.reserve = mock.patch.object(self.limiter, "reserve", wraps=self.limiter.reserve).start()
+        patcher = mock.patch("utils.rate_limited_llm.get_rate_limiter", return_value=self.limiter)
+        patcher.start()
+        # Each call reserves more tokens than LIMITS refills in a second: skip the waits
+        mock.patch("utils.rate_limit.time.sleep").start()
+        mock.patch("utils.rate_limit.asyncio.sleep").start()
+        self.addCleanup(mock.patch.stopall)
+
+    def paced_llm(self, **kwargs):
+        return pace_llm(FakeListChatModel(responses=["first", "second"], **kwargs), "openai")
+
+    def test_cache_hits_take_no_quota(self):
+        """Test that a completion served from the LLM cache is not paced"""
+        llm = self.paced_llm(cache=InMemoryCache())
+        self.assertEqual(llm.invoke("hello").content, "first")
+        self.assertEqual(llm.invoke("hello").content, "first")
+        self.assertEqual(self.reserve.call_count, 1)
+
+    def test_async_calls_are_paced_once(self):
+        """Test that an async call running the sync model in a thread reserves a single time"""
+        llm = self.paced_llm()
+        self.assertEqual(asyncio.run(llm.ainvoke("hello")).content, "first")
+        self.assertEqual(self.reserve.call_count, 1)
+
+    def test_wrapping_twice_paces_once(self):
+        """Test that pacing a model that is already paced changes nothing"""
+        llm = self.paced_llm()
+        self.assertIs(pace_llm(llm, "openai"), llm)
+        llm.invoke("hello")
+        self.assertEqual(self.reserve.call_count, 1)
+
+class TestSharedRateLimiter(unittest.TestCase):
+    def test_buckets_are_shared_through_the_file(self):
+        """Test that separate limiters on the same file draw from one quota"""
+        path = os.path.join(tempfile.mkdtemp(), "rate_limits.sqlite3")
+        first, second = RateLimiter(path, LIMITS), RateLimiter(path, LIMITS)
+        self.addCleanup(first.close)
+        self.addCleanup(second.close)
+        self.assertEqual(first.reserve("serper"), 0.0)
+        self.assertGreater(second.reserve("serper"), 0.9)
+
+class TestRateLimitResilience(unittest.TestCase):
+    def test_quota_timeout_is_not_retried_or_counted(self):
+        """Test that a used-up quota fails the call without touching the circuit"""
+        error = RateLimitTimeout("quota")
+        self.assertFalse(is_transient(error))
+        self.assertTrue(is_unavailable(error))
+
+        breaker = CircuitBreaker("serper", failure_threshold=1)
+        breaker.record_failure()
+        breaker.opened_at -= breaker.reset_timeout
+        calls = []
+
+        def call(timeout):
+            calls.append(timeout)
+            raise error
+
+        with self.assertRaises(RateLimitTimeout):
+            call_with_retries(call, Deadline(5), breaker=breaker)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(breaker.state, "half_open")
+
+if __name__ == '__main__':
+    unittest.main()
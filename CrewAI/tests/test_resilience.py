@@ -0,0 +1,112 @@
+import asyncio
+import time
+import unittest
+from types import SimpleNamespace
+from utils.resilience import (
+    CircuitBreaker, CircuitOpenError, Deadline, RetryBudget, acall_with_retries, call_with_retries,
+    is_transient
+)
+
+class Flaky:
+    """Call failing with the given errors before succeeding"""
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.timeouts = []
+
+    def __call__(self, timeout):
+        self.timeouts.append(timeout)
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+def http_error(status):
+    error = Exception(f"HTTP {status}")
+    error.response = SimpleNamespace(status_code=status)
+    return error
+
+class TestResilience(unittest.TestCase):
+    def test_transient_errors(self):
+        """Test which errors are retried"""
+        self.assertTrue(is_transient(TimeoutError()))
+        self.assertTrue(is_transient(http_error(503)))
+        self.assertTrue(is_transient(http_error(429)))
+        self.assertFalse(is_transient(http_error(401)))
+        self.assertFalse(is_transient(CircuitOpenError()))
+
+    def test_retries_transient_failures(self):
+        """Test that transient failures are retried within the attempt limit"""
+        call = Flaky(TimeoutError(), http_error(502))
+        self.assertEqual(call_with_retries(call, Deadline(5), base_delay=0), "ok")
+        self.assertEqual(len(call.timeouts), 3)
+
+    def test_client_errors_are_not_retried(self):
+        """Test that a rejected request fails on the first attempt"""
+        call = Flaky(http_error(400))
+        with self.assertRaises(Exception):
+            call_with_retries(call, Deadline(5), base_delay=0)
+        self.assertEqual(len(call.timeouts), 1)
+
+    def test_attempts_share_the_deadline(self):
+        """Test that each attempt's timeout is capped by the time left"""
+        call = Flaky()
+        call_with_retries(call, Deadline(0.5), attempt_timeout=2)
+        self.assertLessEqual(call.timeouts[0], 0.5)
+
+    def test_retry_budget(self):
+        """Test that retries stop once the shared budget is spent"""
+        budget = RetryBudget(ratio=0.0, min_retries=1, window=60)
+        self.assertEqual(call_with_retries(Flaky(TimeoutError()), Deadline(5), budget=budget, base_delay=0), "ok")
+        call = Flaky(TimeoutError())
+        with self.assertRaises(TimeoutError):
+            call_with_retries(call, Deadline(5), budget=budget, base_delay=0)
+        self.assertEqual(len(call.timeouts), 1)
+        self.assertEqual(budget.denied, 1)
+
+    def test_circuit_breaker(self):
+        """Test that the circuit opens, fails fast, and closes after a successful trial"""
+        breaker = CircuitBreaker("serper", failure_threshold=2, reset_timeout=0.05)
+        # The second failure opens the circuit, so the third attempt is not made
+        with self.assertRaises(CircuitOpenError) as raised:
+            call_with_retries(Flaky(TimeoutError(), TimeoutError()), Deadline(5), breaker=breaker, base_delay=0)
+        self.assertIsInstance(raised.exception.__cause__, TimeoutError)
+        self.assertEqual(breaker.state, "open")
+
+        call = Flaky()
+        with self.assertRaises(CircuitOpenError):
+            call_with_retries(call, Deadline(5), breaker=breaker)
+        self.assertEqual(call.timeouts, [])
+
+        time.sleep(0.06)
+        self.assertEqual(call_with_retries(call, Deadline(5), breaker=breaker), "ok")
+        self.assertEqual(breaker.state, "closed")
+
+    def test_cancelled_trial_hands_back_its_slot(self):
+        """Test that a half-open trial ending without an outcome lets the next call be the trial"""
+        breaker = CircuitBreaker("serper", failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+
+        async def cancelled(timeout):
+            raise asyncio.CancelledError()
+
+        with self.assertRaises(asyncio.CancelledError):
+            asyncio.run(acall_with_retries(cancelled, Deadline(5), breaker=breaker))
+        self.assertEqual(breaker.state, "half_open")
+        self.assertTrue(breaker.allow())
+        self.assertFalse(breaker.allow())  # Only one trial at a time
+        breaker.release()
+        self.assertEqual(call_with_retries(Flaky(), Deadline(5), breaker=breaker), "ok")
+        self.assertEqual(breaker.state, "closed")
+
+    def test_async_retries(self):
+        """Test the async variant"""
+        flaky = Flaky(ConnectionError())
+
+        async def call(timeout):
+            return flaky(timeout)
+
+        result = asyncio.run(acall_with_retries(call, Deadline(5), base_delay=0))
+        self.assertEqual(result, "ok")
+        self.assertEqual(len(flaky.timeouts), 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import asyncio
+import os
+import subprocess
+import sys
+import threading
+import unittest
+from unittest import mock
+from tools import serper_search
+
+class TestSerperSearch(unittest.TestCase):
+    def test_import_stays_light(self):
+        """Test that the search helpers do not pull in crewai_tools"""
+        code = "import sys, tools.serper_search; print('crewai_tools' in sys.modules)"
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True)
+        self.assertEqual(output.stdout.strip(), "False")
+
+    def test_missing_api_key_is_a_configuration_error(self):
+        """Test that a search without SERPER_API_KEY names the missing setting"""
+        with mock.patch("config.settings.SERPER_API_KEY", None), mock.patch.dict("os.environ", clear=True):
+            with self.assertRaises(ValueError) as raised:
+                serper_search.serper_request("weather in Lisbon", read_timeout=1)
+        self.assertIn("SERPER_API_KEY", str(raised.exception))
+
+    def test_api_key_from_settings(self):
+        """Test that the configured key is sent with the request"""
+        with mock.patch("config.settings.SERPER_API_KEY", "settings-key"):
+            _, payload, headers, _ = serper_search._request_args("weather", None, 5, 2.0)
+        self.assertEqual(headers["X-API-KEY"], "settings-key")
+        self.assertEqual(payload, {"q": "weather", "num": 5})
+
+    def test_async_search_keeps_the_cache_off_the_loop(self):
+        """Test that the async search reads and writes the SQLite cache from worker threads"""
+        threads = []
+        cache = mock.Mock()
+        cache.get.side_effect = lambda *args, **kwargs: threads.append(threading.current_thread())
+        cache.set.side_effect = lambda *args, **kwargs: threads.append(threading.current_thread())
+
+        async def search():
+            threads.append(threading.current_thread())  # The loop's thread
+            return await serper_search.acached_search_results("weather in Lisbon", kind="weather")
+
+        async def answer(*args, **kwargs):
+            return {"organic": []}
+
+        with mock.patch("tools.serper_search.get_search_cache", return_value=cache), \
+                mock.patch("tools.serper_search.aserper_request", side_effect=answer):
+            self.assertEqual(asyncio.run(search()), {"organic": []})
+        loop_thread, cache_threads = threads[0], threads[1:]
+        self.assertEqual(len(cache_threads), 2)
+        self.assertNotIn(loop_thread, cache_threads)
+
+if __name__ == '__main__':
+    unittest.main()
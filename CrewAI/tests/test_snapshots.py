@@ -0,0 +1,73 @@
+import threading
+import time
+import unittest
+from utils.snapshots import SnapshotStore
+
+class FakePage:
+    """Fetcher standing in for the network, answering 304 to a matching ETag"""
+    def __init__(self, body="<p>docs</p>", etag='"v1"', cache_control=None):
+        self.body = body
+        self.etag = etag
+        self.cache_control = cache_control
+        self.requests = []
+
+    def __call__(self, url, headers, timeout):
+        self.requests.append(dict(headers))
+        response_headers = {"ETag": self.etag}
+        if self.cache_control:
+            response_headers["Cache-Control"] = self.cache_control
+        if headers.get("If-None-Match") == self.etag:
+            return 304, response_headers, b""
+        return 200, response_headers, self.body
+
+class TestSnapshotStore(unittest.TestCase):
+    def make_store(self, page, **kwargs):
+        return SnapshotStore(":memory:", fetch=page, extract=str.upper, **kwargs)
+
+    def test_fresh_snapshot_skips_network(self):
+        """Test that a fresh snapshot is served without fetching again"""
+        page = FakePage()
+        store = self.make_store(page)
+        self.assertEqual(store.get_text("http://docs"), "<P>DOCS</P>")
+        self.assertEqual(store.get_text("http://docs"), "<P>DOCS</P>")
+        self.assertEqual(len(page.requests), 1)
+        self.assertEqual(store.stats["fresh"], 1)
+
+    def test_stale_snapshot_revalidates(self):
+        """Test the conditional refresh: unchanged pages answer 304, changed pages are re-extracted"""
+        page = FakePage(cache_control="max-age=0")
+        store = self.make_store(page, min_refresh_interval=0)
+        store.get_text("http://docs")
+        time.sleep(0.01)
+        self.assertEqual(store.get_text("http://docs"), "<P>DOCS</P>")
+        self.assertEqual(page.requests[-1], {"If-None-Match": '"v1"'})
+        self.assertEqual(store.stats["revalidated"], 1)
+
+        page.body, page.etag = "<p>new</p>", '"v2"'
+        store.invalidate("http://docs")
+        self.assertEqual(store.get_text("http://docs"), "<P>NEW</P>")
+
+    def test_failed_refresh_serves_last_snapshot(self):
+        """Test that a network failure falls back to the stored copy"""
+        page = FakePage()
+        store = self.make_store(page)
+        store.get_text("http://docs")
+        store.invalidate("http://docs")
+        store.fetch = lambda *args: (_ for _ in ()).throw(ConnectionError("offline"))
+        self.assertEqual(store.get_text("http://docs"), "<P>DOCS</P>")
+        self.assertEqual(store.stats["stale_served"], 1)
+
+    def test_concurrent_readers_share_one_download(self):
+        """Test that concurrent first reads download the page once"""
+        page = FakePage()
+        slow_page = lambda *args: (time.sleep(0.05), page(*args))[1]
+        store = self.make_store(slow_page)
+        threads = [threading.Thread(target=store.get_text, args=("http://docs",)) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(page.requests), 1)
+
+if __name__ == '__main__':
+    unittest.main()
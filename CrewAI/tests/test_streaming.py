@@ -0,0 +1,201 @@
+import asyncio
+import os
+import threading
+import unittest
+from unittest import mock
+
+os.environ.setdefault("OPENAI_API_KEY", "test-key")  # crewai's default LLM needs a key to be built
+
+from crewai import Agent
+from crews.streaming import astream_crew, stream_crew
+from tasks.observed_task import ObservedTask
+from utils.events import current_task, emit
+
+def observed_task(name, **kwargs):
+    return ObservedTask(name=name, description=f"{name} description", expected_output="output",
+                        agent=Agent(role="coordinator", goal="goal", backstory="backstory"), **kwargs)
+
+class TaskTemplate:
+    """Stand-in for a CrewTemplate running its tasks in order, as a sequential crew does"""
+    name = "test"
+
+    def __init__(self, tasks):
+        self.tasks = tasks
+        self.finished = threading.Event()
+
+    def kickoff(self, inputs=None):
+        try:
+            result = None
+            for task in self.tasks:
+                result = task.execute()
+            return result
+        finally:
+            self.finished.set()
+
+def streaming_agent(results):
+    """Stand-in for Agent.execute_task streaming its result as one token, from the task's own context"""
+    def execute_task(task, context=None, tools=None):
+        result = results[task.name]
+        if isinstance(result, Exception):
+            raise result
+        emit("token", text=result, seen_task=(current_task() or {}).get("task"))
+        return result
+    return execute_task
+
+def held_agent(started, release, executed, tokens=1):
+    """Stand-in for Agent.execute_task streaming ``tokens`` chunks, then holding until released"""
+    def execute_task(task, context=None, tools=None):
+        executed.append(task.name)
+        for _ in range(tokens):
+            emit("token", text="chunk")
+        started.set()
+        release.wait(timeout=5)
+        return task.name
+    return execute_task
+
+def summary(events):
+    return [(event["type"], event.get("task")) for event in events]
+
+class TestStreamCrew(unittest.TestCase):
+    def setUp(self):
+        self.tasks = [observed_task("plan"),
+                      observed_task("search_tickets", async_execution=True)]
+        self.tasks.append(observed_task("summarize", context=[self.tasks[1]]))
+        self.template = TaskTemplate(self.tasks)
+
+    def stream(self, results, **kwargs):
+        with mock.patch.object(Agent, "execute_task", side_effect=streaming_agent(results)):
+            return list(stream_crew(self.template, {}, **kwargs))
+
+    def test_events_arrive_in_run_order(self):
+        """Test that every task's events arrive between crew_started and crew_finished, in task order"""
+        results = {"plan": "plan", "search_tickets": "tickets", "summarize": "summary"}
+        events = self.stream(results, tokens="all")
+
+        self.assertEqual(summary(events), [
+            ("crew_started", None),
+            ("task_started", "plan"), ("token", "plan"), ("task_finished", "plan"),
+            ("task_started", "search_tickets"), ("token", "search_tickets"),
+            ("task_finished", "search_tickets"),
+            ("task_started", "summarize"), ("token", "summarize"), ("task_finished", "summarize"),
+            ("crew_finished", None),
+        ])
+        self.assertEqual(events[-1]["result"], "summary")
+        times = [event["time"] for event in events]
+        self.assertEqual(times, sorted(times))
+
+    def test_async_task_runs_in_callers_context(self):
+        """Test that an async task's thread sees its own task scope and reaches the run's sink"""
+        results = {"plan": "plan", "search_tickets": "tickets", "summarize": "summary"}
+        events = self.stream(results, tokens="all")
+
+        [token] = [event for event in events if event["type"] == "token" and event["text"] == "tickets"]
+        self.assertEqual((token["task"], token["seen_task"]), ("search_tickets", "search_tickets"))
+        self.assertEqual(token["agent"], "coordinator")
+
+    def test_only_final_task_tokens_by_default(self):
+        """Test that tokens of other tasks are dropped unless all tokens were requested"""
+        results = {"plan": "plan", "search_tickets": "tickets", "summarize": "summary"}
+        events = self.stream(results, final_task="summarize")
+        self.assertEqual([event["text"] for event in events if event["type"] == "token"], ["summary"])
+        events = self.stream(results, final_task="summarize", tokens="none")
+        self.assertNotIn("token", [event["type"] for event in events])
+
+    def test_failed_async_task_is_reported_and_run_continues(self):
+        """Test that a failed async task emits task_failed and its dependents still run"""
+        results = {"plan": "plan", "search_tickets": RuntimeError("Serper down"), "summarize": "summary"}
+        events = self.stream(results, tokens="none")
+
+        self.assertEqual(summary(events)[3:7], [
+            ("task_started", "search_tickets"), ("task_failed", "search_tickets"),
+            ("task_started", "summarize"), ("task_finished", "summarize"),
+        ])
+        self.assertIn("Serper down", events[4]["error"])
+        self.assertGreaterEqual(events[4]["duration"], 0)
+        self.assertEqual(events[-1]["type"], "crew_finished")
+
+    def test_failed_sync_task_fails_the_crew(self):
+        """Test that a failed sync task emits task_failed, then crew_failed, and no later task runs"""
+        results = {"plan": ValueError("bad plan"), "search_tickets": "tickets", "summarize": "summary"}
+        events = self.stream(results)
+
+        self.assertEqual(summary(events), [
+            ("crew_started", None), ("task_started", "plan"), ("task_failed", "plan"), ("crew_failed", None),
+        ])
+        self.assertIn("bad plan", events[2]["error"])
+        self.assertIn("bad plan", events[3]["error"])
+
+    def test_astream_crew_yields_the_same_events(self):
+        """Test that the async iterator delivers the same events in the same order"""
+        results = {"plan": "plan", "search_tickets": "tickets", "summarize": "summary"}
+
+        async def collect():
+            return [event async for event in astream_crew(self.template, {}, tokens="all")]
+
+        with mock.patch.object(Agent, "execute_task", side_effect=streaming_agent(results)):
+            events = asyncio.run(collect())
+        self.assertEqual(summary(events), summary(self.stream(results, tokens="all")))
+
+class TestStoppedStream(unittest.TestCase):
+    def setUp(self):
+        tasks = [observed_task("plan"), observed_task("search_tickets", async_execution=True)]
+        tasks.append(observed_task("summarize", context=[tasks[1]]))
+        self.template = TaskTemplate(tasks)
+        self.started, self.release, self.executed = threading.Event(), threading.Event(), []
+        patcher = mock.patch.object(Agent, "execute_task",
+                                    side_effect=held_agent(self.started, self.release, self.executed))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.release.set)
+
+    def test_closed_stream_stops_the_crew_at_the_next_task(self):
+        """Test that closing the generator lets the running task finish and starts no other"""
+        stream = stream_crew(self.template, {})
+        self.assertEqual(summary([next(stream), next(stream)]), [("crew_started", None), ("task_started", "plan")])
+        self.assertTrue(self.started.wait(timeout=5))
+        stream.close()
+        self.release.set()
+
+        self.assertTrue(self.template.finished.wait(timeout=5))
+        self.assertEqual(self.executed, ["plan"])
+
+    def test_closed_async_stream_stops_the_crew(self):
+        """Test that aclose() on the async iterator stops the crew at its next task"""
+        async def read_two_events():
+            stream = astream_crew(self.template, {})
+            events = [await stream.__anext__(), await stream.__anext__()]
+            await stream.aclose()
+            return events
+
+        events = asyncio.run(read_two_events())
+        self.assertEqual(summary(events), [("crew_started", None), ("task_started", "plan")])
+        self.release.set()
+        self.assertTrue(self.template.finished.wait(timeout=5))
+        self.assertEqual(self.executed, ["plan"])
+
+    def test_full_queue_drops_tokens_only(self):
+        """Test that a lagging reader loses token chunks but keeps every other event"""
+        self.release.set()
+        patcher = mock.patch.object(Agent, "execute_task",
+                                    side_effect=held_agent(self.started, self.release, self.executed, tokens=20))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        with mock.patch("config.settings.STREAM_QUEUE_SIZE", 3):
+            stream = stream_crew(self.template, {}, tokens="all")
+            first = next(stream)
+            self.assertTrue(self.started.wait(timeout=5))
+            events = [first] + list(stream)
+
+        tokens = [event for event in events if event["type"] == "token"]
+        self.assertLess(len(tokens), 60)
+        self.assertEqual(summary(event for event in events if event["type"] != "token"), [
+            ("crew_started", None),
+            ("task_started", "plan"), ("task_finished", "plan"),
+            ("task_started", "search_tickets"), ("task_finished", "search_tickets"),
+            ("task_started", "summarize"), ("task_finished", "summarize"),
+            ("crew_finished", None),
+        ])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+import importlib.util
+import unittest
+from unittest import mock
+
+@unittest.skipUnless(importlib.util.find_spec("crewai_tools"), "crewai_tools is not installed")
+class TestSupportDocsSearchTool(unittest.TestCase):
+    def setUp(self):
+        from tools.support_docs_tool import SupportDocsSearchTool
+
+        self.index = mock.Mock()
+        self.ingest = mock.patch("tools.support_docs_tool.ingest_support_docs").start()
+        mock.patch("tools.support_docs_tool.get_support_docs_index", return_value=self.index).start()
+        self.addCleanup(mock.patch.stopall)
+        self.tool = SupportDocsSearchTool(docs_urls=["https://docs.example.com/crews"], top_k=2)
+
+    def test_returns_ranked_passages_with_sources(self):
+        """Test that the tool lists the index's passages in rank order, with their sources"""
+        self.index.search.return_value = [
+            {"text": "Set memory=True.", "source": "https://docs.example.com/crews", "position": 3, "distance": 0.1},
+            {"text": "Memory uses embeddings.", "source": "https://docs.example.com/crews", "position": 4,
+             "distance": 0.2},
+        ]
+        answer = self.tool._run(search_query="How do I add memory?")
+        self.assertEqual(answer, "[1] (source: https://docs.example.com/crews)\nSet memory=True.\n\n"
+                                 "[2] (source: https://docs.example.com/crews)\nMemory uses embeddings.")
+        self.index.search.assert_called_once_with("How do I add memory?", k=2)
+
+    def test_ingestion_is_rate_limited(self):
+        """Test that the tool asks for re-ingestion only once the refresh interval has passed"""
+        from config.settings import SUPPORT_DOCS_REFRESH_INTERVAL
+
+        self.index.search.return_value = []
+        self.assertEqual(self.tool._run(search_query="unknown"), "No relevant documentation found.")
+        self.ingest.assert_called_once_with(["https://docs.example.com/crews"], max_age=SUPPORT_DOCS_REFRESH_INTERVAL)
+
+if __name__ == '__main__':
+    unittest.main()
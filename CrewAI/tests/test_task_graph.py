@@ -0,0 +1,84 @@
+import os
+import unittest
+from types import SimpleNamespace
+
+os.environ.setdefault("OPENAI_API_KEY", "test-key")  # crewai's default LLM needs a key to be built
+
+from crewai import Agent
+from crewai.utilities.token_counter_callback import TokenCalcHandler
+from crews.task_graph import crew_agents, schedule_tasks
+
+class FakeAgent:
+    def __init__(self, role):
+        self.role = role
+
+    def model_copy(self, update=None):
+        return FakeAgent(self.role)
+
+def task(name, agent, depends_on=None):
+    return SimpleNamespace(name=name, agent=agent, depends_on=depends_on,
+                           context=None, async_execution=False)
+
+class TestTaskGraph(unittest.TestCase):
+    def test_independent_tasks_run_async(self):
+        """Test the travel graph: both searches run concurrently and are joined"""
+        planner, coordinator = FakeAgent("planner"), FakeAgent("coordinator")
+        tasks = schedule_tasks([
+            task("gather_info", planner, []),
+            task("search_tickets", coordinator, ["gather_info"]),
+            task("travel_guide", coordinator, ["gather_info"]),
+            task("summarize_travel_info", planner, ["search_tickets", "travel_guide"]),
+        ])
+        flags = {t.name: t.async_execution for t in tasks}
+        self.assertEqual(flags, {"gather_info": False, "search_tickets": True,
+                                 "travel_guide": True, "summarize_travel_info": False})
+        self.assertEqual([c.name for c in tasks[3].context], ["search_tickets", "travel_guide"])
+        # The concurrent tasks must not share an agent object
+        self.assertIsNot(tasks[1].agent, tasks[2].agent)
+        self.assertEqual(len(crew_agents(tasks)), 3)
+
+    def test_agent_copy_counts_its_own_tokens(self):
+        """Test that concurrent tasks of one agent feed separate token counters"""
+        coordinator = Agent(role="coordinator", goal="goal", backstory="backstory")
+        tasks = schedule_tasks([
+            task("gather_info", coordinator, []),
+            task("search_tickets", coordinator, ["gather_info"]),
+            task("travel_guide", coordinator, ["gather_info"]),
+            task("summarize_travel_info", coordinator, ["search_tickets", "travel_guide"]),
+        ])
+        original, copy = tasks[1].agent, tasks[2].agent
+        self.assertIs(original, coordinator)
+        self.assertIsNot(copy._token_process, original._token_process)
+
+        def counters(agent):
+            return [c.token_cost_process for c in agent.llm.callbacks if isinstance(c, TokenCalcHandler)]
+        self.assertEqual(counters(original), [original._token_process])
+        self.assertEqual(counters(copy), [copy._token_process])
+
+    def test_chain_stays_sequential(self):
+        """Test that undeclared dependencies keep the plain sequential order"""
+        agent = FakeAgent("writer")
+        tasks = schedule_tasks([task("plan", agent), task("write", agent), task("edit", agent)])
+        self.assertFalse(any(t.async_execution for t in tasks))
+        self.assertIsNone(tasks[0].context)
+        self.assertEqual(tasks[2].context, [tasks[1]])
+        self.assertEqual(crew_agents(tasks), [agent])
+
+    def test_dependency_order(self):
+        """Test that tasks are reordered after the tasks they depend on"""
+        agent = FakeAgent("a")
+        tasks = schedule_tasks([task("second", agent, ["first"]), task("first", agent, [])])
+        self.assertEqual([t.name for t in tasks], ["first", "second"])
+
+    def test_invalid_graphs(self):
+        """Test that cycles, unknown and duplicate names are rejected"""
+        agent = FakeAgent("a")
+        with self.assertRaises(ValueError):
+            schedule_tasks([task("a", agent, ["b"]), task("b", agent, ["a"])])
+        with self.assertRaises(ValueError):
+            schedule_tasks([task("a", agent, ["missing"])])
+        with self.assertRaises(ValueError):
+            schedule_tasks([task("a", agent), task("a", agent)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import importlib.util
+import unittest
+from datetime import date, timedelta
+from unittest import mock
+
+def ticket_request(**overrides):
+    """Ticket search arguments for a one-way trip, with the given changes"""
+    request = {
+        "full_name": "Jane Doe", "email": "jane@example.com",
+        "traveling_from": "Lisbon", "traveling_to": "Porto", "travel_date": "2099-05-10",
+        "flight_class": "economy", "luggage_number": 1, "travel_companions": 0,
+    }
+    request.update(overrides)
+    return request
+
+def flight(title, link, price):
+    return {"title": title, "link": link, "snippet": f"Fares from ${price}"}
+
+@unittest.skipUnless(importlib.util.find_spec("crewai_tools"), "crewai_tools is not installed")
+class TestTicketSearchTool(unittest.TestCase):
+    def setUp(self):
+        from tools.ticket_search_tool import TicketSearchTool
+
+        self.tool = TicketSearchTool()
+        self.queries = []
+
+    def search_results(self, results_by_date):
+        """Stand-in for acached_search_results answering (or raising) per searched date"""
+        async def acached_search_results(query, kind="general", search_url=None):
+            self.queries.append(query)
+            outcome = results_by_date.get(query.rsplit(" on ", 1)[1], {"organic": []})
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+        return mock.patch("tools.ticket_search_tool.acached_search_results", side_effect=acached_search_results)
+
+    def test_flexible_dates_are_summarized(self):
+        """Test that a flexible search covers the window and ranks the merged options"""
+        from config.settings import FLEXIBLE_DATE_WINDOW_DAYS
+
+        results_by_date = {
+            "2099-05-09": {"organic": [flight("LIS-OPO", "https://air.example/lis-opo", 90)]},
+            "2099-05-11": {"organic": [flight("LIS-OPO", "https://air.example/lis-opo/", 60),
+                                       flight("Rail", "https://rail.example/lis-opo", 30)]},
+            "2099-05-12": TimeoutError("timed out after 15s"),
+        }
+        with self.search_results(results_by_date):
+            answer = self.tool._run(**ticket_request(flexible_dates=True))
+
+        self.assertEqual(len(self.queries), 2 * FLEXIBLE_DATE_WINDOW_DAYS + 1)
+        summary = answer[-1]
+        self.assertIn("- 2099-05-11: 2 options, from $30", summary)
+        self.assertIn("- 2099-05-12: unavailable (timed out after 15s)", summary)
+        self.assertIn("1. Rail - $30", summary)
+        self.assertIn("2. LIS-OPO - $60", summary)
+
+    def test_flexible_window_starts_today(self):
+        """Test that a flexible search for today does not search past dates"""
+        today = date.today()
+        with self.search_results({}):
+            self.tool._run(**ticket_request(travel_date=today.isoformat(), flexible_dates=True))
+        searched = sorted(date.fromisoformat(query.rsplit(" on ", 1)[1]) for query in self.queries)
+        self.assertEqual(searched[0], today)
+        self.assertEqual(searched[-1], today + timedelta(days=len(searched) - 1))
+
+    def leg_searches(self, outcomes):
+        """Stand-in for acached_search answering (or raising) per leg, keyed by origin"""
+        async def acached_search(query, kind="general", search_url=None):
+            self.queries.append(query)
+            outcome = outcomes[query.split(" from ", 1)[1].split(" to ", 1)[0]]
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+        return mock.patch("tools.ticket_search_tool.acached_search", side_effect=acached_search)
+
+    def test_round_trip_with_one_leg_failing(self):
+        """Test that the working leg's results are kept when the other leg fails"""
+        with self.leg_searches({"Lisbon": "outbound flights", "Porto": ConnectionError("Serper down")}):
+            answer = self.tool._run(**ticket_request(return_date="2099-05-17"))
+
+        self.assertEqual(len(self.queries), 2)
+        self.assertTrue(answer[0].startswith("Found round-trip tickets from Lisbon to Porto"))
+        self.assertEqual(answer[-3], "outbound flights")
+        self.assertEqual(answer[-1], "No return flight results available (lookup failed: Serper down).")
+
+    def test_round_trip_with_both_legs_failing(self):
+        """Test that the tool fails when neither leg could be searched"""
+        outcomes = {"Lisbon": ConnectionError("outbound down"), "Porto": ConnectionError("return down")}
+        with self.leg_searches(outcomes):
+            with self.assertRaises(ConnectionError):
+                self.tool._run(**ticket_request(return_date="2099-05-17"))
+        self.assertEqual(len(self.queries), 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import importlib.util
+import unittest
+from unittest import mock
+
+def fake_search(outcomes):
+    """Stand-in for acached_search answering (or raising) per kind of search"""
+    async def acached_search(query, kind="general", search_url=None):
+        outcome = outcomes[kind]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+    return acached_search
+
+@unittest.skipUnless(importlib.util.find_spec("crewai_tools"), "crewai_tools is not installed")
+class TestTravelGuideTool(unittest.TestCase):
+    def run_tool(self, outcomes, concurrent=True):
+        from tools.travel_guide_tool import TravelGuideTool
+
+        tool = TravelGuideTool()
+        tool.concurrent = concurrent
+        with mock.patch("tools.travel_guide_tool.acached_search", side_effect=fake_search(outcomes)):
+            return tool._run(location="Lisbon", travel_date="2030-05-01")
+
+    def test_failed_search_is_reported_for_its_kind(self):
+        """Test that one failing sub-search leaves the other kinds' results in the answer"""
+        outcomes = {"weather": "sunny", "hotels": ConnectionError("Serper down"), "attractions": "tram 28"}
+        for concurrent in (True, False):
+            with self.subTest(concurrent=concurrent):
+                weather, hotels, attractions = self.run_tool(outcomes, concurrent)
+                self.assertTrue(weather.endswith("sunny"))
+                self.assertIn("No hotels results available (lookup failed: Serper down)", hotels)
+                self.assertTrue(attractions.endswith("tram 28"))
+
+    def test_timeouts_are_reported(self):
+        """Test that a sub-search past its deadline is reported as such"""
+        outcomes = {"weather": TimeoutError("timed out after 3s"), "hotels": "hotel", "attractions": "museum"}
+        weather, _, _ = self.run_tool(outcomes)
+        self.assertIn("No weather results available (lookup timed out after 3s)", weather)
+
+    def test_every_search_failing_raises(self):
+        """Test that the tool fails when no sub-search could be made at all"""
+        error = ValueError("SERPER_API_KEY is not set")
+        with self.assertRaises(ValueError):
+            self.run_tool({"weather": error, "hotels": error, "attractions": error})
+
+if __name__ == '__main__':
+    unittest.main()
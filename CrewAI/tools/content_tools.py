@@ -39,48 +39,99 @@ Notes:
 - Tools assigned to Task: Exclusively used for that specific task
 """
 import os  # Import os to access environment variables
+import threading
 
-# Importing necessary tools from crewai_tools
-from crewai_tools import (
-    SerperDevTool, 
-    ScrapeWebsiteTool, 
-    WebsiteSearchTool, 
-    CSVSearchTool, 
-    DOCXSearchTool, 
-    YoutubeChannelSearchTool, 
-    GithubSearchTool, 
-    PDFSearchTool, 
-    DirectoryReadTool
-)
-
-# Importing tools specific to CrewAI
-from tools.travel_guide_tool import TravelGuideTool
-
-# List of tool classes to instantiate
-TOOL_CLASSES = [
-    SerperDevTool,
-    ScrapeWebsiteTool,
-    WebsiteSearchTool,
-    CSVSearchTool,
-    DOCXSearchTool,
-    YoutubeChannelSearchTool,
-    GithubSearchTool,
-    PDFSearchTool,
-    DirectoryReadTool,
-    TravelGuideTool
-]
+from config.settings import SUPPORT_DOCS_URL, SERPER_SEARCH_URL
+
+# crewai_tools (and the embedding stack behind it) is imported inside the
+# factory functions below, so importing this module stays cheap.
+
+def get_tool_classes():
+    """
+    Return the list of tool classes to instantiate.
+    """
+    # Importing necessary tools from crewai_tools
+    from crewai_tools import (
+        ScrapeWebsiteTool, 
+        WebsiteSearchTool, 
+        CSVSearchTool, 
+        DOCXSearchTool, 
+        YoutubeChannelSearchTool, 
+        GithubSearchTool, 
+        PDFSearchTool
+    )
+
+    # Importing tools specific to CrewAI
+    from tools.indexed_directory_tool import IndexedDirectoryReadTool
+    from tools.pooled_serper_tool import PooledSerperDevTool
+    from tools.travel_guide_tool import TravelGuideTool
+    from utils.embedding_cache import enable_embedding_cache
+
+    # The RAG tools embed their sources when built: reuse vectors of unchanged chunks
+    enable_embedding_cache()
+
+    return [
+        PooledSerperDevTool,  # SerperDevTool over the shared cache and connection pool
+        ScrapeWebsiteTool,
+        WebsiteSearchTool,
+        CSVSearchTool,
+        DOCXSearchTool,
+        YoutubeChannelSearchTool,
+        GithubSearchTool,
+        PDFSearchTool,
+        IndexedDirectoryReadTool,  # DirectoryReadTool over the persistent directory index
+        TravelGuideTool
+    ]
+
+def __getattr__(name):
+    # TOOL_CLASSES is resolved on first access (PEP 562) to keep the import lazy
+    if name == "TOOL_CLASSES":
+        return get_tool_classes()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Process-wide tool instances, keyed by tool class and constructor arguments
+_shared_tools = {}
+_shared_tools_lock = threading.Lock()
+
+def get_shared_tool(tool_class, lazy: bool = False, **kwargs):
+    """
+    Return a process-wide instance of a tool, constructing it on first use.
+    
+    Tools hold no per-run state, so a single instance can safely be reused by
+    every crew instead of re-initializing it for each task.
+    
+    Parameters:
+    - tool_class: The tool class to instantiate.
+    - lazy: Return a LazyTool proxy that only builds the real tool when first called.
+    - kwargs: Constructor arguments (must be hashable); different arguments get different instances.
+    """
+    key = (tool_class, lazy, tuple(sorted(kwargs.items())))
+    with _shared_tools_lock:
+        if key not in _shared_tools:
+            if lazy:
+                from tools.lazy_tools import LazyTool
+                _shared_tools[key] = LazyTool.for_class(tool_class, **kwargs)
+            else:
+                _shared_tools[key] = tool_class(**kwargs)
+        return _shared_tools[key]
 
 def create_research_tools():
     """
     Create and return tools for content research.
+    
+    The tools are shared lazy proxies: each real tool (and its embedder/vector
+    store) is only built the first time an agent calls it.
     """
+    from tools.pooled_serper_tool import PooledSerperDevTool
+
     # Retrieve the Serper API key from environment variables
     serper_api_key = os.getenv("SERPER_API_KEY")  # Ensure this environment variable is set
 
-    # Instantiate all tools from the TOOL_CLASSES list
+    # Proxies for all tools from the TOOL_CLASSES list
     research_tools = [
-        tool_class(api_key=serper_api_key) if tool_class == SerperDevTool else tool_class() 
-        for tool_class in TOOL_CLASSES
+        get_shared_tool(tool_class, lazy=True, api_key=serper_api_key) if tool_class == PooledSerperDevTool
+        else get_shared_tool(tool_class, lazy=True)
+        for tool_class in get_tool_classes()
     ]
     
     return research_tools
@@ -89,22 +140,37 @@ def create_test_research_tools():
     """
     Create and return a tool that will scrape a page (only 1 URL) of the CrewAI documentation.
     """
-    docs_scrape_tool = ScrapeWebsiteTool(
-        website_url="https://docs.crewai.com/how-to/Creating-a-Crew-and-kick-it-off/"
-    )
+    from tools.snapshot_scrape_tool import SnapshotScrapeTool
+
+    # Served from the local snapshot store (see utils/snapshots.py)
+    docs_scrape_tool = SnapshotScrapeTool(website_url=SUPPORT_DOCS_URL)
     
     return [docs_scrape_tool]
 
 def create_directory_tools(directory: str):
     """
     Create and return tools for directory reading.
+
+    The listing comes from the persistent directory index, so repeated calls on
+    an unchanged tree do not walk it again.
     """
-    return [DirectoryReadTool(directory=directory)]
+    from tools.indexed_directory_tool import IndexedDirectoryReadTool
+
+    return [IndexedDirectoryReadTool(directory=directory)]
 
 def file_reader_tools(file_path: str):
     """
     Create and return tools for reading files.
+
+    Each tool embeds the file when it is built; chunks already embedded (in an
+    earlier run, or by another tool reading the same content) come from the
+    embedding cache.
     """
+    from crewai_tools import CSVSearchTool, DOCXSearchTool, PDFSearchTool
+    from utils.embedding_cache import enable_embedding_cache
+
+    enable_embedding_cache()
+
     return [
         CSVSearchTool(file_path=file_path),
         DOCXSearchTool(file_path=file_path),
@@ -119,16 +185,19 @@ def search_serper_search_tools(search_query: str, url: str = None):
     - search_query: The query string to search for.
     - url: An optional URL to search within.
     """
-    search_tool = SerperDevTool(api_key=os.getenv("SERPER_API_KEY"))
-    
-    # Run the search tool with the provided query and URL
-    results = search_tool._run(search_query=search_query, url=url)
+    from tools.serper_search import cached_search
+
+    # Run the search over the shared cache and connection pool
+    # (like SerperDevTool, the url is not part of the Serper request)
+    results = cached_search(search_query, search_url=SERPER_SEARCH_URL)
     
     return results
 
 def get_all_content_tools():
     """
     Get all tools needed for content creation.
+    
+    Returns shared lazy proxies, so tools the agents never call are never built.
     """
-    # Instantiate all tools from the TOOL_CLASSES list
-    return [tool_class() for tool_class in TOOL_CLASSES]
\ No newline at end of file
+    # Proxies for all tools from the TOOL_CLASSES list
+    return [get_shared_tool(tool_class, lazy=True) for tool_class in get_tool_classes()]
\ No newline at end of file
@@ -0,0 +1,144 @@
+"""
+Flight Results Module
+=====================
+
+Helpers turning raw Serper flight searches into compact answers for agents.
+
+A flexible-date search returns one result list per date, and neighbouring
+dates mostly return the same pages (airline and aggregator route pages).
+These helpers merge the lists into unique options, rank them by the price
+quoted in the result (when there is one) and render a short summary: one
+line per date plus the best options overall, instead of N raw result blobs.
+"""
+import re
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+# "$120", "US$ 1,249.00", "€89", "£75.50"
+PRICE_PATTERN = re.compile(r"[$€£]\s?((?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d{1,2})?)")
+
+SNIPPET_LENGTH = 160
+
+
+def date_window(travel_date: str, days: int, earliest: date = None) -> List[str]:
+    """
+    Return the dates from ``days`` before to ``days`` after the travel date,
+    leaving out those before ``earliest`` (flights cannot be booked in the past)
+
+    Args:
+        travel_date (str): Date in YYYY-MM-DD format
+        days (int): Number of days on each side
+        earliest (date): First date that may be returned (defaults to today)
+
+    Raises:
+        ValueError: If the date is not in YYYY-MM-DD format
+    """
+    center = date.fromisoformat(travel_date)
+    earliest = earliest or date.today()
+    dates = (center + timedelta(days=offset) for offset in range(-days, days + 1))
+    return [day.isoformat() for day in dates if day >= earliest]
+
+
+def extract_price(result: dict) -> Optional[float]:
+    """
+    Return the lowest price quoted in a result's title or snippet, if any
+    """
+    text = f"{result.get('title', '')} {result.get('snippet', '')}"
+    prices = [float(match.replace(",", "")) for match in PRICE_PATTERN.findall(text)]
+    return min(prices) if prices else None
+
+
+def _result_key(result: dict) -> str:
+    # Same page regardless of tracking parameters, fragments or a trailing slash
+    link = result.get("link")
+    if not link:
+        return result.get("title", "").strip().lower()
+    parts = urlsplit(link)
+    return f"{parts.netloc.lower()}{parts.path.rstrip('/')}"
+
+
+def merge_results(results_by_date: Dict[str, list]) -> List[dict]:
+    """
+    Merge per-date result lists into unique options
+
+    Args:
+        results_by_date (dict): Date -> list of Serper organic results
+
+    Returns:
+        list: Options with title, link, snippet, price (lowest seen), dates
+            (the dates the option was found for) and position (best rank seen)
+    """
+    options = {}
+    for travel_date in sorted(results_by_date):
+        for position, result in enumerate(results_by_date[travel_date]):
+            key = _result_key(result)
+            price = extract_price(result)
+            option = options.get(key)
+            if option is None:
+                options[key] = {
+                    "title": result.get("title", ""),
+                    "link": result.get("link", ""),
+                    "snippet": result.get("snippet", ""),
+                    "price": price,
+                    "dates": [travel_date],
+                    "position": position,
+                }
+                continue
+            if travel_date not in option["dates"]:
+                option["dates"].append(travel_date)
+            if price is not None and (option["price"] is None or price < option["price"]):
+                option["price"] = price
+            option["position"] = min(option["position"], position)
+    return list(options.values())
+
+
+def rank_options(options: List[dict]) -> List[dict]:
+    """
+    Order options by quoted price, then by how many dates they were found for
+    and their best search position. Options without a price come last.
+    """
+    return sorted(
+        options,
+        key=lambda o: (o["price"] is None, o["price"] or 0.0, -len(o["dates"]), o["position"])
+    )
+
+
+def summarize_date_window(results_by_date: Dict[str, object], max_options: int = 5) -> str:
+    """
+    Render a compact summary of a flexible-date search
+
+    Args:
+        results_by_date (dict): Date -> list of Serper organic results, or the
+            exception raised by that date's search
+        max_options (int): Number of ranked options to list
+
+    Returns:
+        str: One line per date followed by the best options overall
+    """
+    dates = sorted(results_by_date)
+    found = {d: r for d, r in results_by_date.items() if not isinstance(r, Exception)}
+
+    lines = [f"Flexible dates {dates[0]} to {dates[-1]} ({len(dates)} searches):"]
+    for travel_date in dates:
+        results = results_by_date[travel_date]
+        if isinstance(results, Exception):
+            lines.append(f"- {travel_date}: unavailable ({results})")
+            continue
+        prices = [p for p in map(extract_price, results) if p is not None]
+        cheapest = f"from ${min(prices):,.0f}" if prices else "no prices listed"
+        lines.append(f"- {travel_date}: {len(results)} options, {cheapest}")
+
+    ranked = rank_options(merge_results(found))[:max_options]
+    if not ranked:
+        lines.append("No flight options found.")
+        return "\n".join(lines)
+
+    lines.append("Best options:")
+    for rank, option in enumerate(ranked, start=1):
+        price = f"${option['price']:,.0f}" if option["price"] is not None else "price not listed"
+        lines.append(f"{rank}. {option['title']} - {price} - {option['link']} ({', '.join(option['dates'])})")
+        snippet = option["snippet"]
+        if snippet:
+            lines.append(f"   {snippet[:SNIPPET_LENGTH]}{'...' if len(snippet) > SNIPPET_LENGTH else ''}")
+    return "\n".join(lines)
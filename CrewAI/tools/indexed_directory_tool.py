@@ -0,0 +1,42 @@
+from crewai_tools import BaseTool
+from pydantic.v1 import BaseModel, Field
+from typing import Optional, Type
+from utils.compaction import compacted
+from utils.dir_index import get_directory_index
+from utils.metrics import instrument_tool
+
+class FixedIndexedDirectoryReadSchema(BaseModel):
+    """Schema used when the tool is bound to one directory - the agent passes no arguments"""
+    pass
+
+class IndexedDirectoryReadSchema(FixedIndexedDirectoryReadSchema):
+    """Schema for the indexed directory tool - the directory to list"""
+    directory: str = Field(..., description="Mandatory directory to list content")
+
+class IndexedDirectoryReadTool(BaseTool):
+    """
+    Drop-in replacement for DirectoryReadTool that lists directories from the
+    persistent directory index (utils/dir_index.py). A tree is only walked again
+    once its last scan is older than DIRECTORY_INDEX_MAX_AGE, and then only new
+    or changed files are read.
+    """
+    name: str = "List files in directory"
+    description: str = "A tool that can be used to recursively list a directory's content."
+    args_schema: Type[BaseModel] = IndexedDirectoryReadSchema
+    directory: Optional[str] = None
+
+    def __init__(self, directory: Optional[str] = None, **kwargs):
+        super().__init__(**kwargs)
+        if directory is not None:
+            self.directory = directory
+            self.description = f"A tool that can be used to list {directory}'s content."
+            self.args_schema = FixedIndexedDirectoryReadSchema
+
+    @instrument_tool
+    @compacted
+    def _run(self, **kwargs) -> str:
+        directory = kwargs.get('directory', self.directory).rstrip("/") or "/"
+        files = get_directory_index().list_files(directory)
+        # Same listing as DirectoryReadTool
+        paths = "\n- ".join(f"{directory}/{entry['path']}" for entry in files)
+        return f"File paths: \n-{paths}"
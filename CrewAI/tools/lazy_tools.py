@@ -0,0 +1,116 @@
+"""
+Lazy Tools Module
+=================
+
+Proxy tools that look exactly like the tool they stand for (same name,
+description and args schema) but only construct the real tool - including
+any embedder and vector store it sets up - the first time an agent calls it.
+
+Agents are usually handed far more tools than they end up using, so deferring
+construction keeps crew start-up fast and avoids holding embedding models and
+vector stores in memory for tools that are never invoked.
+
+Tools whose constructor reshapes them (``ScrapeWebsiteTool(website_url=...)``
+drops the URL argument and rewrites its description) cannot be described
+without running that constructor, so when such a tool is given constructor
+arguments it is built right away.
+"""
+import asyncio
+import contextvars
+import functools
+import threading
+from typing import Any
+
+from crewai_tools import BaseTool
+from pydantic import Field, PrivateAttr
+from pydantic_core import PydanticUndefined
+
+from utils.compaction import compacted
+from utils.concurrency import get_io_executor
+from utils.metrics import instrument_tool
+
+# What a tool advertises to agents (and how crewai caches its results), copied onto the proxy
+_ADVERTISED_FIELDS = ("name", "description", "args_schema", "cache_function")
+
+
+def _has_own_init(tool_class) -> bool:
+    # Whether a tool class (or a base below BaseTool) overrides the constructor
+    return any("__init__" in vars(klass) for klass in tool_class.__mro__
+               if issubclass(klass, BaseTool) and klass is not BaseTool)
+
+
+class LazyTool(BaseTool):
+    """
+    A tool proxy that builds the wrapped tool on first invocation.
+
+    A single proxy can be shared by any number of agents and crews; the real
+    tool is built at most once, even under concurrent first calls.
+    """
+    tool_class: Any = None
+    tool_kwargs: dict = Field(default_factory=dict)
+
+    _tool: Any = PrivateAttr(default=None)
+    _build_lock: Any = PrivateAttr(default_factory=threading.Lock)
+
+    @classmethod
+    def for_class(cls, tool_class, **tool_kwargs):
+        """
+        Create a proxy for a tool class without instantiating it
+
+        Args:
+            tool_class: The crewai_tools tool class to wrap
+            **tool_kwargs: Constructor arguments used when the real tool is built
+
+        Returns:
+            LazyTool: Proxy exposing the tool's name, description, args schema and
+                cache function; already built if the tool's constructor may change them
+        """
+        if tool_kwargs and _has_own_init(tool_class):
+            tool = tool_class(**tool_kwargs)
+            proxy = cls(tool_class=tool_class, tool_kwargs=tool_kwargs,
+                        **{field_name: getattr(tool, field_name) for field_name in _ADVERTISED_FIELDS})
+            proxy.description = tool.description  # Already rendered by the tool
+            proxy._tool = tool
+            return proxy
+
+        proxy_fields = {}
+        for field_name in _ADVERTISED_FIELDS:
+            field = tool_class.model_fields.get(field_name)
+            if field_name in tool_kwargs:
+                proxy_fields[field_name] = tool_kwargs[field_name]
+            elif field is not None and field.default is not PydanticUndefined:
+                proxy_fields[field_name] = field.default
+        return cls(tool_class=tool_class, tool_kwargs=tool_kwargs, **proxy_fields)
+
+    @property
+    def is_built(self) -> bool:
+        """Whether the real tool has been constructed yet"""
+        return self._tool is not None
+
+    def get_tool(self):
+        """
+        Return the real tool, constructing it on first use
+        """
+        if self._tool is None:
+            with self._build_lock:
+                if self._tool is None:
+                    self._tool = self.tool_class(**self.tool_kwargs)
+        return self._tool
+
+    @instrument_tool
+    @compacted
+    def _run(self, *args, **kwargs):
+        return self.get_tool()._run(*args, **kwargs)
+
+    @instrument_tool
+    @compacted
+    async def _arun(self, *args, **kwargs):
+        # Building the tool (and calling tools without an async path) blocks,
+        # so both happen on the shared I/O pool instead of the event loop
+        loop = asyncio.get_running_loop()
+        tool = self._tool or await loop.run_in_executor(get_io_executor(), self.get_tool)
+        arun = getattr(tool, "_arun", None)
+        if asyncio.iscoroutinefunction(arun):
+            return await arun(*args, **kwargs)
+        call = functools.partial(contextvars.copy_context().run, tool._run, *args, **kwargs)
+        return await loop.run_in_executor(get_io_executor(), call)
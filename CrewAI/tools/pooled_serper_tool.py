@@ -0,0 +1,20 @@
+from crewai_tools import SerperDevTool
+from tools.serper_search import cached_search
+from utils.compaction import compacted
+
+class PooledSerperDevTool(SerperDevTool):
+    """
+    SerperDevTool that searches through the shared cache and connection pool
+    (tools/serper_search.py) instead of opening a new connection for every call.
+    """
+
+    @compacted
+    def _run(self, **kwargs):
+        search_query = kwargs.get("search_query")
+        if search_query is None:
+            search_query = kwargs.get("query")
+        return cached_search(
+            search_query,
+            search_url=self.search_url,
+            n_results=getattr(self, "n_results", None)
+        )
@@ -0,0 +1,336 @@
+"""
+Serper Search Module
+====================
+
+Single entry point for every Serper lookup made by the custom tools.
+
+Results are kept in a disk-backed cache shared by all tools (and all processes
+using the same cache file), keyed by the normalized query and the kind of
+query, so repeated "weather in X on D" or "flights from A to B on D" lookups
+are answered without a paid API call.
+
+Requests go over the shared keep-alive connection pool (utils.http), so
+back-to-back searches reuse one connection instead of each paying for its own
+TCP and TLS setup. The raw Serper response is cached and formatted on the way
+out, so callers that need structured results can share the same entries.
+
+Each search has a deadline (the kind's entry in SEARCH_TIMEOUTS) covering
+jittered retries of transient failures, within a process-wide retry budget
+and behind a circuit breaker (utils.resilience). When Serper cannot answer,
+the last cached response is served even if it is stale; formatted searches
+without one return a short "unavailable" notice instead of failing the tool.
+
+Every request, retries included, first takes its share of the Serper quota
+from the rate limiter shared by all processes (utils.rate_limit).
+"""
+import asyncio
+import os
+import threading
+
+from utils.cache import PersistentCache, normalize_query
+from utils.concurrency import get_io_executor
+from utils.http import get_async_http_client, get_http_session
+from utils.metrics import get_metrics
+from utils.rate_limit import get_rate_limiter
+from utils.resilience import (
+    Deadline, acall_with_retries, call_with_retries, get_circuit_breaker, get_retry_budget, is_unavailable
+)
+
+# Bumped whenever the shape of the cached value changes
+_CACHE_KEY_VERSION = "v2"
+
+_search_cache = None
+_search_cache_lock = threading.Lock()
+
+
+def get_search_cache():
+    """
+    Return the process-wide search cache, creating it on first use.
+    Returns None when caching is disabled in the settings.
+    """
+    global _search_cache
+    from config.settings import (
+        SEARCH_CACHE_ENABLED, SEARCH_CACHE_PATH, SEARCH_CACHE_MAX_ENTRIES,
+        SEARCH_CACHE_DEFAULT_TTL, SEARCH_CACHE_TTLS, SEARCH_CACHE_STALE_FOR
+    )
+
+    if not SEARCH_CACHE_ENABLED:
+        return None
+    with _search_cache_lock:
+        if _search_cache is None:
+            _search_cache = PersistentCache(
+                SEARCH_CACHE_PATH,
+                ttls=SEARCH_CACHE_TTLS,
+                default_ttl=SEARCH_CACHE_DEFAULT_TTL,
+                max_entries=SEARCH_CACHE_MAX_ENTRIES,
+                stale_for=SEARCH_CACHE_STALE_FOR
+            )
+    return _search_cache
+
+
+def _cache_key(search_query, n_results):
+    return f"{_CACHE_KEY_VERSION}:{n_results or ''}:{normalize_query(search_query)}"
+
+
+def _read_timeout(kind, read_timeout):
+    from config.settings import SEARCH_TIMEOUTS, SEARCH_DEFAULT_TIMEOUT
+
+    return SEARCH_TIMEOUTS.get(kind, SEARCH_DEFAULT_TIMEOUT) if read_timeout is None else read_timeout
+
+
+def _api_key():
+    from config.settings import SERPER_API_KEY
+
+    # Tools may set the key in the environment after the settings were loaded
+    api_key = SERPER_API_KEY or os.getenv("SERPER_API_KEY")
+    if not api_key:
+        raise ValueError("SERPER_API_KEY is not set: add it to the environment or the .env file")
+    return api_key
+
+
+def _request_args(search_query, search_url, n_results, read_timeout):
+    from config.settings import SERPER_SEARCH_URL, HTTP_CONNECT_TIMEOUT
+
+    payload = {"q": search_query}
+    if n_results:
+        payload["num"] = n_results
+    headers = {
+        "X-API-KEY": _api_key(),
+        "content-type": "application/json"
+    }
+    # (connect, read) seconds; connecting never takes longer than the read budget
+    timeout = (min(HTTP_CONNECT_TIMEOUT, read_timeout), read_timeout)
+    return search_url or SERPER_SEARCH_URL, payload, headers, timeout
+
+
+def serper_request(search_query: str, kind: str = "general", search_url: str = None,
+                   n_results: int = None, read_timeout: float = None) -> dict:
+    """
+    Send one search to Serper over the shared connection pool.
+
+    Args:
+        search_query (str): The query to search for
+        kind (str): The kind of query, which selects the read timeout
+        search_url (str): Serper endpoint (defaults to SERPER_SEARCH_URL)
+        n_results (int): Number of results to ask for (Serper's default if None)
+        read_timeout (float): Seconds to wait for the answer (defaults to the kind's timeout)
+
+    Returns:
+        dict: The decoded Serper response
+
+    Raises:
+        ValueError: If SERPER_API_KEY is not configured
+        TimeoutError: If Serper does not answer in time
+        RateLimitTimeout: If the Serper quota (RATE_LIMITS) is used up for longer than
+            half of the read timeout
+    """
+    import requests
+
+    read_timeout = _read_timeout(kind, read_timeout)
+    limiter = get_rate_limiter()
+    if limiter is not None:
+        # At most half of the attempt is spent queueing for the Serper quota
+        read_timeout -= limiter.acquire("serper", max_wait=read_timeout / 2)
+    url, payload, headers, timeout = _request_args(search_query, search_url, n_results, read_timeout)
+
+    with get_metrics().timer("serper", kind=kind) as record:
+        try:
+            response = get_http_session().post(url, json=payload, headers=headers, timeout=timeout)
+        except requests.Timeout as e:
+            raise TimeoutError(f"timed out after {timeout[1]}s") from e
+        response.raise_for_status()
+        record["payload_bytes"] = len(response.content)
+        return response.json()
+
+
+async def aserper_request(search_query: str, kind: str = "general", search_url: str = None,
+                          n_results: int = None, read_timeout: float = None) -> dict:
+    """
+    Async version of serper_request, over the event loop's shared httpx client
+    """
+    import httpx
+
+    read_timeout = _read_timeout(kind, read_timeout)
+    limiter = get_rate_limiter()
+    if limiter is not None:
+        read_timeout -= await limiter.aacquire("serper", max_wait=read_timeout / 2)
+    url, payload, headers, (connect, read) = _request_args(search_query, search_url, n_results, read_timeout)
+
+    with get_metrics().timer("serper", kind=kind) as record:
+        try:
+            response = await get_async_http_client().post(
+                url, json=payload, headers=headers, timeout=httpx.Timeout(read, connect=connect)
+            )
+        except httpx.TimeoutException as e:
+            raise TimeoutError(f"timed out after {read}s") from e
+        response.raise_for_status()
+        record["payload_bytes"] = len(response.content)
+        return response.json()
+
+
+def format_results(results):
+    """
+    Render a Serper response the way SerperDevTool does, so agents see the same text
+    """
+    if "organic" not in results:
+        return results
+    entries = []
+    for result in results["organic"]:
+        try:
+            entries.append("\n".join([
+                f"Title: {result['title']}",
+                f"Link: {result['link']}",
+                f"Snippet: {result['snippet']}",
+                "---"
+            ]))
+        except KeyError:
+            continue
+    content = "\n".join(entries)
+    return f"\nSearch results: {content}\n"
+
+
+def _retry_policy(kind):
+    # Deadline and retry arguments shared by the sync and async paths
+    from config.settings import (
+        SEARCH_TIMEOUTS, SEARCH_DEFAULT_TIMEOUT, SEARCH_ATTEMPT_TIMEOUT, RETRY_MAX_ATTEMPTS,
+        RETRY_BASE_DELAY, RETRY_MAX_DELAY
+    )
+
+    return {
+        "deadline": Deadline(SEARCH_TIMEOUTS.get(kind, SEARCH_DEFAULT_TIMEOUT)),
+        "breaker": get_circuit_breaker("serper"),
+        "budget": get_retry_budget(),
+        "max_attempts": RETRY_MAX_ATTEMPTS,
+        "attempt_timeout": SEARCH_ATTEMPT_TIMEOUT,
+        "base_delay": RETRY_BASE_DELAY,
+        "max_delay": RETRY_MAX_DELAY,
+    }
+
+
+def _stale_fallback(cache, key, kind, error):
+    # Serve the last known response when Serper is failing, if there is one
+    if cache is None or not is_unavailable(error):
+        raise error
+    results = cache.get(key, kind, allow_stale=True)
+    if results is None:
+        raise error
+    get_metrics().observe("serper_fallback", 0.0, kind=kind)
+    return results
+
+
+def cached_search_results(search_query: str, kind: str = "general", search_url: str = None,
+                          n_results: int = None) -> dict:
+    """
+    Return the raw Serper response for a query, through the shared cache.
+
+    Args:
+        search_query (str): The query to search for
+        kind (str): The kind of query, which selects the cache TTL and deadline
+        search_url (str): Serper endpoint (defaults to SERPER_SEARCH_URL)
+        n_results (int): Number of results to ask for
+
+    Returns:
+        dict: The (possibly cached) Serper response; a stale one if Serper is unavailable
+
+    Raises:
+        Exception: Serper's error when it is unavailable and nothing is cached
+    """
+    cache = get_search_cache()
+    key = _cache_key(search_query, n_results)
+
+    if cache is not None:
+        results = cache.get(key, kind)
+        if results is not None:
+            return results
+
+    try:
+        results = call_with_retries(
+            lambda timeout: serper_request(search_query, kind=kind, search_url=search_url,
+                                           n_results=n_results, read_timeout=timeout),
+            **_retry_policy(kind)
+        )
+    except Exception as e:
+        return _stale_fallback(cache, key, kind, e)
+
+    if cache is not None:
+        cache.set(key, results, kind)
+    return results
+
+
+async def acached_search_results(search_query: str, kind: str = "general", search_url: str = None,
+                                 n_results: int = None) -> dict:
+    """
+    Async version of cached_search_results
+    """
+    cache = get_search_cache()
+    key = _cache_key(search_query, n_results)
+    # The cache is SQLite shared with other processes, whose locks it may wait on: keep it off the loop
+    loop = asyncio.get_running_loop()
+
+    if cache is not None:
+        results = await loop.run_in_executor(get_io_executor(), cache.get, key, kind)
+        if results is not None:
+            return results
+
+    try:
+        results = await acall_with_retries(
+            lambda timeout: aserper_request(search_query, kind=kind, search_url=search_url,
+                                            n_results=n_results, read_timeout=timeout),
+            **_retry_policy(kind)
+        )
+    except Exception as e:
+        return await loop.run_in_executor(get_io_executor(), _stale_fallback, cache, key, kind, e)
+
+    if cache is not None:
+        await loop.run_in_executor(get_io_executor(), cache.set, key, results, kind)
+    return results
+
+
+def _unavailable(kind, error):
+    # Degraded answer for agents: the search failed, but the tool call does not
+    return f"\nSearch results: none, {kind} search is temporarily unavailable ({error}).\n"
+
+
+def cached_search(search_query: str, kind: str = "general", search_url: str = None,
+                  n_results: int = None):
+    """
+    Run a Serper search through the shared cache.
+
+    Args:
+        search_query (str): The query to search for
+        kind (str): The kind of query, which selects the cache TTL and deadline
+        search_url (str): Serper endpoint (defaults to SERPER_SEARCH_URL)
+        n_results (int): Number of results to ask for
+
+    Returns:
+        The (possibly cached) search results, formatted like SerperDevTool's output,
+        or an "unavailable" notice if Serper is down and nothing is cached
+    """
+    try:
+        return format_results(cached_search_results(search_query, kind, search_url, n_results))
+    except Exception as e:
+        if not is_unavailable(e):
+            raise
+        return _unavailable(kind, e)
+
+
+async def acached_search(search_query: str, kind: str = "general", search_url: str = None,
+                         n_results: int = None):
+    """
+    Async version of cached_search
+    """
+    try:
+        return format_results(await acached_search_results(search_query, kind, search_url, n_results))
+    except Exception as e:
+        if not is_unavailable(e):
+            raise
+        return _unavailable(kind, e)
+
+
+def search_cache_stats() -> dict:
+    """
+    Return hit/miss counters for the shared search cache
+    """
+    cache = get_search_cache()
+    return cache.stats() if cache is not None else {}
+
@@ -0,0 +1,38 @@
+from crewai_tools import BaseTool
+from pydantic.v1 import BaseModel, Field
+from typing import Optional, Type
+from utils.compaction import compacted
+from utils.metrics import instrument_tool
+from utils.snapshots import get_snapshot_store
+
+class FixedSnapshotScrapeSchema(BaseModel):
+    """Schema used when the tool is bound to one website - the agent passes no arguments"""
+    pass
+
+class SnapshotScrapeSchema(FixedSnapshotScrapeSchema):
+    """Schema for the snapshot scrape tool - the website to read"""
+    website_url: str = Field(..., description="Mandatory website url to read the file")
+
+class SnapshotScrapeTool(BaseTool):
+    """
+    Drop-in replacement for ScrapeWebsiteTool that reads pages through the local
+    snapshot store (utils/snapshots.py). Pages are only downloaded again once their
+    snapshot is stale, and then with a conditional request.
+    """
+    name: str = "Read website content"
+    description: str = "A tool that can be used to read a website content."
+    args_schema: Type[BaseModel] = SnapshotScrapeSchema
+    website_url: Optional[str] = None
+
+    def __init__(self, website_url: Optional[str] = None, **kwargs):
+        super().__init__(**kwargs)
+        if website_url is not None:
+            self.website_url = website_url
+            self.description = f"A tool that can be used to read {website_url}'s content."
+            self.args_schema = FixedSnapshotScrapeSchema
+
+    @instrument_tool
+    @compacted
+    def _run(self, **kwargs) -> str:
+        website_url = kwargs.get('website_url', self.website_url)
+        return get_snapshot_store().get_text(website_url)
@@ -0,0 +1,38 @@
+from crewai_tools import BaseTool
+from pydantic.v1 import BaseModel, Field
+from typing import List, Optional, Type
+from utils.doc_index import get_support_docs_index, ingest_support_docs
+from utils.compaction import compacted
+from utils.metrics import instrument_tool
+
+class SupportDocsSearchSchema(BaseModel):
+    """Schema for the support docs search tool - the question to look up"""
+    search_query: str = Field(..., description="The customer's question, or the topic to look up in the documentation.")
+
+class SupportDocsSearchTool(BaseTool):
+    """
+    Retrieves the documentation passages most relevant to a question from the
+    chunked support docs index (utils/doc_index.py), instead of handing the agent
+    the whole page. The index is brought up to date with the page snapshots at
+    most once per SUPPORT_DOCS_REFRESH_INTERVAL; unchanged pages cost no
+    embedding calls.
+    """
+    name: str = "Search support documentation"
+    description: str = "Searches the support documentation and returns the passages most relevant to a question."
+    args_schema: Type[BaseModel] = SupportDocsSearchSchema
+    docs_urls: Optional[List[str]] = None  # Defaults to SUPPORT_DOCS_URL
+    top_k: Optional[int] = None  # Defaults to SUPPORT_DOCS_TOP_K
+
+    @instrument_tool
+    @compacted
+    def _run(self, **kwargs) -> str:
+        from config.settings import SUPPORT_DOCS_TOP_K, SUPPORT_DOCS_REFRESH_INTERVAL
+
+        ingest_support_docs(self.docs_urls, max_age=SUPPORT_DOCS_REFRESH_INTERVAL)
+        passages = get_support_docs_index().search(kwargs['search_query'], k=self.top_k or SUPPORT_DOCS_TOP_K)
+        if not passages:
+            return "No relevant documentation found."
+        return "\n\n".join(
+            f"[{rank}] (source: {passage['source']})\n{passage['text']}"
+            for rank, passage in enumerate(passages, start=1)
+        )
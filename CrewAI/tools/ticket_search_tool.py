@@ -1,15 +1,16 @@
-from crewai_tools import BaseTool, SerperDevTool
+from crewai_tools import BaseTool
 from typing import List, Optional, Type
 from pydantic.v1 import BaseModel, Field, EmailStr
 import os
 from dotenv import load_dotenv
+from tools.flight_results import date_window, summarize_date_window
+from tools.serper_search import acached_search, acached_search_results
+from utils.compaction import compacted
+from utils.concurrency import afan_out, run_sync
+from utils.metrics import instrument_tool
 
 load_dotenv()  # Load environment variables from .env file
 
-print("Current Environment Variables:")
-for key, value in os.environ.items():
-    print(f"{key}: {value}")
-
 class TicketSearchSchema(BaseModel):
     """Schema for the ticket search tool - defines all required and optional fields for ticket search"""
     full_name: str = Field(..., description="The full name of the traveler.")
@@ -24,7 +25,7 @@ class TicketSearchSchema(BaseModel):
     companion_type: Optional[str] = Field(None, description="Type of travel companion (e.g., minor, pet).")
     pet_type: Optional[str] = Field(None, description="Type of pet if the companion is a pet.")
     preferred_flight: Optional[str] = Field(None, description="Preferred flight details or 'open' for an open search.")
-    flexible_dates: Optional[bool] = Field(False, description="Indicates if the traveler is flexible with travel dates.")
+    flexible_dates: Optional[bool] = Field(False, description="Indicates if the traveler is flexible with travel dates (nearby dates are searched too).")
 
     class Config:
         orm_mode = True
@@ -40,16 +41,18 @@ class TicketSearchTool(BaseTool):
     name: str = "Ticket Search Tool"
     description: str = "Searches for tickets based on various travel details."
     args_schema: Type[BaseModel] = TicketSearchSchema
-    search_tool: Optional[SerperDevTool] = None
+    search_url: Optional[str] = None  # Serper endpoint, searched over the shared connection pool
 
     def __init__(self):
         super().__init__()
-        self.search_tool = SerperDevTool()
+        from config.settings import SERPER_SEARCH_URL
+        self.search_url = SERPER_SEARCH_URL
         os.environ["SERPER_API_KEY"] = "5591e3125ff4adc849b11d93ef95a91bfb615972"
 
     def _run(self, **kwargs) -> List[str]:
         """
         Executes the ticket search with the provided parameters.
+        Synchronous wrapper around _arun, run on the shared background event loop.
         
         Args:
             **kwargs: All ticket search parameters as defined in TicketSearchSchema
@@ -57,19 +60,105 @@ class TicketSearchTool(BaseTool):
         Returns:
             List[str]: Formatted search results including passenger details and flight options
         """
-        search_query = f"flights from {kwargs['traveling_from']} to {kwargs['traveling_to']} on {kwargs['travel_date']}"
-        search_results = self.search_tool._run(search_query=search_query)
+        return run_sync(self._arun(**kwargs))
+
+    @instrument_tool
+    @compacted
+    async def _arun(self, **kwargs) -> List[str]:
+        """
+        Executes the ticket search without blocking a thread during the network wait.
         
-        return [
-            f"Found tickets from {kwargs['traveling_from']} to {kwargs['traveling_to']} on {kwargs['travel_date']}:",
+        Args:
+            **kwargs: All ticket search parameters as defined in TicketSearchSchema
+            
+        Returns:
+            List[str]: Formatted search results including passenger details and flight options
+                (outbound and return sections when a return date is given)
+        """
+        origin, destination = kwargs['traveling_from'], kwargs['traveling_to']
+        travel_date, return_date = kwargs['travel_date'], kwargs.get('return_date')
+        flexible = bool(kwargs.get('flexible_dates'))
+
+        details = [
             f"Traveler: {kwargs['full_name']}, Email: {kwargs['email']}",
             f"Flight Class: {kwargs['flight_class']}, Luggage: {kwargs['luggage_number']}, Companions: {kwargs['travel_companions']}",
             f"Companion Type: {kwargs.get('companion_type')}, Pet Type: {kwargs.get('pet_type')}",
             f"Preferred Flight: {kwargs.get('preferred_flight', 'Open Search')}",
-            "Search Results:",
-            search_results
         ]
 
+        if not return_date:
+            search_results = await self._search_leg(origin, destination, travel_date, flexible=flexible)
+            return [
+                f"Found tickets from {origin} to {destination} on {travel_date}:",
+                *details,
+                "Search Results:",
+                search_results
+            ]
+
+        # Round trip: both legs are searched at the same time
+        outbound_results, return_results = await afan_out([
+            self._search_leg(origin, destination, travel_date, flexible=flexible),
+            self._search_leg(destination, origin, return_date, flexible=flexible),
+        ])
+        if isinstance(outbound_results, Exception) and isinstance(return_results, Exception):
+            raise outbound_results
+
+        return [
+            f"Found round-trip tickets from {origin} to {destination} on {travel_date}, returning on {return_date}:",
+            *details,
+            f"Outbound Search Results ({origin} to {destination} on {travel_date}):",
+            self._leg_outcome("outbound", outbound_results),
+            f"Return Search Results ({destination} to {origin} on {return_date}):",
+            self._leg_outcome("return", return_results)
+        ]
+
+    @staticmethod
+    def _leg_outcome(leg: str, outcome):
+        # A failed leg is reported so the other leg's results are still usable
+        if isinstance(outcome, Exception):
+            return f"No {leg} flight results available (lookup failed: {outcome})."
+        return outcome
+
+    async def _search_leg(self, origin: str, destination: str, travel_date: str,
+                          flexible: bool = False) -> str:
+        """
+        Search the flights for one leg, on the exact date or across the flexible-date window
+        """
+        if flexible:
+            from config.settings import FLEXIBLE_DATE_WINDOW_DAYS
+            try:
+                dates = date_window(travel_date, FLEXIBLE_DATE_WINDOW_DAYS)
+            except ValueError:
+                dates = None  # Not a YYYY-MM-DD date: search it as given
+            if dates:  # Empty when the whole window is in the past
+                return await self._search_date_window(origin, destination, dates)
+
+        search_query = f"flights from {origin} to {destination} on {travel_date}"
+        return await acached_search(search_query, kind="flights", search_url=self.search_url)
+
+    async def _search_date_window(self, origin: str, destination: str, dates: List[str]) -> str:
+        """
+        Search every date of the window at once and summarize the merged, ranked results.
+        Dates whose lookup fails or misses its deadline (with nothing cached) are
+        reported as unavailable.
+        """
+        from config.settings import FLEXIBLE_DATE_MAX_OPTIONS
+
+        # Each search is bounded by its own deadline, which leaves room for the stale-cache fallback
+        outcomes = await afan_out(
+            [acached_search_results(f"flights from {origin} to {destination} on {d}",
+                                    kind="flights", search_url=self.search_url)
+             for d in dates]
+        )
+        if all(isinstance(outcome, Exception) for outcome in outcomes):
+            raise outcomes[0]
+
+        results_by_date = {
+            d: outcome if isinstance(outcome, Exception) else outcome.get("organic", [])
+            for d, outcome in zip(dates, outcomes)
+        }
+        return summarize_date_window(results_by_date, max_options=FLEXIBLE_DATE_MAX_OPTIONS)
+
     def _get_travel_details(self, full_name: str, email: str, traveling_from: str, 
                              traveling_to: str, travel_date: str, return_date: Optional[str], 
                              flight_class: str, luggage_number: int, travel_companions: int, 
@@ -93,25 +182,22 @@ class TicketSearchTool(BaseTool):
         }
         return travel_details
 
-# Example usage
-ticket_search_tool = TicketSearchTool()
-results = ticket_search_tool.run(
-    full_name="John Doe",
-    email="john.doe@example.com",
-    traveling_from="Los Angeles",
-    traveling_to="New York",
-    travel_date="2023-10-15",
-    return_date="2023-10-20",
-    flight_class="Economy",
-    luggage_number=2,
-    travel_companions=1,
-    companion_type="Pet",
-    pet_type="Dog",
-    preferred_flight="Direct"
-)
-for result in results:
-    print(result)
-
-print("Current Environment Variables in Test:")
-for key, value in os.environ.items():
-    print(f"{key}: {value}") 
\ No newline at end of file
+if __name__ == "__main__":
+    # Example usage (runs a live search, so only when executed directly)
+    ticket_search_tool = TicketSearchTool()
+    results = ticket_search_tool.run(
+        full_name="John Doe",
+        email="john.doe@example.com",
+        traveling_from="Los Angeles",
+        traveling_to="New York",
+        travel_date="2023-10-15",
+        return_date="2023-10-20",
+        flight_class="Economy",
+        luggage_number=2,
+        travel_companions=1,
+        companion_type="Pet",
+        pet_type="Dog",
+        preferred_flight="Direct"
+    )
+    for result in results:
+        print(result) 
\ No newline at end of file
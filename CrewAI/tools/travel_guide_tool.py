@@ -1,7 +1,11 @@
 import os
-from crewai_tools import BaseTool, SerperDevTool
+from crewai_tools import BaseTool
 from pydantic.v1 import BaseModel, Field  # Change to v1 explicitly
 from typing import List, Optional, Type
+from tools.serper_search import acached_search
+from utils.compaction import compacted
+from utils.concurrency import afan_out, run_sync
+from utils.metrics import instrument_tool
 
 class TravelGuideSchema(BaseModel):
     """Schema for the travel guide tool - defines required and optional fields"""
@@ -16,26 +20,42 @@ class TravelGuideTool(BaseTool):
     name: str = "Travel Guide Tool"
     description: str = "Provides information on weather, accommodations, and attractions."
     args_schema: Type[BaseModel] = TravelGuideSchema
-    search_tool: Optional[SerperDevTool] = None  # Declare search_tool as class variable
+    search_url: Optional[str] = None  # Serper endpoint, searched over the shared connection pool
+    concurrent: Optional[bool] = None  # None: follow TRAVEL_GUIDE_CONCURRENT in settings
 
     def __init__(self):
         super().__init__()
-        self.search_tool = SerperDevTool()  # Initialize in constructor
+        from config.settings import SERPER_SEARCH_URL
+        self.search_url = SERPER_SEARCH_URL  # Initialize in constructor
         os.environ["SERPER_API_KEY"] = "5591e3125ff4adc849b11d93ef95a91bfb615972"
 
     def _run(self, **kwargs) -> List[str]:  # Change to kwargs pattern
+        # Synchronous wrapper around _arun, run on the shared background event loop
+        return run_sync(self._arun(**kwargs))
+
+    @instrument_tool
+    @compacted
+    async def _arun(self, **kwargs) -> List[str]:
         location = kwargs['location']
         travel_date = kwargs['travel_date']
-        
-        # Use instance variable instead of creating new one
-        weather_results = self.search_tool._run(
-            search_query=f"weather in {location} on {travel_date}")
-        
-        hotel_results = self.search_tool._run(
-            search_query=f"hotels in {location} on {travel_date}")
-        
-        attractions_results = self.search_tool._run(
-            search_query=f"tourist attractions in {location}")
+
+        queries = [
+            ("weather", f"weather in {location} on {travel_date}"),
+            ("hotels", f"hotels in {location} on {travel_date}"),
+            ("attractions", f"tourist attractions in {location}"),
+        ]
+
+        if self._use_concurrency():
+            outcomes = await self._search_concurrently(queries)
+        else:
+            # Sequential searches, going through the shared cache and connection pool
+            outcomes = [await self._search(kind, query) for kind, query in queries]
+
+        if all(isinstance(outcome, Exception) and not isinstance(outcome, TimeoutError) for outcome in outcomes):
+            raise outcomes[0]  # Nothing to report: most likely a configuration problem
+        weather_results, hotel_results, attractions_results = [
+            self._kind_outcome(kind, outcome) for (kind, _), outcome in zip(queries, outcomes)
+        ]
 
         return [
             f"Weather in {location} on {travel_date}: {weather_results}",
@@ -43,6 +63,41 @@ class TravelGuideTool(BaseTool):
             f"Tourist Attractions in {location}: {attractions_results}"
         ]
 
+    def _use_concurrency(self) -> bool:
+        if self.concurrent is not None:
+            return self.concurrent
+        from config.settings import TRAVEL_GUIDE_CONCURRENT
+        return TRAVEL_GUIDE_CONCURRENT
+
+    async def _search(self, kind: str, query: str):
+        # One sub-search; its error is returned so the other kinds are still reported
+        try:
+            return await acached_search(query, kind=kind, search_url=self.search_url)
+        except Exception as e:
+            return e
+
+    async def _search_concurrently(self, queries) -> list:
+        """
+        Send all sub-searches at once. Each one is bounded by its own deadline
+        (see tools.serper_search), past which it answers from the stale cache or
+        reports the search as unavailable, so it never delays the others.
+
+        Returns:
+            list: Per query, its results or the exception it raised
+        """
+        return await afan_out(
+            [acached_search(query, kind=kind, search_url=self.search_url) for kind, query in queries]
+        )
+
+    @staticmethod
+    def _kind_outcome(kind: str, outcome):
+        # A failed sub-search is reported so the results of the other kinds are still usable
+        if isinstance(outcome, TimeoutError):
+            return f"No {kind} results available (lookup {outcome})."
+        if isinstance(outcome, Exception):
+            return f"No {kind} results available (lookup failed: {outcome})."
+        return outcome
+
     def test(self):
         try:
             # Test the tool
@@ -0,0 +1,247 @@
+"""
+Answer Cache Module
+===================
+
+Semantic cache of the support crew's QA-approved answers, per customer.
+
+Support inquiries are often near-duplicates ("how do I add memory to my
+crew?", "How can I add memory to a crew"). Each inquiry is embedded, and
+the most similar earlier inquiry of the same customer is found with one
+NumPy matrix-vector product over that customer's normalized vectors. If its
+cosine similarity reaches ``threshold``, the stored answer is returned in
+milliseconds instead of running both agents again.
+
+Answers are stored with the asking person's name (in full, and each part of
+it on its own, e.g. "Hi Jane" for Jane Doe) replaced by placeholders and
+filled in again for whoever asks next. Entries expire after ``ttl`` seconds,
+and a customer holding ``max_entries`` answers reuses the slot of the least
+recently served one.
+
+The cache never fails a support request: if an inquiry cannot be embedded,
+the lookup is a miss and the answer is not stored.
+"""
+import logging
+import re
+import threading
+import time
+from typing import Optional
+
+import numpy as np
+
+from utils.cache import normalize_query
+
+logger = logging.getLogger(__name__)
+
+
+def _name_parts(person):
+    # Placeholder -> the part of the name it stands for
+    parts = person.split()
+    return {
+        "person": person,
+        "first_name": parts[0] if parts else person,
+        "last_name": parts[-1] if parts else person,
+    }
+
+
+def to_template(answer: str, person: str) -> str:
+    """
+    Turn an answer into a format template, with the person's full name as
+    ``{person}``, their first and last names as ``{first_name}`` and
+    ``{last_name}``, and any other part of their name as ``{person}``
+    """
+    template = answer.replace("{", "{{").replace("}", "}}")
+    if not person.strip():
+        return template
+
+    placeholders = {person.strip(): "person"}
+    parts = person.split()
+    for part in parts[1:-1]:
+        placeholders.setdefault(part, "person")
+    if len(parts) > 1:
+        placeholders.setdefault(parts[-1], "last_name")
+    placeholders.setdefault(parts[0], "first_name")
+    # Initials ("J.") are too ambiguous to replace
+    names = [name for name in placeholders if len(name.strip(".")) > 1]
+    if not names:
+        return template
+
+    # One pass, longest name first, so a part never matches inside a replaced full name
+    pattern = "|".join(re.escape(name) for name in sorted(names, key=len, reverse=True))
+    return re.sub(rf"(?<!\w)(?:{pattern})(?!\w)", lambda m: "{" + placeholders[m.group(0)] + "}", template)
+
+
+def personalize(template: str, person: str) -> str:
+    """Fill the person's name into an answer template"""
+    return template.format(**_name_parts(person))
+
+
+class _Shelf:
+    # One customer's entries: row i of each array belongs to answers[i]
+    def __init__(self, dimensions):
+        self.vectors = np.empty((0, dimensions), dtype=np.float32)
+        self.created_at = np.empty(0)
+        self.used_at = np.empty(0)
+        self.answers = []
+
+    def best(self, vector):
+        # (index, similarity) of the closest entry, or (None, -1) when empty
+        if not self.answers:
+            return None, -1.0
+        scores = self.vectors @ vector
+        index = int(np.argmax(scores))
+        return index, float(scores[index])
+
+    def put(self, index, vector, answer, now):
+        if index is None:
+            self.vectors = np.vstack([self.vectors, vector])
+            self.created_at = np.append(self.created_at, now)
+            self.used_at = np.append(self.used_at, now)
+            self.answers.append(answer)
+        else:
+            self.vectors[index] = vector
+            self.created_at[index] = now
+            self.used_at[index] = now
+            self.answers[index] = answer
+
+    def expire(self, before):
+        keep = self.created_at >= before
+        if keep.all():
+            return
+        self.vectors = self.vectors[keep]
+        self.created_at = self.created_at[keep]
+        self.used_at = self.used_at[keep]
+        self.answers = [answer for answer, kept in zip(self.answers, keep) if kept]
+
+
+class AnswerCache:
+    """
+    In-process semantic cache of answers, partitioned by customer
+
+    Args:
+        embedding_function: Chroma-style ``fn(texts) -> vectors``
+            (defaults to the docs index's cached embeddings)
+        threshold (float): Cosine similarity from which an earlier inquiry counts as the same
+        max_entries (int): Answers kept per customer, least recently served replaced first
+        ttl (float): Seconds an answer is served after it was stored (None to keep it)
+    """
+
+    def __init__(self, embedding_function=None, threshold: float = 0.95,
+                 max_entries: int = 500, ttl: float = None):
+        self.embedding_function = embedding_function
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self._shelves = {}
+        self._lock = threading.Lock()
+
+    def lookup(self, customer: str, inquiry: str, person: str) -> Optional[str]:
+        """
+        Return the cached answer to a similar inquiry of the customer, addressed
+        to ``person``, or None on a miss
+        """
+        vector = self._embed(inquiry)
+        if vector is None:
+            return None
+        with self._lock:
+            shelf = self._shelf(customer, len(vector))
+            index, score = shelf.best(vector)
+            if index is None or score < self.threshold:
+                self.misses += 1
+                return None
+            self.hits += 1
+            shelf.used_at[index] = time.time()
+            template = shelf.answers[index]
+        return personalize(template, person)
+
+    def store(self, customer: str, inquiry: str, person: str, answer: str):
+        """
+        Keep an approved answer for the customer's future similar inquiries.
+        An entry for an inquiry that similar already is replaced.
+        """
+        if not answer:
+            return
+        vector = self._embed(inquiry)
+        if vector is None:
+            return
+        template = to_template(answer, person)
+        with self._lock:
+            shelf = self._shelf(customer, len(vector))
+            index, score = shelf.best(vector)
+            if score < self.threshold:
+                index = int(np.argmin(shelf.used_at)) if len(shelf.answers) >= self.max_entries else None
+            shelf.put(index, vector, template, time.time())
+
+    def clear(self, customer: str = None):
+        """Drop the answers of one customer, or of all customers"""
+        with self._lock:
+            if customer is None:
+                self._shelves.clear()
+            else:
+                self._shelves.pop(customer, None)
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and the number of cached answers"""
+        with self._lock:
+            entries = sum(len(shelf.answers) for shelf in self._shelves.values())
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": entries,
+            "customers": len(self._shelves),
+        }
+
+    def _embed(self, inquiry):
+        # The normalized embedding of an inquiry, or None if it cannot be embedded
+        try:
+            if self.embedding_function is None:
+                from utils.doc_index import get_embedding_function
+                self.embedding_function = get_embedding_function()
+            vector = np.asarray(self.embedding_function([normalize_query(inquiry)])[0], dtype=np.float32)
+        except Exception:
+            logger.warning("Answer cache skipped: the inquiry could not be embedded", exc_info=True)
+            with self._lock:
+                self.errors += 1
+            return None
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _shelf(self, customer, dimensions):
+        # Caller holds the lock
+        shelf = self._shelves.get(customer)
+        if shelf is None or shelf.vectors.shape[1] != dimensions:  # New customer or embedding model
+            shelf = self._shelves[customer] = _Shelf(dimensions)
+        if self.ttl is not None:
+            shelf.expire(time.time() - self.ttl)
+        return shelf
+
+
+_answer_cache = None
+_answer_cache_lock = threading.Lock()
+
+
+def get_answer_cache() -> Optional[AnswerCache]:
+    """
+    Return the process-wide support answer cache, creating it on first use.
+    Returns None when the cache is disabled in the settings.
+    """
+    global _answer_cache
+    from config.settings import (
+        ANSWER_CACHE_ENABLED, ANSWER_CACHE_THRESHOLD, ANSWER_CACHE_MAX_ENTRIES, ANSWER_CACHE_TTL
+    )
+
+    if not ANSWER_CACHE_ENABLED:
+        return None
+    with _answer_cache_lock:
+        if _answer_cache is None:
+            _answer_cache = AnswerCache(
+                threshold=ANSWER_CACHE_THRESHOLD,
+                max_entries=ANSWER_CACHE_MAX_ENTRIES,
+                ttl=ANSWER_CACHE_TTL
+            )
+    return _answer_cache
@@ -0,0 +1,180 @@
+"""
+Persistent Cache Module
+=======================
+
+A small SQLite-backed key/value cache shared by the tools in this project.
+
+Every entry is stored with a ``kind`` (e.g. "weather", "flights") which selects
+its time-to-live, and the store is bounded by least-recently-used eviction so
+the file never grows without limit. Eviction runs every ``evict_every`` writes:
+it first purges entries expired for longer than ``stale_for`` (kept until then
+for stale reads), then drops the least recently used entries over the bound.
+Several processes can share the same file; SQLite takes care of the locking
+between them.
+"""
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    key TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    value TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL,
+    accessed_at REAL NOT NULL
+)
+"""
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalize a search query so trivially different spellings share a cache entry
+    """
+    return re.sub(r"\s+", " ", str(query)).strip().lower()
+
+
+class PersistentCache:
+    """
+    SQLite-backed cache with per-kind TTLs, LRU size bounding and hit/miss counters.
+
+    Args:
+        path (str): Location of the SQLite file (":memory:" for a private cache)
+        ttls (dict): Time-to-live in seconds per entry kind, None meaning "never expires"
+        default_ttl (float): TTL used for kinds missing from ``ttls``
+        max_entries (int): Upper bound on stored entries before LRU eviction (exceeded by
+            at most ``evict_every`` writes between two evictions)
+        stale_for (float): Seconds an expired entry stays available to ``allow_stale`` reads
+            before it is purged (None keeps it until LRU eviction)
+        evict_every (int): Writes between two evictions
+    """
+
+    def __init__(self, path: str, ttls: dict = None, default_ttl: float = 3600,
+                 max_entries: int = 10000, stale_for: float = 0.0, evict_every: int = 100):
+        self.path = path
+        self.ttls = dict(ttls or {})
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self.stale_for = stale_for
+        self.evict_every = max(1, evict_every)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.purged = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS cache_accessed ON cache (accessed_at)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS cache_expires ON cache (expires_at)")
+        self._conn.commit()
+
+    def ttl_for(self, kind: str):
+        """Return the TTL in seconds for the given kind"""
+        return self.ttls.get(kind, self.default_ttl)
+
+    def get(self, key: str, kind: str = "default", allow_stale: bool = False):
+        """
+        Look up a cached value
+
+        Args:
+            key (str): The cache key
+            kind (str): The entry kind the key was stored under
+            allow_stale (bool): Return expired entries instead of treating them as misses
+
+        Returns:
+            The cached value, or None on a miss
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?",
+                (self._key(key, kind),)
+            ).fetchone()
+            if row is None or (not allow_stale and row[1] is not None and row[1] < now):
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE cache SET accessed_at = ? WHERE key = ?",
+                (now, self._key(key, kind))
+            )
+            self._conn.commit()
+            self.hits += 1
+        return json.loads(row[0])
+
+    def set(self, key: str, value, kind: str = "default"):
+        """
+        Store a JSON-serializable value, purging expired and evicting the least
+        recently used entries every ``evict_every`` writes
+        """
+        now = time.time()
+        ttl = self.ttl_for(kind)
+        expires_at = now + ttl if ttl is not None else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, kind, value, created_at, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (self._key(key, kind), kind, json.dumps(value), now, expires_at, now)
+            )
+            self._writes += 1
+            if self._writes % self.evict_every == 0:
+                self._evict(now)
+            self._conn.commit()
+
+    def clear(self):
+        """Remove every entry and reset the counters"""
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+            self._conn.commit()
+            self.hits = self.misses = self.evictions = self.purged = 0
+
+    def stats(self) -> dict:
+        """
+        Return hit/miss counters and the current size of the cache
+        """
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "purged": self.purged,
+            "entries": entries,
+            "max_entries": self.max_entries,
+        }
+
+    def close(self):
+        """Close the underlying SQLite connection"""
+        with self._lock:
+            self._conn.close()
+
+    def _evict(self, now):
+        # Purge rows expired beyond their stale period, then drop the least recently used rows over the bound
+        if self.stale_for is not None:
+            self.purged += self._conn.execute(
+                "DELETE FROM cache WHERE expires_at < ?", (now - self.stale_for,)
+            ).rowcount
+        count = self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM cache WHERE key IN "
+                "(SELECT key FROM cache ORDER BY accessed_at ASC LIMIT ?)",
+                (overflow,)
+            )
+            self.evictions += overflow
+
+    @staticmethod
+    def _key(key: str, kind: str) -> str:
+        return f"{kind}:{key}"
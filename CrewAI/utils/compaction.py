@@ -0,0 +1,216 @@
+"""
+Tool Output Compaction
+======================
+
+Shrinks tool outputs to a token budget before they enter an agent's prompt.
+
+Search results and scraped pages arrive with separators, raw response fields,
+cookie banners and the same result repeated across queries. Compaction:
+
+1. strips boilerplate (separators, navigation/legal lines, bookkeeping fields
+   of raw JSON responses),
+2. drops duplicate results and lines,
+3. if still over budget, keeps the blocks most relevant to the tool's input
+   (in their original order) and truncates the rest.
+
+The budget is the current task's entry in TASK_TOOL_OUTPUT_MAX_TOKENS, or
+TOOL_OUTPUT_MAX_TOKENS, both derived from MAX_TOKENS in the settings.
+"""
+import asyncio
+import functools
+import json
+import math
+import re
+
+from utils.events import current_task
+
+# Rough size of a token for English text and URLs; good enough for budgeting
+CHARS_PER_TOKEN = 4
+
+# Bookkeeping fields of raw search responses that carry no information for the agent
+BOILERPLATE_FIELDS = {
+    "searchParameters", "credits", "position", "sitelinks", "imageUrl", "thumbnailUrl",
+    "cid", "attributes", "relatedSearches", "peopleAlsoAsk",
+}
+
+_BOILERPLATE_LINE = re.compile(
+    r"^(?:-{3,}|={3,}|skip to (?:main )?content|sign in|log ?in|sign up|subscribe|"
+    r"menu|search|share|accept(?: all)? cookies|.*\bcookies?\b.*policy.*|"
+    r".*all rights reserved.*|privacy policy|terms of (?:use|service)|©.*)$",
+    re.IGNORECASE
+)
+_WORD = re.compile(r"[a-z0-9]{3,}")
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate number of tokens in a text"""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def strip_fields(value):
+    """
+    Drop boilerplate fields from a raw (JSON-like) response, recursively
+    """
+    if isinstance(value, dict):
+        return {k: strip_fields(v) for k, v in value.items() if k not in BOILERPLATE_FIELDS}
+    if isinstance(value, list):
+        return [strip_fields(item) for item in value]
+    return value
+
+
+def _blocks(text: str) -> list:
+    # A block is a run of lines between blank lines or separators, e.g. one search result
+    blocks, current = [], []
+    for line in text.split("\n"):
+        line = line.strip()
+        if not line or _BOILERPLATE_LINE.match(line):
+            if current:
+                blocks.append(current)
+                current = []
+            continue
+        current.append(line)
+    if current:
+        blocks.append(current)
+    return blocks
+
+
+def _relevance(block: str, query_words: set, position: int) -> float:
+    words = set(_WORD.findall(block.lower()))
+    overlap = len(words & query_words) / math.sqrt(len(words) or 1)
+    return overlap + 1.0 / (position + 2)  # Earlier blocks win ties (search rank, page order)
+
+
+def _truncate(text: str, max_tokens: int) -> str:
+    limit = max_tokens * CHARS_PER_TOKEN
+    if len(text) <= limit:
+        return text
+    cut = text.rfind(" ", 0, limit)
+    return text[:cut if cut > 0 else limit] + " ..."
+
+
+def compact_text(text: str, max_tokens: int, query: str = "") -> str:
+    """
+    Compact a text to at most about ``max_tokens`` tokens
+
+    Args:
+        text (str): Tool output
+        max_tokens (int): Token budget
+        query (str): What the tool was asked, used to rank blocks by relevance
+
+    Returns:
+        str: The compacted text
+    """
+    # Blocks too large to rank (e.g. a scraped page without blank lines) are ranked line by line
+    units = []
+    for lines in _blocks(text):
+        if estimate_tokens("\n".join(lines)) > max_tokens // 2:
+            units.extend([line] for line in lines)
+        else:
+            units.append(lines)
+
+    # Drop repeated blocks, and results whose link was already listed
+    seen_blocks, seen_links = set(), set()
+    blocks = []
+    for lines in units:
+        block = "\n".join(lines)
+        key = " ".join(block.lower().split())
+        links = {line.lower() for line in lines if line.lower().startswith("link:")}
+        if key in seen_blocks or (links and links <= seen_links):
+            continue
+        seen_blocks.add(key)
+        seen_links |= links
+        blocks.append(block)
+
+    compacted = "\n\n".join(blocks)
+    if estimate_tokens(compacted) <= max_tokens:
+        return compacted
+
+    query_words = set(_WORD.findall(query.lower()))
+    ranked = sorted(
+        range(len(blocks)),
+        key=lambda i: _relevance(blocks[i], query_words, i),
+        reverse=True
+    )
+    selected, used = set(), 0
+    for i in ranked:
+        cost = estimate_tokens(blocks[i]) + 1
+        if used + cost <= max_tokens:
+            selected.add(i)
+            used += cost
+
+    if not selected:
+        return _truncate(blocks[ranked[0]], max_tokens)
+    kept = [blocks[i] for i in sorted(selected)]
+    note = f"[{len(blocks) - len(kept)} less relevant passages omitted]"
+    return "\n\n".join(kept + [note])
+
+
+def compact_output(value, max_tokens: int, query: str = ""):
+    """
+    Compact a tool's return value (a string, a list of strings or a raw response)
+
+    Short list items (headers, traveler details) are kept as they are; the
+    remaining budget is shared by the long items in proportion to their size.
+    """
+    if isinstance(value, dict):
+        value = json.dumps(strip_fields(value), ensure_ascii=False, separators=(",", ":"))
+    if isinstance(value, str):
+        return compact_text(value, max_tokens, query)
+    if not isinstance(value, (list, tuple)):
+        return value
+
+    items = [
+        json.dumps(strip_fields(item), ensure_ascii=False, separators=(",", ":"))
+        if isinstance(item, dict) else item
+        for item in value
+    ]
+    sizes = [estimate_tokens(item) if isinstance(item, str) else 0 for item in items]
+    if sum(sizes) <= max_tokens:
+        return [compact_text(item, max_tokens, query) if isinstance(item, str) else item for item in items]
+
+    short_limit = max(max_tokens // (4 * len(items)), 1)
+    short_total = sum(size for size in sizes if size <= short_limit)
+    long_total = sum(size for size in sizes if size > short_limit) or 1
+    remaining = max(max_tokens - short_total, 0)
+    return [
+        compact_text(item, max(remaining * size // long_total, 1), query)
+        if isinstance(item, str) and size > short_limit else item
+        for item, size in zip(items, sizes)
+    ]
+
+
+def budget_for_current_task() -> int:
+    """
+    Return the tool output token budget of the task being executed
+    """
+    from config.settings import TOOL_OUTPUT_MAX_TOKENS, TASK_TOOL_OUTPUT_MAX_TOKENS
+
+    task = current_task()
+    name = task.get("task") if task else None
+    return TASK_TOOL_OUTPUT_MAX_TOKENS.get(name, TOOL_OUTPUT_MAX_TOKENS)
+
+
+def _compact_result(result, args, kwargs):
+    from config.settings import COMPACTION_ENABLED
+
+    if not COMPACTION_ENABLED:
+        return result
+    query = " ".join(str(v) for v in list(args) + list(kwargs.values()) if isinstance(v, str))
+    return compact_output(result, budget_for_current_task(), query)
+
+
+def compacted(run):
+    """
+    Decorator for a tool's ``_run`` or ``_arun`` compacting its output to the
+    current task's budget; the tool's string arguments are the relevance query
+    """
+    if asyncio.iscoroutinefunction(run):
+        @functools.wraps(run)
+        async def async_wrapper(self, *args, **kwargs):
+            return _compact_result(await run(self, *args, **kwargs), args, kwargs)
+        return async_wrapper
+
+    @functools.wraps(run)
+    def wrapper(self, *args, **kwargs):
+        return _compact_result(run(self, *args, **kwargs), args, kwargs)
+    return wrapper
@@ -0,0 +1,169 @@
+"""
+Concurrency Helpers
+===================
+
+Shared worker pool for I/O-bound fan-out (e.g. several Serper lookups made by
+one tool call). Using a single process-wide pool keeps thread creation off the
+hot path and bounds the number of in-flight requests.
+
+Async code gets the same building blocks: ``afan_out`` for concurrent
+coroutines with per-call deadlines, and ``run_sync`` to call a coroutine from
+synchronous code on a shared background event loop.
+"""
+import asyncio
+import concurrent.futures
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+MAX_IO_WORKERS = 32
+
+_io_executor = None
+_io_executor_lock = threading.Lock()
+
+
+def get_io_executor() -> ThreadPoolExecutor:
+    """
+    Return the shared thread pool used for outbound I/O
+    """
+    global _io_executor
+    with _io_executor_lock:
+        if _io_executor is None:
+            _io_executor = ThreadPoolExecutor(
+                max_workers=MAX_IO_WORKERS,
+                thread_name_prefix="crewai-io"
+            )
+    return _io_executor
+
+
+def fan_out(calls: list, timeouts: list = None) -> list:
+    """
+    Run callables concurrently and return their outcomes in the original order.
+
+    Every call gets its own deadline measured from submission, so one slow call
+    never delays the results of the others. Calls that miss their deadline are
+    reported as a TimeoutError and left to finish in the background.
+
+    Args:
+        calls (list): Zero-argument callables to run
+        timeouts (list): Optional per-call timeouts in seconds (None means wait forever)
+
+    Returns:
+        list: For each call, its return value or the exception it raised
+    """
+    executor = get_io_executor()
+    start = time.monotonic()
+    futures = [executor.submit(call) for call in calls]
+    timeouts = timeouts or [None] * len(futures)
+
+    outcomes = []
+    for future, timeout in zip(futures, timeouts):
+        remaining = None if timeout is None else max(0.0, start + timeout - time.monotonic())
+        try:
+            outcomes.append(future.result(timeout=remaining))
+        except TimeoutError:
+            future.cancel()
+            outcomes.append(TimeoutError(f"timed out after {timeout}s"))
+        except Exception as e:
+            outcomes.append(e)
+    return outcomes
+
+
+async def afan_out(coros: list, timeouts: list = None) -> list:
+    """
+    Await coroutines concurrently and return their outcomes in the original order.
+
+    The async counterpart of fan_out: calls that miss their deadline are
+    cancelled and reported as a TimeoutError.
+
+    Args:
+        coros (list): Coroutines to await
+        timeouts (list): Optional per-call timeouts in seconds (None means wait forever)
+
+    Returns:
+        list: For each coroutine, its return value or the exception it raised
+    """
+    timeouts = timeouts or [None] * len(coros)
+
+    async def guarded(coro, timeout):
+        try:
+            return await asyncio.wait_for(coro, timeout)
+        except TimeoutError:
+            if timeout is None:
+                raise  # Raised by the coroutine itself: keep its own message
+            return TimeoutError(f"timed out after {timeout}s")
+
+    return await asyncio.gather(
+        *(guarded(coro, timeout) for coro, timeout in zip(coros, timeouts)),
+        return_exceptions=True
+    )
+
+
+_background_loop = None
+_background_loop_lock = threading.Lock()
+
+
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return the shared event loop running in a daemon thread, starting it on first use
+    """
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="crewai-async-io", daemon=True
+            ).start()
+            _background_loop = loop
+    return _background_loop
+
+
+def run_sync(coro, timeout: float = None):
+    """
+    Run a coroutine on the background event loop and wait for its result.
+
+    Lets synchronous callers (crewai runs tools synchronously) use async
+    implementations without starting an event loop per call. The caller's
+    context variables (event sink, current task) carry over to the coroutine.
+
+    Args:
+        coro: The coroutine to run
+        timeout (float): Seconds to wait before cancelling it (None means wait forever)
+
+    Returns:
+        The coroutine's result; its exception is re-raised
+    """
+    loop = get_background_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError("run_sync() cannot be called from the background loop; await the coroutine")
+
+    context = contextvars.copy_context()
+    done = concurrent.futures.Future()
+    tasks = []
+
+    def start():
+        task = loop.create_task(coro, context=context)
+        tasks.append(task)
+        task.add_done_callback(lambda t: _copy_outcome(t, done))
+
+    loop.call_soon_threadsafe(start)
+    try:
+        return done.result(timeout)
+    except concurrent.futures.TimeoutError:
+        loop.call_soon_threadsafe(lambda: tasks and tasks[0].cancel())
+        raise TimeoutError(f"timed out after {timeout}s") from None
+
+
+def _copy_outcome(task, future):
+    if task.cancelled():
+        future.cancel()
+    elif task.exception() is not None:
+        future.set_exception(task.exception())
+    else:
+        future.set_result(task.result())
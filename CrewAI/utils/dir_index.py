@@ -0,0 +1,219 @@
+"""
+Directory Index Module
+======================
+
+A persistent manifest of directory trees (path, size, mtime and content hash
+of every file), kept in SQLite and updated incrementally.
+
+DirectoryReadTool walks the whole tree with os.walk on every call. Here a
+tree is walked with os.scandir, which returns each entry's type without an
+extra system call, and a file is only read (hashed) when its size or mtime
+differs from the manifest. Files that disappeared are dropped. A tree scanned
+less than ``max_age`` seconds ago is answered from the manifest without
+touching the file system at all.
+
+Only one thread per tree scans at a time; concurrent callers wait for it and
+then share the result.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import List
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    root TEXT NOT NULL,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    hash TEXT,
+    PRIMARY KEY (root, path)
+);
+CREATE TABLE IF NOT EXISTS roots (
+    root TEXT PRIMARY KEY,
+    scanned_at REAL NOT NULL
+);
+"""
+
+_READ_CHUNK = 1024 * 1024
+
+
+def file_hash(path: str, max_bytes: int = None):
+    """
+    Return the SHA-256 of a file's content, or None if it is larger than ``max_bytes``
+    """
+    if max_bytes is not None and os.path.getsize(path) > max_bytes:
+        return None
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_READ_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def scan_tree(root: str):
+    """
+    Yield ``(relative path, size, mtime_ns)`` for every file under a directory,
+    using os.scandir and without following symbolic links to directories
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            stat = entry.stat()
+                            yield os.path.relpath(entry.path, root), stat.st_size, stat.st_mtime_ns
+                    except OSError:
+                        continue  # Vanished or unreadable while scanning
+        except OSError:
+            continue
+
+
+class DirectoryIndex:
+    """
+    SQLite manifest of directory trees with incremental rescans
+
+    Args:
+        path (str): Location of the SQLite file (":memory:" for a private index)
+        max_age (float): Seconds a scan is reused before the tree is walked again
+        hash_max_bytes (int): Files larger than this are listed but not hashed
+    """
+
+    def __init__(self, path: str, max_age: float = 60, hash_max_bytes: int = 64 * 1024 * 1024):
+        self.path = path
+        self.max_age = max_age
+        self.hash_max_bytes = hash_max_bytes
+        self.stats = {"cached": 0, "scans": 0, "hashed": 0, "unchanged": 0, "removed": 0}
+        self._lock = threading.Lock()
+        self._root_locks = {}
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def list_files(self, root: str, refresh: bool = False) -> List[dict]:
+        """
+        Return the files under a directory, rescanning it only if the last scan is too old
+
+        Args:
+            root (str): The directory
+            refresh (bool): Rescan even if the last scan is recent
+
+        Returns:
+            list: Dicts with the relative path, size, mtime_ns and hash of each file,
+                sorted by path
+        """
+        root = os.path.abspath(root)
+        if not refresh and self._is_fresh(root):
+            self._count("cached")
+            return self._load(root)
+
+        with self._root_lock(root):
+            # Another thread may have scanned it while we waited
+            if refresh or not self._is_fresh(root):
+                self.scan(root)
+            else:
+                self._count("cached")
+        return self._load(root)
+
+    def scan(self, root: str) -> dict:
+        """
+        Bring the manifest of a directory up to date, hashing only new or changed files
+
+        Returns:
+            dict: Numbers of files hashed, unchanged and removed
+        """
+        root = os.path.abspath(root)
+        with self._lock:
+            known = {
+                path: (size, mtime_ns)
+                for path, size, mtime_ns in self._conn.execute(
+                    "SELECT path, size, mtime_ns FROM files WHERE root = ?", (root,)
+                )
+            }
+
+        changed, seen = [], set()
+        for path, size, mtime_ns in scan_tree(root):
+            seen.add(path)
+            if known.get(path) == (size, mtime_ns):
+                continue
+            try:
+                digest = file_hash(os.path.join(root, path), self.hash_max_bytes)
+            except OSError:
+                continue
+            changed.append((root, path, size, mtime_ns, digest))
+        removed = [(root, path) for path in known if path not in seen]
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO files (root, path, size, mtime_ns, hash) VALUES (?, ?, ?, ?, ?)",
+                changed
+            )
+            self._conn.executemany("DELETE FROM files WHERE root = ? AND path = ?", removed)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO roots (root, scanned_at) VALUES (?, ?)", (root, time.time())
+            )
+            self._conn.commit()
+            counts = {"hashed": len(changed), "unchanged": len(seen) - len(changed), "removed": len(removed)}
+            self.stats["scans"] += 1
+            for key, value in counts.items():
+                self.stats[key] += value
+        return counts
+
+    def close(self):
+        """Close the underlying SQLite connection"""
+        with self._lock:
+            self._conn.close()
+
+    def _is_fresh(self, root):
+        with self._lock:
+            row = self._conn.execute("SELECT scanned_at FROM roots WHERE root = ?", (root,)).fetchone()
+        return row is not None and time.time() - row[0] < self.max_age
+
+    def _load(self, root):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path, size, mtime_ns, hash FROM files WHERE root = ? ORDER BY path", (root,)
+            ).fetchall()
+        return [{"path": path, "size": size, "mtime_ns": mtime_ns, "hash": digest}
+                for path, size, mtime_ns, digest in rows]
+
+    def _root_lock(self, root):
+        with self._lock:
+            return self._root_locks.setdefault(root, threading.Lock())
+
+    def _count(self, outcome):
+        with self._lock:
+            self.stats[outcome] += 1
+
+
+_directory_index = None
+_directory_index_lock = threading.Lock()
+
+
+def get_directory_index() -> DirectoryIndex:
+    """
+    Return the process-wide directory index, creating it on first use
+    """
+    global _directory_index
+    from config.settings import DIRECTORY_INDEX_PATH, DIRECTORY_INDEX_MAX_AGE, DIRECTORY_INDEX_HASH_MAX_BYTES
+
+    with _directory_index_lock:
+        if _directory_index is None:
+            _directory_index = DirectoryIndex(
+                DIRECTORY_INDEX_PATH,
+                max_age=DIRECTORY_INDEX_MAX_AGE,
+                hash_max_bytes=DIRECTORY_INDEX_HASH_MAX_BYTES
+            )
+    return _directory_index
@@ -0,0 +1,270 @@
+"""
+Document Index Module
+=====================
+
+Chunked retrieval over documentation pages, stored in a Chroma database of
+their own (SUPPORT_DOCS_INDEX_DIR, db/support_docs_index/ by default).
+
+Pages are split into overlapping chunks on sentence boundaries and indexed
+under content-hash ids, so re-ingesting a page only embeds the chunks that
+changed and deletes the ones that disappeared; an unchanged page costs no
+embedding calls at all. Agents then get the top-k chunks relevant to their
+question instead of the whole page.
+"""
+import hashlib
+import re
+import threading
+import time
+from typing import List
+
+# Sentence ends and line breaks, the preferred places to cut a chunk
+_BOUNDARY_PATTERN = re.compile(r"(?<=[.!?])\s+|\n+")
+
+
+def content_hash(text: str) -> str:
+    """Return a short, stable hash of a text"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def chunk_text(text: str, chunk_size: int = 1000, overlap: int = 150) -> List[str]:
+    """
+    Split text into chunks of at most ``chunk_size`` characters, cut on sentence
+    boundaries where possible. Each chunk starts with up to ``overlap`` characters
+    from the end of the previous one (whole sentences when they fit, otherwise
+    whole words) so no passage loses its context.
+
+    Args:
+        text (str): The text to split
+        chunk_size (int): Maximum characters per chunk
+        overlap (int): Characters carried over from the previous chunk
+
+    Returns:
+        list: The chunks, in document order
+    """
+    units = []
+    for unit in _BOUNDARY_PATTERN.split(text):
+        unit = unit.strip()
+        # Sentences longer than a chunk are cut on word boundaries, then hard-cut
+        while len(unit) > chunk_size:
+            cut = unit.rfind(" ", 0, chunk_size)
+            cut = cut if cut > 0 else chunk_size
+            units.append(unit[:cut])
+            unit = unit[cut:].strip()
+        if unit:
+            units.append(unit)
+
+    chunks = []
+    current = []
+    for unit in units:
+        if not current or len(" ".join(current + [unit])) <= chunk_size:
+            current.append(unit)
+            continue
+        chunks.append(" ".join(current))
+        current = _overlap_tail(current, overlap)
+        if len(" ".join(current + [unit])) > chunk_size:
+            current = []
+        current.append(unit)
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
+
+
+def _overlap_tail(units: List[str], overlap: int) -> List[str]:
+    # Trailing sentences fitting in the overlap, or the trailing words of the last one
+    tail = []
+    for unit in reversed(units):
+        if len(" ".join([unit] + tail)) > overlap:
+            break
+        tail.insert(0, unit)
+    if tail or not overlap:
+        return tail
+    words = units[-1][-overlap:].split(" ")[1:]
+    return [" ".join(words)] if words else []
+
+
+class DocIndex:
+    """
+    A Chroma collection of document chunks with incremental, hash-based ingestion
+
+    Args:
+        path (str): Directory of the persistent Chroma database
+        collection_name (str): Collection holding the chunks
+        embedding_function: Chroma embedding function (defaults to get_embedding_function())
+        chunk_size (int): Maximum characters per chunk
+        overlap (int): Characters repeated between consecutive chunks
+    """
+
+    def __init__(self, path: str, collection_name: str, embedding_function=None,
+                 chunk_size: int = 1000, overlap: int = 150):
+        import chromadb
+
+        self.chunk_size = chunk_size
+        self.overlap = overlap
+        self._client = chromadb.PersistentClient(path=path)
+        self._collection = self._client.get_or_create_collection(
+            collection_name,
+            embedding_function=embedding_function or get_embedding_function(),
+            metadata={"hnsw:space": "cosine"}
+        )
+        self._lock = threading.Lock()
+        self._ingested = {}  # source -> (content hash, chunk count) last ingested by this process
+
+    def ingest(self, source: str, text: str) -> dict:
+        """
+        Index a document, embedding only the chunks that are not indexed yet
+
+        Args:
+            source (str): Identifier of the document (e.g. its URL)
+            text (str): The document text
+
+        Returns:
+            dict: Numbers of chunks added, removed and left unchanged
+        """
+        with self._lock:
+            doc_hash = content_hash(text)
+            ingested = self._ingested.get(source)
+            if ingested is not None and ingested[0] == doc_hash:
+                return {"added": 0, "removed": 0, "unchanged": ingested[1]}
+
+            source_key = content_hash(source)
+            chunks = {}
+            for position, chunk in enumerate(chunk_text(text, self.chunk_size, self.overlap)):
+                chunks.setdefault(f"{source_key}:{content_hash(chunk)}", (position, chunk))
+
+            existing = set(self._collection.get(where={"source": source}, include=[])["ids"])
+            new_ids = [chunk_id for chunk_id in chunks if chunk_id not in existing]
+            stale_ids = [chunk_id for chunk_id in existing if chunk_id not in chunks]
+
+            if new_ids:
+                self._collection.add(
+                    ids=new_ids,
+                    documents=[chunks[chunk_id][1] for chunk_id in new_ids],
+                    metadatas=[{"source": source, "position": chunks[chunk_id][0]} for chunk_id in new_ids]
+                )
+            if stale_ids:
+                self._collection.delete(ids=stale_ids)
+
+            self._ingested[source] = (doc_hash, len(chunks))
+            return {"added": len(new_ids), "removed": len(stale_ids),
+                    "unchanged": len(chunks) - len(new_ids)}
+
+    def search(self, query: str, k: int = 4, source: str = None) -> List[dict]:
+        """
+        Return the ``k`` chunks most relevant to a query
+
+        Args:
+            query (str): The question to match
+            k (int): Number of chunks to return
+            source (str): Only search chunks of this document
+
+        Returns:
+            list: Dicts with the chunk text, its source and position, and the distance
+        """
+        results = self._collection.query(
+            query_texts=[query],
+            n_results=k,
+            where={"source": source} if source else None
+        )
+        return [
+            {"text": text, "source": metadata["source"], "position": metadata["position"],
+             "distance": distance}
+            for text, metadata, distance in zip(
+                results["documents"][0], results["metadatas"][0], results["distances"][0]
+            )
+        ]
+
+
+_embedding_function = None
+_embedding_function_lock = threading.Lock()
+
+
+def get_embedding_function():
+    """
+    Return the embedding function used by the document indexes
+    (cached OpenAI embeddings unless another one was set with set_embedding_function)
+    """
+    global _embedding_function
+    with _embedding_function_lock:
+        if _embedding_function is None:
+            from chromadb.utils.embedding_functions import OpenAIEmbeddingFunction
+            from config.settings import OPENAI_API_KEY, EMBEDDING_MODEL
+            from utils.embedding_cache import cached_embedding_function
+
+            _embedding_function = cached_embedding_function(
+                OpenAIEmbeddingFunction(api_key=OPENAI_API_KEY, model_name=EMBEDDING_MODEL),
+                f"openai:{EMBEDDING_MODEL}"
+            )
+    return _embedding_function
+
+
+def set_embedding_function(embedding_function):
+    """
+    Use a different Chroma embedding function for indexes created from now on
+    """
+    global _embedding_function
+    with _embedding_function_lock:
+        _embedding_function = embedding_function
+
+
+_support_docs_index = None
+_support_docs_index_lock = threading.Lock()
+
+
+def get_support_docs_index() -> DocIndex:
+    """
+    Return the process-wide index of the support documentation, creating it on first use
+    """
+    global _support_docs_index
+    from config.settings import (
+        SUPPORT_DOCS_INDEX_DIR, SUPPORT_DOCS_COLLECTION, DOC_CHUNK_SIZE, DOC_CHUNK_OVERLAP
+    )
+
+    with _support_docs_index_lock:
+        if _support_docs_index is None:
+            _support_docs_index = DocIndex(
+                SUPPORT_DOCS_INDEX_DIR,
+                SUPPORT_DOCS_COLLECTION,
+                chunk_size=DOC_CHUNK_SIZE,
+                overlap=DOC_CHUNK_OVERLAP
+            )
+    return _support_docs_index
+
+
+_ingested_at = {}  # URL -> time this process last ingested it
+_ingested_at_lock = threading.Lock()
+
+
+def ingest_support_docs(urls: List[str] = None, max_age: float = None) -> dict:
+    """
+    Bring the support docs index up to date with the current page snapshots
+
+    Args:
+        urls (list): Pages to ingest (defaults to SUPPORT_DOCS_URL)
+        max_age (float): Skip pages this process ingested less than max_age seconds ago
+            (None to ingest every page)
+
+    Returns:
+        dict: Ingestion counts per URL, for the pages that were ingested
+    """
+    from config.settings import SUPPORT_DOCS_URL
+    from utils.snapshots import get_snapshot_store
+
+    now = time.time()
+    with _ingested_at_lock:
+        due = [url for url in (urls or [SUPPORT_DOCS_URL])
+               if max_age is None or now - _ingested_at.get(url, float("-inf")) >= max_age]
+    if not due:
+        return {}
+
+    index = get_support_docs_index()
+    store = get_snapshot_store()
+    counts = {url: index.ingest(url, store.get_text(url)) for url in due}
+    with _ingested_at_lock:
+        _ingested_at.update(dict.fromkeys(due, now))
+    return counts
+
+
+if __name__ == "__main__":
+    # Ingestion step: python -m utils.doc_index
+    for url, counts in ingest_support_docs().items():
+        print(f"{url}: {counts}")
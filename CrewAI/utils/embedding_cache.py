@@ -0,0 +1,220 @@
+"""
+Embedding Cache
+===============
+
+Embeddings on disk, keyed by a hash of the embedding model and the text.
+
+The RAG tools (CSV, DOCX, PDF, website, GitHub search...) embed their source
+every time they are constructed, and the docs index embeds every new chunk.
+Wrapping their embedding functions in CachedEmbeddingFunction means a chunk
+that was embedded once, by any tool and in any process, is never sent to the
+embeddings provider again: re-opening the same file or page only embeds the
+chunks that changed.
+
+Vectors are stored as float32 blobs in SQLite, bounded by least-recently-used
+eviction.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from typing import List
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    key TEXT PRIMARY KEY,
+    vector BLOB NOT NULL,
+    accessed_at REAL NOT NULL
+)
+"""
+
+# SQLite limits the number of parameters of one statement
+_BATCH = 500
+
+
+def embedding_key(model: str, text: str) -> str:
+    """Return the cache key of a text embedded by a model"""
+    return hashlib.sha256(f"{model}\0{text}".encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    SQLite store of embedding vectors with LRU size bounding
+
+    Args:
+        path (str): Location of the SQLite file (":memory:" for a private cache)
+        max_entries (int): Upper bound on stored vectors before LRU eviction
+    """
+
+    def __init__(self, path: str, max_entries: int = 200000):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS embeddings_accessed ON embeddings (accessed_at)")
+        self._conn.commit()
+
+    def get_many(self, keys: List[str]) -> dict:
+        """
+        Look up vectors by key
+
+        Returns:
+            dict: key -> vector (list of floats) for the keys found
+        """
+        found = {}
+        now = time.time()
+        with self._lock:
+            for start in range(0, len(keys), _BATCH):
+                batch = keys[start:start + _BATCH]
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(batch))})",
+                    batch
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = array("f", blob).tolist()
+            if found:
+                self._conn.executemany(
+                    "UPDATE embeddings SET accessed_at = ? WHERE key = ?",
+                    [(now, key) for key in found]
+                )
+                self._conn.commit()
+            self.hits += len(found)
+            self.misses += len(set(keys)) - len(found)
+        return found
+
+    def set_many(self, vectors: dict):
+        """
+        Store vectors (key -> list of floats), evicting the least recently used ones if needed
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector, accessed_at) VALUES (?, ?, ?)",
+                [(key, array("f", vector).tobytes(), now) for key, vector in vectors.items()]
+            )
+            overflow = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0] - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    "DELETE FROM embeddings WHERE key IN "
+                    "(SELECT key FROM embeddings ORDER BY accessed_at ASC LIMIT ?)",
+                    (overflow,)
+                )
+            self._conn.commit()
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and the number of stored vectors"""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": entries,
+            "max_entries": self.max_entries,
+        }
+
+    def close(self):
+        """Close the underlying SQLite connection"""
+        with self._lock:
+            self._conn.close()
+
+
+class CachedEmbeddingFunction:
+    """
+    Chroma embedding function that only embeds texts missing from the cache
+
+    Args:
+        embedding_function: The wrapped embedding function (``fn(input) -> vectors``)
+        model (str): Name of the embedding model, part of every cache key
+        cache (EmbeddingCache): Where vectors are kept (defaults to get_embedding_cache())
+    """
+
+    def __init__(self, embedding_function, model: str, cache: EmbeddingCache = None):
+        self.embedding_function = embedding_function
+        self.model = model
+        self.cache = cache or get_embedding_cache()
+
+    def __call__(self, input: List[str]) -> List[List[float]]:
+        keys = [embedding_key(self.model, text) for text in input]
+        vectors = self.cache.get_many(keys)
+
+        # Each distinct missing text is embedded once, in a single provider call
+        missing = {}
+        for key, text in zip(keys, input):
+            if key not in vectors:
+                missing.setdefault(key, text)
+        if missing:
+            embedded = self.embedding_function(list(missing.values()))
+            new_vectors = {key: [float(v) for v in vector] for key, vector in zip(missing, embedded)}
+            self.cache.set_many(new_vectors)
+            vectors.update(new_vectors)
+        return [vectors[key] for key in keys]
+
+
+def cached_embedding_function(embedding_function, model: str):
+    """
+    Wrap an embedding function in the shared cache, unless EMBEDDING_CACHE_ENABLED is off
+    """
+    from config.settings import EMBEDDING_CACHE_ENABLED
+
+    if not EMBEDDING_CACHE_ENABLED or isinstance(embedding_function, CachedEmbeddingFunction):
+        return embedding_function
+    return CachedEmbeddingFunction(embedding_function, model)
+
+
+_embedding_cache = None
+_embedding_cache_lock = threading.Lock()
+_embedchain_patched = False
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """
+    Return the process-wide embedding cache, creating it on first use
+    """
+    global _embedding_cache
+    from config.settings import EMBEDDING_CACHE_PATH, EMBEDDING_CACHE_MAX_ENTRIES
+
+    with _embedding_cache_lock:
+        if _embedding_cache is None:
+            _embedding_cache = EmbeddingCache(EMBEDDING_CACHE_PATH, max_entries=EMBEDDING_CACHE_MAX_ENTRIES)
+    return _embedding_cache
+
+
+def enable_embedding_cache():
+    """
+    Route the embeddings of every crewai_tools RAG tool through the cache.
+
+    The tools embed their source while they are being constructed, through
+    an embedchain embedder, so the cache is installed on embedchain's
+    BaseEmbedder.set_embedding_fn: every embedder created from now on gets a
+    cached embedding function, keyed by its class and model.
+    """
+    global _embedchain_patched
+    from config.settings import EMBEDDING_CACHE_ENABLED
+
+    if not EMBEDDING_CACHE_ENABLED:
+        return
+    from embedchain.embedder.base import BaseEmbedder
+
+    with _embedding_cache_lock:
+        if _embedchain_patched:
+            return
+        set_embedding_fn = BaseEmbedder.set_embedding_fn
+
+        def set_cached_embedding_fn(self, embedding_fn):
+            model = f"{type(self).__name__}:{getattr(self.config, 'model', None)}"
+            return set_embedding_fn(self, cached_embedding_function(embedding_fn, model))
+
+        BaseEmbedder.set_embedding_fn = set_cached_embedding_fn
+        _embedchain_patched = True
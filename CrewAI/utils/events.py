@@ -0,0 +1,114 @@
+"""
+Crew Events Module
+==================
+
+A minimal event bus for observing crew runs while they happen.
+
+Events are plain dicts with a ``type`` and a ``time`` field:
+
+- crew_started / crew_finished / crew_failed
+- task_started / task_finished / task_failed
+- tool_call (emitted after each tool use, with the tool's output)
+- token (a chunk of streamed LLM output)
+
+Each event goes to the sink bound for the current run (see ``bind_sink``) and
+to every global listener (see ``add_listener``). The sink and the current task
+are held in context variables, so concurrent runs never see each other's events.
+"""
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+
+_sink = contextvars.ContextVar("crew_event_sink", default=None)
+_current_task = contextvars.ContextVar("crew_current_task", default=None)
+
+_listeners = []
+_listeners_lock = threading.Lock()
+
+
+def emit(event_type: str, **fields):
+    """
+    Publish an event to the current run's sink and to the global listeners.
+    The current task and agent are attached unless given explicitly.
+    """
+    sink = _sink.get()
+    if sink is None and not _listeners:
+        return
+
+    event = {"type": event_type, "time": time.time()}
+    task = _current_task.get()
+    if task is not None:
+        event.update(task)
+    event.update(fields)
+
+    if sink is not None:
+        sink(event)
+    for listener in list(_listeners):
+        listener(event)
+
+
+@contextmanager
+def bind_sink(sink):
+    """
+    Route the events of everything run inside this block to ``sink``
+
+    Args:
+        sink (callable): Called with each event dict
+    """
+    token = _sink.set(sink)
+    try:
+        yield
+    finally:
+        _sink.reset(token)
+
+
+@contextmanager
+def task_scope(task: str, agent: str):
+    """
+    Mark the task and agent that events emitted inside this block belong to
+    """
+    token = _current_task.set({"task": task, "agent": agent})
+    try:
+        yield
+    finally:
+        _current_task.reset(token)
+
+
+def current_task():
+    """Return the {"task", "agent"} of the task being executed, or None"""
+    return _current_task.get()
+
+
+def add_listener(listener):
+    """Register a callable receiving every event from every run"""
+    with _listeners_lock:
+        _listeners.append(listener)
+
+
+def remove_listener(listener):
+    """Unregister a listener added with add_listener"""
+    with _listeners_lock:
+        if listener in _listeners:
+            _listeners.remove(listener)
+
+
+def on_agent_step(step_output):
+    """
+    crewai step_callback emitting a tool_call event for every tool the agent used.
+
+    crewai passes either a list of (AgentAction, observation) pairs or an
+    AgentFinish; the latter is reported by the task_finished event instead.
+    """
+    if not isinstance(step_output, list):
+        return
+    for step in step_output:
+        if not isinstance(step, tuple) or len(step) != 2:
+            continue
+        action, observation = step
+        emit(
+            "tool_call",
+            tool=getattr(action, "tool", None),
+            tool_input=getattr(action, "tool_input", None),
+            output=observation
+        )
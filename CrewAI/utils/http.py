@@ -0,0 +1,128 @@
+"""
+HTTP Transport Module
+=====================
+
+A process-wide pooled HTTP session shared by every outbound API call.
+
+Connections are kept alive and reused between requests (and between tools),
+so consecutive searches skip the TCP and TLS handshakes. The pool is bounded
+per host, and every request gets a connect and a read timeout unless the
+caller passes its own.
+
+Async callers get an httpx.AsyncClient with the same limits and timeouts.
+A client is tied to the event loop it is used on, so there is one per loop.
+"""
+import asyncio
+import threading
+import weakref
+
+_session = None
+_session_lock = threading.Lock()
+
+_async_clients = weakref.WeakKeyDictionary()  # event loop -> httpx.AsyncClient
+
+
+def get_http_session():
+    """
+    Return the shared requests.Session, creating it on first use.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _create_session()
+    return _session
+
+
+def _create_session():
+    import requests
+    from requests.adapters import HTTPAdapter
+    from config.settings import (
+        HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, HTTP_POOL_BLOCK,
+        HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT
+    )
+
+    class TimeoutAdapter(HTTPAdapter):
+        """HTTPAdapter applying the default timeouts to requests that set none"""
+
+        def send(self, request, timeout=None, **kwargs):
+            if timeout is None:
+                timeout = (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)
+            return super().send(request, timeout=timeout, **kwargs)
+
+    session = requests.Session()
+    adapter = TimeoutAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,  # Hosts with their own connection pool
+        pool_maxsize=HTTP_POOL_MAXSIZE,  # Kept-alive connections per host
+        pool_block=HTTP_POOL_BLOCK,
+        max_retries=0
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_async_http_client():
+    """
+    Return the shared httpx.AsyncClient for the running event loop, creating it on first use.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        import httpx
+        from config.settings import (
+            HTTP_ASYNC_MAX_CONNECTIONS, HTTP_POOL_MAXSIZE, HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT
+        )
+
+        client = _async_clients[loop] = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=HTTP_ASYNC_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_POOL_MAXSIZE
+            ),
+            timeout=httpx.Timeout(HTTP_READ_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT)
+        )
+    return client
+
+
+def http_pool_stats() -> dict:
+    """
+    Return connection reuse counters for the shared session:
+    requests sent, connections opened, requests served on a reused
+    connection and idle connections currently held, per host and in total.
+    ``async_connections`` counts the connections held by the async clients.
+    """
+    hosts = {}
+    adapters = set(_session.adapters.values()) if _session is not None else ()
+    for adapter in adapters:
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            hosts[f"{pool.scheme}://{pool.host}:{pool.port}"] = {
+                "requests": pool.num_requests,
+                "connections_opened": pool.num_connections,
+                "reused": max(pool.num_requests - pool.num_connections, 0),
+                # The pool queue is padded with None for slots without a connection
+                "idle": sum(conn is not None for conn in list(pool.pool.queue)) if pool.pool else 0,
+            }
+
+    totals = {
+        field: sum(host[field] for host in hosts.values())
+        for field in ("requests", "connections_opened", "reused", "idle")
+    }
+    totals["hosts"] = hosts
+    totals["async_connections"] = 0
+    for client in list(_async_clients.values()):
+        pool = getattr(client._transport, "_pool", None)  # httpcore connection pool
+        totals["async_connections"] += len(pool.connections) if pool is not None else 0
+    return totals
+
+
+def close_http_session():
+    """Close every pooled connection (a new session is created on next use)"""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
@@ -0,0 +1,370 @@
+"""
+Crew Memory Store
+=================
+
+Bounded storage for crewai's short-term and entity memory.
+
+crewai's default memory storage (a Chroma collection under db/) keeps every
+item forever, so retrieval slows down and the file grows with every inquiry.
+This store keeps memory items in one SQLite file with a full-text index:
+
+- items live in namespaces (one per customer for the support crew) and kinds
+  (short_term, entities), so one customer's memories never surface in
+  another customer's prompts,
+- an item saved again is stored once, with its timestamps refreshed,
+- items expire ``ttl`` seconds after they were last saved, and each namespace
+  (and the whole store) keeps a bounded number of items, evicting the least
+  recently used ones,
+- every ``compact_every`` writes, expired items are purged, the full-text
+  index is merged and freed pages are returned to the file system.
+
+Retrieval is a BM25 full-text query, which needs no embeddings call; a
+result's score is the fraction of the query's terms it contains.
+"""
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import List
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS memories (
+    id INTEGER PRIMARY KEY,
+    namespace TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    content TEXT NOT NULL,
+    metadata TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    UNIQUE (namespace, kind, hash)
+);
+CREATE INDEX IF NOT EXISTS memories_namespace_accessed ON memories (namespace, accessed_at);
+CREATE INDEX IF NOT EXISTS memories_accessed ON memories (accessed_at);
+CREATE INDEX IF NOT EXISTS memories_created ON memories (created_at);
+CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts USING fts5(
+    content, scope, content='memories', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS memories_insert AFTER INSERT ON memories BEGIN
+    INSERT INTO memories_fts (rowid, content, scope) VALUES (new.id, new.content, new.scope);
+END;
+CREATE TRIGGER IF NOT EXISTS memories_delete AFTER DELETE ON memories BEGIN
+    INSERT INTO memories_fts (memories_fts, rowid, content, scope)
+    VALUES ('delete', old.id, old.content, old.scope);
+END;
+"""
+
+_TERM = re.compile(r"[a-z0-9]{3,}")
+
+# Words too common to say anything about relevance
+STOPWORDS = {
+    "the", "and", "for", "are", "but", "not", "you", "your", "with", "this", "that",
+    "can", "how", "what", "when", "where", "who", "why", "which", "from", "have",
+    "has", "was", "were", "will", "would", "should", "could", "about", "into", "just",
+}
+
+# Full-text candidates fetched per requested result, before scoring
+_CANDIDATES_PER_RESULT = 4
+
+
+def _scope(namespace: str, kind: str) -> str:
+    # One full-text token per namespace and kind, so a search only visits that scope's postings
+    return "s" + hashlib.sha256(f"{namespace}\0{kind}".encode("utf-8")).hexdigest()[:24]
+
+
+def query_terms(text: str) -> List[str]:
+    """Return the distinct, meaningful lowercase terms of a text"""
+    return list(dict.fromkeys(t for t in _TERM.findall(text.lower()) if t not in STOPWORDS))
+
+
+class MemoryStore:
+    """
+    SQLite full-text store of memory items with TTL, LRU bounds and compaction
+
+    Args:
+        path (str): Location of the SQLite file (":memory:" for a private store)
+        ttl (float): Seconds an item is kept after it was last saved, None for no expiry
+        max_entries (int): Items kept per namespace before LRU eviction
+        max_total_entries (int): Items kept across all namespaces before LRU eviction
+        compact_every (int): Writes between two compactions (0 disables them)
+    """
+
+    def __init__(self, path: str, ttl: float = 7 * 24 * 3600, max_entries: int = 500,
+                 max_total_entries: int = 20000, compact_every: int = 200):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_total_entries = max_total_entries
+        self.compact_every = compact_every
+        self.stats = {"saved": 0, "searches": 0, "evicted": 0, "expired": 0, "compactions": 0}
+        self._writes = 0
+        self._lock = threading.Lock()
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        # Must precede the first table of a new file for incremental vacuum to work
+        self._conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def save(self, namespace: str, kind: str, content: str, metadata: dict = None):
+        """
+        Store a memory item, evicting the least recently used items if a bound is exceeded
+
+        Args:
+            namespace (str): Owner of the item (e.g. the customer)
+            kind (str): Memory kind (e.g. "short_term", "entities")
+            content (str): The text to remember
+            metadata (dict): JSON-serializable details returned with the item
+        """
+        now = time.time()
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO memories (namespace, kind, hash, scope, content, metadata, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (namespace, kind, hash) DO UPDATE SET "
+                "metadata = excluded.metadata, created_at = excluded.created_at, "
+                "accessed_at = excluded.accessed_at",
+                (namespace, kind, digest, _scope(namespace, kind), content,
+                 json.dumps(metadata or {}, default=str), now, now)
+            )
+            self._evict(namespace)
+            self._conn.commit()
+            self.stats["saved"] += 1
+            self._writes += 1
+            due = self.compact_every and self._writes >= self.compact_every
+        if due:
+            self.compact()
+
+    def search(self, namespace: str, kind: str, query: str, limit: int = 3,
+               score_threshold: float = 0.0) -> List[dict]:
+        """
+        Return the items of a namespace most relevant to a query
+
+        Args:
+            namespace (str): Owner of the items
+            kind (str): Memory kind
+            query (str): The text to match
+            limit (int): Maximum number of items
+            score_threshold (float): Minimum fraction of the query's terms an item must contain
+
+        Returns:
+            list: Dicts with the item's ``context`` (its text) and ``metadata``
+                (the saved metadata plus its ``score``), best first
+        """
+        terms = query_terms(query)
+        if not terms:
+            return []
+        quoted = " OR ".join(f'"{term}"' for term in terms)
+        match = f"scope:{_scope(namespace, kind)} AND content:({quoted})"
+        oldest = time.time() - self.ttl if self.ttl is not None else 0.0
+
+        with self._lock:
+            self.stats["searches"] += 1
+            rows = self._conn.execute(
+                "SELECT m.id, m.content, m.metadata FROM memories_fts "
+                "JOIN memories m ON m.id = memories_fts.rowid "
+                "WHERE memories_fts MATCH ? AND m.created_at >= ? "
+                "ORDER BY bm25(memories_fts) LIMIT ?",
+                (match, oldest, limit * _CANDIDATES_PER_RESULT)
+            ).fetchall()
+
+            results = []
+            for row_id, content, metadata in rows:
+                words = set(_TERM.findall(content.lower()))
+                score = sum(term in words for term in terms) / len(terms)
+                if score >= score_threshold:
+                    results.append((score, row_id, content, json.loads(metadata)))
+            # Stable sort: equal scores keep the BM25 order
+            results.sort(key=lambda r: r[0], reverse=True)
+            results = results[:limit]
+
+            if results:
+                self._conn.executemany(
+                    "UPDATE memories SET accessed_at = ? WHERE id = ?",
+                    [(time.time(), row_id) for _, row_id, _, _ in results]
+                )
+                self._conn.commit()
+
+        return [
+            {"context": content, "metadata": {**metadata, "score": score}}
+            for score, _, content, metadata in results
+        ]
+
+    def reset(self, namespace: str = None, kind: str = None):
+        """
+        Delete the items of a namespace (and kind), or every item when none is given
+        """
+        clauses, params = [], []
+        if namespace is not None:
+            clauses.append("namespace = ?")
+            params.append(namespace)
+        if kind is not None:
+            clauses.append("kind = ?")
+            params.append(kind)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            self._conn.execute(f"DELETE FROM memories{where}", params)
+            self._conn.commit()
+
+    def compact(self) -> int:
+        """
+        Purge expired items, merge the full-text index and give freed pages
+        back to the file system
+
+        Returns:
+            int: Number of expired items removed
+        """
+        with self._lock:
+            self._writes = 0
+            expired = 0
+            if self.ttl is not None:
+                expired = self._conn.execute(
+                    "DELETE FROM memories WHERE created_at < ?", (time.time() - self.ttl,)
+                ).rowcount
+            self._conn.execute("INSERT INTO memories_fts (memories_fts) VALUES ('optimize')")
+            self._conn.commit()
+            self._conn.execute("PRAGMA incremental_vacuum")
+            if self.path != ":memory:":
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self.stats["expired"] += expired
+            self.stats["compactions"] += 1
+        return expired
+
+    def size(self) -> dict:
+        """
+        Return the number of items, namespaces and the database size in bytes
+        """
+        with self._lock:
+            entries, namespaces = self._conn.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT namespace) FROM memories"
+            ).fetchone()
+            page_count = self._conn.execute("PRAGMA page_count").fetchone()[0]
+            page_size = self._conn.execute("PRAGMA page_size").fetchone()[0]
+        return {"entries": entries, "namespaces": namespaces, "bytes": page_count * page_size}
+
+    def close(self):
+        """Close the underlying SQLite connection"""
+        with self._lock:
+            self._conn.close()
+
+    def _evict(self, namespace):
+        # Least recently used first, within the namespace and then across the store
+        overflow = self._conn.execute(
+            "SELECT COUNT(*) FROM memories WHERE namespace = ?", (namespace,)
+        ).fetchone()[0] - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM memories WHERE id IN (SELECT id FROM memories WHERE namespace = ? "
+                "ORDER BY accessed_at ASC LIMIT ?)",
+                (namespace, overflow)
+            )
+            self.stats["evicted"] += overflow
+
+        overflow = self._conn.execute("SELECT COUNT(*) FROM memories").fetchone()[0] - self.max_total_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM memories WHERE id IN (SELECT id FROM memories ORDER BY accessed_at ASC LIMIT ?)",
+                (overflow,)
+            )
+            self.stats["evicted"] += overflow
+
+
+class MemoryStorage:
+    """
+    crewai memory storage (save/search/reset) over one namespace and kind of a MemoryStore
+
+    Args:
+        store (MemoryStore): The backing store
+        namespace (str): Owner of the items (e.g. the customer)
+        kind (str): Memory kind (e.g. "short_term", "entities")
+    """
+
+    def __init__(self, store: MemoryStore, namespace: str, kind: str):
+        self.store = store
+        self.namespace = namespace
+        self.kind = kind
+
+    def save(self, value, metadata: dict = None):
+        """Store a memory item (called by crewai's Memory.save)"""
+        self.store.save(self.namespace, self.kind, str(value), metadata)
+
+    def search(self, query: str, limit: int = 3, filter: dict = None, score_threshold: float = 0.35):
+        """Return the most relevant items, shaped like crewai's RAGStorage results"""
+        results = self.store.search(self.namespace, self.kind, query, limit, score_threshold)
+        if filter:
+            results = [r for r in results if all(r["metadata"].get(k) == v for k, v in filter.items())]
+        return results
+
+    def reset(self):
+        """Delete every item of this namespace and kind"""
+        self.store.reset(self.namespace, self.kind)
+
+
+def _memory_with_storage(memory_class, storage):
+    # crewai's memory classes build their Chroma storage (client and embedder) in __init__: skip it
+    from crewai.memory.memory import Memory
+
+    memory = memory_class.__new__(memory_class)
+    Memory.__init__(memory, storage)
+    return memory
+
+
+def use_bounded_memory(crew, namespace: str):
+    """
+    Give a crew short-term and entity memory kept in the process-wide
+    MemoryStore, under the given namespace. Long-term memory (one small row
+    per task evaluation) keeps crewai's own SQLite storage.
+
+    Build the crew with memory=False: Crew(memory=True) creates crewai's Chroma
+    storage and embedder up front, which is the cost this store avoids.
+
+    Args:
+        crew: A Crew (built with memory=False)
+        namespace (str): Owner of the crew's memories (e.g. the customer)
+    """
+    from crewai.memory import EntityMemory, LongTermMemory, ShortTermMemory
+
+    store = get_memory_store()
+    crew._short_term_memory = _memory_with_storage(
+        ShortTermMemory, MemoryStorage(store, namespace, "short_term")
+    )
+    crew._entity_memory = _memory_with_storage(EntityMemory, MemoryStorage(store, namespace, "entities"))
+    if getattr(crew, "_long_term_memory", None) is None:
+        crew._long_term_memory = LongTermMemory()
+    crew.memory = True
+    return crew
+
+
+_memory_store = None
+_memory_store_lock = threading.Lock()
+
+
+def get_memory_store() -> MemoryStore:
+    """
+    Return the process-wide memory store, creating it on first use
+    """
+    global _memory_store
+    from config.settings import (
+        MEMORY_STORE_PATH, MEMORY_TTL, MEMORY_MAX_ENTRIES, MEMORY_MAX_TOTAL_ENTRIES,
+        MEMORY_COMPACT_EVERY
+    )
+
+    with _memory_store_lock:
+        if _memory_store is None:
+            _memory_store = MemoryStore(
+                MEMORY_STORE_PATH,
+                ttl=MEMORY_TTL,
+                max_entries=MEMORY_MAX_ENTRIES,
+                max_total_entries=MEMORY_MAX_TOTAL_ENTRIES,
+                compact_every=MEMORY_COMPACT_EVERY
+            )
+    return _memory_store
@@ -0,0 +1,315 @@
+"""
+Metrics Module
+==============
+
+Structured timing instrumentation for crew runs.
+
+Every observation belongs to a metric ("task", "tool", "serper", ...) and a set
+of labels (e.g. task="plan", tool="Travel Guide Tool") and records a duration,
+an optional payload size and whether it failed. The registry keeps running
+aggregates per series and exports them as a JSON snapshot or in Prometheus
+text format.
+
+Sources:
+- Task durations come from the task_finished/task_failed events (utils.events)
+- Tool durations come from tool ``_run``/``_arun`` methods decorated with instrument_tool
+- Serper call durations come from tools.serper_search
+
+The process-wide registry records nothing when METRICS_ENABLED is off.
+"""
+import asyncio
+import contextvars
+import functools
+import json
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Upper bounds (seconds) of the Prometheus histogram buckets
+DEFAULT_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+_PROMETHEUS_PREFIX = "crewai"
+
+
+def payload_size(value) -> int:
+    """
+    Approximate size in bytes of a tool or task payload
+    """
+    if value is None:
+        return 0
+    if isinstance(value, bytes):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    if isinstance(value, (list, tuple)):
+        return sum(payload_size(item) for item in value)
+    return len(json.dumps(value, default=str).encode("utf-8"))
+
+
+class MetricsRegistry:
+    """
+    Thread-safe registry of duration/payload/error aggregates
+
+    Args:
+        buckets (tuple): Histogram bucket upper bounds in seconds
+        enabled (bool): Whether observations are recorded (None to follow METRICS_ENABLED)
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, enabled: bool = True):
+        self.buckets = tuple(sorted(buckets))
+        self.enabled = enabled
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, metric: str, duration: float, payload_bytes: int = 0,
+                error: bool = False, **labels):
+        """
+        Record one observation
+
+        Args:
+            metric (str): Metric name, e.g. "task" or "tool"
+            duration (float): Duration in seconds
+            payload_bytes (int): Size of the payload produced
+            error (bool): Whether the operation failed
+            **labels: Series labels, e.g. task="plan"
+        """
+        if not self.is_enabled():
+            return
+        key = (metric, tuple(sorted((k, str(v)) for k, v in labels.items())))
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = {
+                    "count": 0, "errors": 0, "sum": 0.0,
+                    "min": None, "max": None, "payload_bytes": 0,
+                    "buckets": [0] * len(self.buckets),
+                }
+            series["count"] += 1
+            series["errors"] += int(bool(error))
+            series["sum"] += duration
+            series["min"] = duration if series["min"] is None else min(series["min"], duration)
+            series["max"] = duration if series["max"] is None else max(series["max"], duration)
+            series["payload_bytes"] += payload_bytes
+            for i, bound in enumerate(self.buckets):
+                if duration <= bound:
+                    series["buckets"][i] += 1
+
+    def is_enabled(self) -> bool:
+        """Whether observations are recorded"""
+        if self.enabled is None:
+            from config.settings import METRICS_ENABLED
+            self.enabled = METRICS_ENABLED
+        return self.enabled
+
+    @contextmanager
+    def timer(self, metric: str, **labels):
+        """
+        Time the enclosed block. The yielded dict can be given a "payload_bytes"
+        value; exceptions are recorded as errors and re-raised.
+        """
+        record = {"payload_bytes": 0}
+        start = time.perf_counter()
+        error = False
+        try:
+            yield record
+        except BaseException:
+            error = True
+            raise
+        finally:
+            self.observe(
+                metric,
+                time.perf_counter() - start,
+                payload_bytes=record["payload_bytes"],
+                error=error,
+                **labels
+            )
+
+    def snapshot(self) -> dict:
+        """
+        Return all series as JSON-serializable data, grouped by metric
+        """
+        with self._lock:
+            items = [(key, dict(series)) for key, series in self._series.items()]
+
+        snapshot = {}
+        for (metric, labels), series in items:
+            snapshot.setdefault(metric, []).append({
+                "labels": dict(labels),
+                "count": series["count"],
+                "errors": series["errors"],
+                "total_s": series["sum"],
+                "mean_s": series["sum"] / series["count"] if series["count"] else 0.0,
+                "min_s": series["min"],
+                "max_s": series["max"],
+                "payload_bytes": series["payload_bytes"],
+            })
+        return snapshot
+
+    def to_json(self) -> str:
+        """Return the snapshot serialized as JSON"""
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self) -> str:
+        """
+        Return all series in the Prometheus text exposition format
+        """
+        with self._lock:
+            items = sorted((key, dict(series, buckets=list(series["buckets"])))
+                           for key, series in self._series.items())
+
+        series_by_metric = {}
+        for (metric, labels), series in items:
+            series_by_metric.setdefault(metric, []).append((labels, series))
+
+        # Every sample of a family follows its HELP and TYPE lines, one family at a time
+        lines = []
+        for metric, all_series in series_by_metric.items():
+            base = f"{_PROMETHEUS_PREFIX}_{metric}"
+            lines += [f"# HELP {base}_duration_seconds Duration of {metric} operations.",
+                      f"# TYPE {base}_duration_seconds histogram"]
+            for labels, series in all_series:
+                for bound, count in zip(self.buckets, series["buckets"]):
+                    lines.append(f"{base}_duration_seconds_bucket{_labels(labels, le=bound)} {count}")
+                lines.append(f"{base}_duration_seconds_bucket{_labels(labels, le='+Inf')} {series['count']}")
+                lines.append(f"{base}_duration_seconds_sum{_labels(labels)} {series['sum']}")
+                lines.append(f"{base}_duration_seconds_count{_labels(labels)} {series['count']}")
+
+            lines += [f"# HELP {base}_errors_total Failed {metric} operations.",
+                      f"# TYPE {base}_errors_total counter"]
+            lines += [f"{base}_errors_total{_labels(labels)} {series['errors']}"
+                      for labels, series in all_series]
+
+            lines += [f"# HELP {base}_payload_bytes_total Bytes produced by {metric} operations.",
+                      f"# TYPE {base}_payload_bytes_total counter"]
+            lines += [f"{base}_payload_bytes_total{_labels(labels)} {series['payload_bytes']}"
+                      for labels, series in all_series]
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        """Drop every series"""
+        with self._lock:
+            self._series.clear()
+
+
+def _labels(labels, **extra) -> str:
+    pairs = list(labels) + [(k, str(v)) for k, v in extra.items()]
+    if not pairs:
+        return ""
+    escaped = (
+        (k, v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for k, v in pairs
+    )
+    return "{" + ",".join(f'{k}="{v}"' for k, v in escaped) + "}"
+
+
+_metrics = MetricsRegistry(enabled=None)
+
+def get_metrics() -> MetricsRegistry:
+    """Return the process-wide metrics registry"""
+    return _metrics
+
+
+# Name of the tool being timed, so a proxy and the tool it wraps count one call
+_timed_tool = contextvars.ContextVar("timed_tool", default=None)
+
+
+def instrument_tool(run):
+    """
+    Decorator for a tool's ``_run`` or ``_arun`` recording its duration, output
+    size and errors under the "tool" metric, labelled with the tool's name.
+    Nested calls for the same tool (e.g. a LazyTool and the tool it builds)
+    are recorded once.
+    """
+    if asyncio.iscoroutinefunction(run):
+        @functools.wraps(run)
+        async def async_wrapper(self, *args, **kwargs):
+            if _timed_tool.get() == self.name:
+                return await run(self, *args, **kwargs)
+            token = _timed_tool.set(self.name)
+            try:
+                with _metrics.timer("tool", tool=self.name) as record:
+                    result = await run(self, *args, **kwargs)
+                    record["payload_bytes"] = payload_size(result)
+                    return result
+            finally:
+                _timed_tool.reset(token)
+        return async_wrapper
+
+    @functools.wraps(run)
+    def wrapper(self, *args, **kwargs):
+        if _timed_tool.get() == self.name:
+            return run(self, *args, **kwargs)
+        token = _timed_tool.set(self.name)
+        try:
+            with _metrics.timer("tool", tool=self.name) as record:
+                result = run(self, *args, **kwargs)
+                record["payload_bytes"] = payload_size(result)
+                return result
+        finally:
+            _timed_tool.reset(token)
+    return wrapper
+
+
+def record_task_event(event):
+    """
+    utils.events listener turning task_finished/task_failed events into "task" observations
+    """
+    if event["type"] not in ("task_finished", "task_failed"):
+        return
+    _metrics.observe(
+        "task",
+        event.get("duration", 0.0),
+        payload_bytes=payload_size(event.get("output")),
+        error=event["type"] == "task_failed",
+        task=event.get("task"),
+        agent=event.get("agent")
+    )
+
+
+_task_metrics_installed = False
+_install_lock = threading.Lock()
+
+def install_task_metrics():
+    """
+    Start recording task durations from crew events (idempotent)
+    """
+    global _task_metrics_installed
+    from utils.events import add_listener
+
+    with _install_lock:
+        if not _task_metrics_installed:
+            add_listener(record_task_event)
+            _task_metrics_installed = True
+
+
+def start_metrics_server(port: int = 9464, host: str = "127.0.0.1"):
+    """
+    Serve the metrics over HTTP in a background thread:
+    /metrics in Prometheus text format and /metrics.json as a JSON snapshot
+
+    Returns:
+        ThreadingHTTPServer: The running server (call shutdown() to stop it)
+    """
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == "/metrics":
+                body, content_type = _metrics.to_prometheus(), "text/plain; version=0.0.4"
+            elif self.path == "/metrics.json":
+                body, content_type = _metrics.to_json(), "application/json"
+            else:
+                self.send_error(404)
+                return
+            data = body.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    return server
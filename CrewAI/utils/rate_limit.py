@@ -0,0 +1,236 @@
+"""
+Rate Limit Module
+=================
+
+Token buckets shared by every process on the machine, kept in SQLite, pacing
+calls to each provider under its requests-per-minute (RPM) and
+tokens-per-minute (TPM) quotas.
+
+A call reserves its share (one request, and an estimate of its tokens) in a
+single IMMEDIATE transaction, which serializes the processes. A bucket may
+go into debt: the caller is told how long to wait until its reservation is
+covered and sleeps that long. So concurrent callers queue up in order at
+exactly the quota rate, instead of all firing, getting 429s and backing off.
+A reservation that would wait longer than ``max_wait`` is not made, and the
+call fails with RateLimitTimeout.
+
+Request buckets hold ``burst`` seconds of quota, so requests go out evenly.
+Token buckets hold ``token_burst`` seconds (a minute by default, the window
+providers meter TPM over), so one large prompt can use the quota it is
+entitled to; a call estimated above a whole bucket can never be covered and
+fails at once with RateLimitTimeout.
+
+Token estimates are settled once the real usage is known (see
+utils/rate_limited_llm.py for LLM calls). Waits are recorded in the metrics
+registry as ``rate_limit_wait`` per provider.
+"""
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+
+from utils.concurrency import get_io_executor
+from utils.metrics import get_metrics
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS buckets (
+    provider TEXT NOT NULL,
+    resource TEXT NOT NULL,
+    level REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (provider, resource)
+)
+"""
+
+
+class RateLimitTimeout(TimeoutError):
+    """Raised when a call would have to wait longer than allowed for its quota"""
+
+
+class RateLimiter:
+    """
+    Cross-process token buckets with per-provider RPM/TPM limits
+
+    Args:
+        path (str): Location of the SQLite file shared by the processes
+        limits (dict): Provider -> {"rpm": requests per minute, "tpm": tokens per minute};
+            providers or limits that are missing are not paced
+        burst (float): Seconds of quota a request bucket holds when idle (how much may go out at once)
+        token_burst (float): Seconds of quota a token bucket holds when idle; also the
+            largest call a token bucket can cover
+    """
+
+    def __init__(self, path: str, limits: dict, burst: float = 1.0, token_burst: float = 60.0):
+        self.path = path
+        self.limits = {provider: dict(limit) for provider, limit in limits.items()}
+        self.burst = burst
+        self.token_burst = token_burst
+        self._lock = threading.Lock()
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_SCHEMA)
+
+    def reserve(self, provider: str, tokens: int = 0, max_wait: float = None) -> float:
+        """
+        Reserve one request (and ``tokens`` tokens) from a provider's quota
+
+        Args:
+            provider (str): The provider, e.g. "serper" or "openai"
+            tokens (int): Tokens the call is expected to use
+            max_wait (float): Longest acceptable wait in seconds (None for no bound)
+
+        Returns:
+            float: Seconds the caller must wait before making the call
+
+        Raises:
+            RateLimitTimeout: If the wait would exceed max_wait, or the amount exceeds
+                what the bucket can hold (nothing is reserved)
+        """
+        amounts = self._amounts(provider, tokens)
+        if not amounts:
+            return 0.0
+        for resource, (rate, amount) in amounts.items():
+            if amount > self._capacity(resource, rate):
+                raise RateLimitTimeout(
+                    f"{provider} call needs {amount} {resource}, more than its quota can cover "
+                    f"({self._capacity(resource, rate):.0f})"
+                )
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                levels = {resource: self._level(provider, resource, rate, now)
+                          for resource, (rate, _) in amounts.items()}
+                # Time until every bucket covers its amount
+                wait = max(max(0.0, (amount - levels[resource]) / rate)
+                           for resource, (rate, amount) in amounts.items())
+                if max_wait is not None and wait > max_wait:
+                    self._conn.execute("ROLLBACK")
+                    raise RateLimitTimeout(
+                        f"{provider} quota would need a {wait:.1f}s wait (limit {max_wait:.1f}s)"
+                    )
+                for resource, (_, amount) in amounts.items():
+                    self._store(provider, resource, levels[resource] - amount, now)
+                self._conn.execute("COMMIT")
+            except sqlite3.Error:
+                self._conn.execute("ROLLBACK")
+                raise
+        return wait
+
+    def acquire(self, provider: str, tokens: int = 0, max_wait: float = None) -> float:
+        """
+        Reserve from a provider's quota and sleep until the reservation is covered
+
+        Returns:
+            float: Seconds waited
+        """
+        wait = self.reserve(provider, tokens, max_wait)
+        if wait:
+            time.sleep(wait)
+        self._record_wait(provider, wait)
+        return wait
+
+    async def aacquire(self, provider: str, tokens: int = 0, max_wait: float = None) -> float:
+        """
+        Async version of acquire, waiting without blocking the event loop
+        """
+        # The reservation may wait on another process's SQLite lock: keep it off the loop
+        wait = await asyncio.get_running_loop().run_in_executor(
+            get_io_executor(), self.reserve, provider, tokens, max_wait
+        )
+        if wait:
+            await asyncio.sleep(wait)
+        self._record_wait(provider, wait)
+        return wait
+
+    def settle(self, provider: str, tokens: int):
+        """
+        Correct a provider's token bucket once a call's real usage is known
+
+        Args:
+            provider (str): The provider
+            tokens (int): Tokens used beyond the reserved estimate (negative to refund)
+        """
+        limit = self.limits.get(provider, {}).get("tpm")
+        if not limit or not tokens:
+            return
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                level = self._level(provider, "tokens", limit / 60.0, now)
+                self._store(provider, "tokens", level - tokens, now)
+                self._conn.execute("COMMIT")
+            except sqlite3.Error:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def close(self):
+        """Close the underlying SQLite connection"""
+        with self._lock:
+            self._conn.close()
+
+    def _amounts(self, provider, tokens):
+        # Resource -> (refill rate per second, amount to take)
+        limits = self.limits.get(provider, {})
+        amounts = {}
+        if limits.get("rpm"):
+            amounts["requests"] = (limits["rpm"] / 60.0, 1)
+        if limits.get("tpm") and tokens:
+            amounts["tokens"] = (limits["tpm"] / 60.0, tokens)
+        return amounts
+
+    def _capacity(self, resource, rate):
+        burst = self.token_burst if resource == "tokens" else self.burst
+        return max(rate * burst, 1.0)
+
+    def _level(self, provider, resource, rate, now):
+        # Bucket level refilled up to now, capped at the burst capacity
+        capacity = self._capacity(resource, rate)
+        row = self._conn.execute(
+            "SELECT level, updated_at FROM buckets WHERE provider = ? AND resource = ?",
+            (provider, resource)
+        ).fetchone()
+        if row is None:
+            return capacity
+        return min(capacity, row[0] + (now - row[1]) * rate)
+
+    def _store(self, provider, resource, level, now):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO buckets (provider, resource, level, updated_at) VALUES (?, ?, ?, ?)",
+            (provider, resource, level, now)
+        )
+
+    @staticmethod
+    def _record_wait(provider, wait):
+        get_metrics().observe("rate_limit_wait", wait, provider=provider)
+
+
+_rate_limiter = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter():
+    """
+    Return the process-wide rate limiter, creating it on first use.
+    Returns None when rate limiting is disabled in the settings.
+    """
+    global _rate_limiter
+    from config.settings import (
+        RATE_LIMIT_ENABLED, RATE_LIMIT_PATH, RATE_LIMITS, RATE_LIMIT_BURST, RATE_LIMIT_TOKEN_BURST
+    )
+
+    if not RATE_LIMIT_ENABLED:
+        return None
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = RateLimiter(
+                RATE_LIMIT_PATH, RATE_LIMITS, burst=RATE_LIMIT_BURST, token_burst=RATE_LIMIT_TOKEN_BURST
+            )
+    return _rate_limiter
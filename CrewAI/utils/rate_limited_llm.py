@@ -0,0 +1,95 @@
+"""
+Rate Limited LLM
+================
+
+Paces a LangChain model's requests through the shared rate limiter
+(utils.rate_limit). Each request reserves one call and an estimate of its
+tokens (prompt plus expected completion) before it is sent, and the estimate
+is settled against the provider's reported usage when it returns.
+
+The reservation is made inside the model's own ``_generate``/``_agenerate``,
+which LangChain only calls once its completion cache (config/llm_cache.py)
+has missed, so cached and replayed completions never wait for quota.
+"""
+import contextvars
+import inspect
+
+from langchain_core.messages import BaseMessage, get_buffer_string
+
+from utils.compaction import estimate_tokens
+from utils.rate_limit import get_rate_limiter
+
+# Set while a paced request runs, so a sync _generate run by an async one is not paced twice
+_paced = contextvars.ContextVar("rate_limit_paced", default=False)
+
+
+def pace_llm(llm, provider: str):
+    """
+    Make a LangChain chat or completion model take its share of a provider's
+    quota (RATE_LIMITS) before every request it sends
+
+    Args:
+        llm: The model, changed in place
+        provider (str): Provider whose RATE_LIMITS entry applies
+
+    Returns:
+        The same model
+    """
+    if llm.__dict__.get("_rate_limit_provider"):
+        return llm
+    generate, agenerate = llm._generate, llm._agenerate
+    passes_run_manager = "run_manager" in inspect.signature(generate).parameters
+
+    def _generate(inputs, stop=None, run_manager=None, **kwargs):
+        if passes_run_manager:
+            kwargs["run_manager"] = run_manager
+        limiter = get_rate_limiter()
+        if limiter is None or _paced.get():
+            return generate(inputs, stop=stop, **kwargs)
+
+        from config.settings import RATE_LIMIT_MAX_WAIT
+        tokens = _estimate(llm, inputs, kwargs)
+        limiter.acquire(provider, tokens=tokens, max_wait=RATE_LIMIT_MAX_WAIT)
+        result = generate(inputs, stop=stop, **kwargs)
+        _settle(limiter, provider, tokens, result)
+        return result
+
+    async def _agenerate(inputs, stop=None, run_manager=None, **kwargs):
+        limiter = get_rate_limiter()
+        if limiter is None or _paced.get():
+            return await agenerate(inputs, stop=stop, run_manager=run_manager, **kwargs)
+
+        from config.settings import RATE_LIMIT_MAX_WAIT
+        tokens = _estimate(llm, inputs, kwargs)
+        await limiter.aacquire(provider, tokens=tokens, max_wait=RATE_LIMIT_MAX_WAIT)
+        paced = _paced.set(True)
+        try:
+            result = await agenerate(inputs, stop=stop, run_manager=run_manager, **kwargs)
+        finally:
+            _paced.reset(paced)
+        _settle(limiter, provider, tokens, result)
+        return result
+
+    # LangChain models are pydantic models: bypass field validation to set the wrappers
+    object.__setattr__(llm, "_generate", _generate)
+    object.__setattr__(llm, "_agenerate", _agenerate)
+    object.__setattr__(llm, "_rate_limit_provider", provider)
+    return llm
+
+
+def _estimate(llm, inputs, kwargs):
+    # Tokens reserved for one request: its prompt plus the completion it may produce
+    from config.settings import RATE_LIMIT_COMPLETION_TOKENS
+
+    if inputs and isinstance(inputs[0], BaseMessage):
+        prompt = estimate_tokens(get_buffer_string(inputs))
+    else:
+        prompt = sum(estimate_tokens(text) for text in inputs)
+    completion = kwargs.get("max_tokens") or getattr(llm, "max_tokens", None) or RATE_LIMIT_COMPLETION_TOKENS
+    return prompt + completion
+
+
+def _settle(limiter, provider, reserved, result):
+    usage = (result.llm_output or {}).get("token_usage") or {}
+    if limiter is not None and usage.get("total_tokens"):
+        limiter.settle(provider, usage["total_tokens"] - reserved)
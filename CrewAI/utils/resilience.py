@@ -0,0 +1,331 @@
+"""
+Resilience Module
+=================
+
+Deadlines, retries and circuit breaking for outbound tool I/O.
+
+- A Deadline bounds a whole call, retries included; each attempt gets at most
+  the time that is left.
+- Transient failures (timeouts, connection errors, 429 and 5xx responses) are
+  retried with full-jitter exponential backoff, but only while the process-wide
+  RetryBudget allows it: retries may add at most ``ratio`` of the recent
+  request volume (plus a small floor). During an outage, calls fail after
+  their first attempt instead of multiplying the load.
+- A CircuitBreaker per provider opens after ``failure_threshold`` consecutive
+  transient failures. While it is open, calls fail immediately with
+  CircuitOpenError, so callers can serve a cached or degraded result. After
+  ``reset_timeout`` one trial call is let through, and its outcome closes or
+  re-opens the circuit. A trial that ends without an outcome (cancelled, or
+  never sent) hands its slot back, so the next call becomes the trial.
+
+A RateLimitTimeout (the local quota is used up, see utils.rate_limit) makes
+the provider unavailable for that call but is neither retried nor counted
+against the provider's circuit: nothing was sent.
+"""
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+
+from utils.rate_limit import RateLimitTimeout
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised instead of calling a provider whose circuit is open"""
+
+
+class Deadline:
+    """
+    Point in time by which a call must be finished
+
+    Args:
+        seconds (float): Time allowed from now
+    """
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """Seconds left, never negative"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+
+def is_transient(error: BaseException) -> bool:
+    """
+    Whether an error is worth retrying: timeouts, connection failures, and
+    HTTP 429 or 5xx responses (requests and httpx errors carry the response)
+    """
+    if isinstance(error, (CircuitOpenError, RateLimitTimeout)):
+        return False
+    response = getattr(error, "response", None)
+    status = getattr(response, "status_code", None)
+    if status is not None:
+        return status == 429 or status >= 500
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    # requests' and httpx's transport errors do not share a stdlib base class
+    return type(error).__name__ in {"ConnectionError", "ConnectTimeout", "ReadTimeout",
+                                    "ConnectError", "ReadError", "RemoteProtocolError"}
+
+
+def is_unavailable(error: BaseException) -> bool:
+    """
+    Whether an error means the provider could not answer (a transient failure,
+    an open circuit or a used-up quota), as opposed to rejecting the request
+    """
+    return isinstance(error, (CircuitOpenError, RateLimitTimeout)) or is_transient(error)
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Full-jitter exponential backoff before retry number ``attempt`` (starting at 1)"""
+    return random.uniform(0, min(cap, base * 2 ** (attempt - 1)))
+
+
+class RetryBudget:
+    """
+    Caps retries to a fraction of the recent request volume
+
+    Args:
+        ratio (float): Retries allowed per request in the window
+        min_retries (int): Retries always allowed per window, for low traffic
+        window (float): Seconds of history considered
+    """
+
+    def __init__(self, ratio: float = 0.1, min_retries: int = 10, window: float = 10):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self.denied = 0
+        self._requests = deque()
+        self._retries = deque()
+        self._lock = threading.Lock()
+
+    def record_request(self):
+        """Count a first attempt"""
+        with self._lock:
+            self._requests.append(time.monotonic())
+
+    def try_spend(self) -> bool:
+        """Take one retry from the budget, or return False if it is exhausted"""
+        now = time.monotonic()
+        with self._lock:
+            for events in (self._requests, self._retries):
+                while events and events[0] < now - self.window:
+                    events.popleft()
+            if len(self._retries) >= self.min_retries + self.ratio * len(self._requests):
+                self.denied += 1
+                return False
+            self._retries.append(now)
+            return True
+
+
+class CircuitBreaker:
+    """
+    Fails fast while a provider keeps failing
+
+    Args:
+        name (str): Provider name, used in errors and metrics
+        failure_threshold (int): Consecutive transient failures that open the circuit
+        reset_timeout (float): Seconds the circuit stays open before a trial call
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = None
+        self._trial_out = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Whether a call may go out now (in the half-open state, only one trial call at a time does)"""
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open" and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = "half_open"
+            if self.state == "half_open" and not self._trial_out:
+                self._trial_out = True
+                return True
+            return False
+
+    def release(self):
+        """Hand back the trial slot of a call that ended without recording an outcome"""
+        with self._lock:
+            self._trial_out = False
+
+    def record_success(self):
+        with self._lock:
+            self.state = "closed"
+            self.failures = 0
+            self._trial_out = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._trial_out = False
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                self.state = "open"
+                self.opened_at = time.monotonic()
+
+
+def call_with_retries(call, deadline: Deadline, breaker: CircuitBreaker = None,
+                      budget: RetryBudget = None, max_attempts: int = 3,
+                      attempt_timeout: float = None, base_delay: float = 0.2, max_delay: float = 2.0):
+    """
+    Run ``call(timeout)`` until it succeeds, a non-transient error occurs, the
+    attempts or retry budget run out, or the deadline passes
+
+    Args:
+        call (callable): Performs one attempt given its timeout in seconds
+        deadline (Deadline): Bound on the whole call
+        breaker (CircuitBreaker): Circuit of the provider being called
+        budget (RetryBudget): Shared retry budget
+        max_attempts (int): Attempts including the first one
+        attempt_timeout (float): Upper bound on a single attempt (defaults to the deadline)
+        base_delay (float): Backoff before the first retry, doubled after each one
+        max_delay (float): Upper bound on the backoff
+
+    Raises:
+        CircuitOpenError: If the circuit is open
+        TimeoutError: If the deadline passed before an attempt could be made
+        Exception: The last attempt's error
+    """
+    for attempt in _attempts(deadline, breaker, budget, max_attempts, base_delay, max_delay):
+        try:
+            if attempt.delay:
+                time.sleep(attempt.delay)
+            result = call(attempt.timeout(attempt_timeout))
+            attempt.succeeded()
+        except Exception as e:
+            attempt.failed(e)
+            continue
+        finally:
+            attempt.release()
+        return result
+
+
+async def acall_with_retries(call, deadline: Deadline, breaker: CircuitBreaker = None,
+                             budget: RetryBudget = None, max_attempts: int = 3,
+                             attempt_timeout: float = None, base_delay: float = 0.2, max_delay: float = 2.0):
+    """
+    Async version of call_with_retries: ``call(timeout)`` returns an awaitable
+    """
+    for attempt in _attempts(deadline, breaker, budget, max_attempts, base_delay, max_delay):
+        try:
+            if attempt.delay:
+                await asyncio.sleep(attempt.delay)
+            result = await call(attempt.timeout(attempt_timeout))
+            attempt.succeeded()
+        except Exception as e:
+            attempt.failed(e)
+            continue
+        finally:
+            attempt.release()  # Also when the call was cancelled
+        return result
+
+
+class _Attempt:
+    def __init__(self, deadline, breaker, delay):
+        self.deadline = deadline
+        self.breaker = breaker
+        self.delay = delay
+        self.error = None
+        self.done = False
+        self.reported = False
+
+    def timeout(self, attempt_timeout):
+        remaining = self.deadline.remaining()
+        return remaining if attempt_timeout is None else min(attempt_timeout, remaining)
+
+    def failed(self, error):
+        self.error = error
+        if self.breaker is None:
+            return
+        if is_transient(error):
+            self.breaker.record_failure()
+            self.reported = True
+        elif not isinstance(error, RateLimitTimeout):
+            self.breaker.record_success()  # The provider answered, e.g. with a 4xx
+            self.reported = True
+
+    def succeeded(self):
+        self.done = True
+        if self.breaker is not None:
+            self.breaker.record_success()
+            self.reported = True
+
+    def release(self):
+        # An attempt that recorded no outcome must not keep the half-open trial slot
+        if self.breaker is not None and not self.reported:
+            self.breaker.release()
+
+
+def _attempts(deadline, breaker, budget, max_attempts, base_delay, max_delay):
+    # Yields one _Attempt per try and raises the final error once retrying stops
+    error = None
+    for number in range(1, max_attempts + 1):
+        if number == 1:
+            delay = 0.0
+        else:
+            if not is_transient(error) or (budget is not None and not budget.try_spend()):
+                raise error
+            delay = backoff_delay(number - 1, base_delay, max_delay)
+            if delay >= deadline.remaining():
+                raise error
+        if deadline.expired:
+            raise error or TimeoutError(f"deadline of {deadline.seconds}s passed")
+        # Last check before the attempt: a trial slot taken here is always released
+        if breaker is not None and not breaker.allow():
+            raise CircuitOpenError(f"{breaker.name} circuit is open") from error
+        if number == 1 and budget is not None:
+            budget.record_request()
+
+        attempt = _Attempt(deadline, breaker, delay)
+        yield attempt
+        if attempt.done:
+            return
+        error = attempt.error
+    raise error
+
+
+_breakers = {}
+_retry_budget = None
+_resilience_lock = threading.Lock()
+
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    """
+    Return the process-wide circuit breaker of a provider, creating it on first use
+    """
+    from config.settings import CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_TIMEOUT
+
+    with _resilience_lock:
+        if name not in _breakers:
+            _breakers[name] = CircuitBreaker(
+                name, failure_threshold=CIRCUIT_FAILURE_THRESHOLD, reset_timeout=CIRCUIT_RESET_TIMEOUT
+            )
+        return _breakers[name]
+
+
+def get_retry_budget() -> RetryBudget:
+    """
+    Return the process-wide retry budget shared by all outbound tool calls
+    """
+    global _retry_budget
+    from config.settings import RETRY_BUDGET_RATIO, RETRY_BUDGET_MIN_RETRIES, RETRY_BUDGET_WINDOW
+
+    with _resilience_lock:
+        if _retry_budget is None:
+            _retry_budget = RetryBudget(
+                ratio=RETRY_BUDGET_RATIO, min_retries=RETRY_BUDGET_MIN_RETRIES, window=RETRY_BUDGET_WINDOW
+            )
+    return _retry_budget
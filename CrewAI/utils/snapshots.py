@@ -0,0 +1,210 @@
+"""
+Page Snapshot Store
+===================
+
+Local copies of scraped web pages, kept as pre-extracted text in SQLite.
+
+A snapshot is served straight from disk while it is fresh. Freshness comes
+from the page's ``Cache-Control: max-age`` (or a configured default), and a
+minimum refresh interval keeps pages served with ``max-age=0`` from being
+revalidated on every read. Once stale, the page is revalidated with a
+conditional request (``If-None-Match`` / ``If-Modified-Since``), so an
+unchanged page costs a 304 and no re-parsing.
+
+Only one thread per URL refreshes at a time; concurrent readers wait for it
+and then share the result. If a refresh fails, the last snapshot is served.
+"""
+import os
+import re
+import sqlite3
+import threading
+import time
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    url TEXT PRIMARY KEY,
+    text TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+)
+"""
+
+_MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+
+def extract_page_text(html) -> str:
+    """
+    Extract the visible text of a page, the same way ScrapeWebsiteTool does
+    """
+    from bs4 import BeautifulSoup
+
+    text = BeautifulSoup(html, "html.parser").get_text()
+    text = "\n".join(line for line in text.split("\n") if line.strip() != "")
+    return " ".join(word for word in text.split(" ") if word.strip() != "")
+
+
+def _http_fetch(url: str, headers: dict, timeout: float):
+    # Default fetcher: the shared keep-alive session (utils.http)
+    from utils.http import get_http_session
+
+    response = get_http_session().get(url, headers=headers, timeout=timeout)
+    if response.status_code != 304:
+        response.raise_for_status()
+    return response.status_code, response.headers, response.content
+
+
+class SnapshotStore:
+    """
+    SQLite-backed store of extracted page text with conditional refresh
+
+    Args:
+        path (str): Location of the SQLite file (":memory:" for a private store)
+        default_max_age (float): Seconds a snapshot stays fresh when the page sends no max-age
+        min_refresh_interval (float): Minimum seconds between two revalidations of a page
+        timeout (float): Seconds to wait for the page when refreshing
+        fetch (callable): ``fetch(url, headers, timeout) -> (status, headers, body)``,
+            defaults to a GET over the shared HTTP session
+        extract (callable): Turns the page body into text, defaults to extract_page_text
+    """
+
+    def __init__(self, path: str, default_max_age: float = 24 * 3600,
+                 min_refresh_interval: float = 15 * 60, timeout: float = 15,
+                 fetch=None, extract=None):
+        self.path = path
+        self.default_max_age = default_max_age
+        self.min_refresh_interval = min_refresh_interval
+        self.timeout = timeout
+        self.fetch = fetch or _http_fetch
+        self.extract = extract or extract_page_text
+        self.stats = {"fresh": 0, "revalidated": 0, "downloaded": 0, "stale_served": 0}
+        self._lock = threading.Lock()
+        self._url_locks = {}
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def get_text(self, url: str) -> str:
+        """
+        Return the extracted text of a page, refreshing the snapshot only when it is stale
+
+        Args:
+            url (str): The page to read
+
+        Returns:
+            str: The page's visible text
+        """
+        snapshot = self._load(url)
+        if snapshot is not None and snapshot["expires_at"] > time.time():
+            self._count("fresh")
+            return snapshot["text"]
+
+        with self._url_lock(url):
+            # Another thread (or process) may have refreshed it while we waited
+            snapshot = self._load(url)
+            if snapshot is not None and snapshot["expires_at"] > time.time():
+                self._count("fresh")
+                return snapshot["text"]
+            return self._refresh(url, snapshot)
+
+    def invalidate(self, url: str):
+        """Mark a snapshot stale so the next read revalidates it"""
+        with self._lock:
+            self._conn.execute("UPDATE snapshots SET expires_at = 0 WHERE url = ?", (url,))
+            self._conn.commit()
+
+    def close(self):
+        """Close the underlying SQLite connection"""
+        with self._lock:
+            self._conn.close()
+
+    def _refresh(self, url, snapshot):
+        headers = {}
+        if snapshot is not None:
+            if snapshot["etag"]:
+                headers["If-None-Match"] = snapshot["etag"]
+            if snapshot["last_modified"]:
+                headers["If-Modified-Since"] = snapshot["last_modified"]
+
+        try:
+            status, response_headers, body = self.fetch(url, headers, self.timeout)
+        except Exception:
+            if snapshot is None:
+                raise
+            self._count("stale_served")
+            return snapshot["text"]
+
+        expires_at = time.time() + self._max_age(response_headers)
+        if status == 304 and snapshot is not None:
+            with self._lock:
+                self._conn.execute(
+                    "UPDATE snapshots SET expires_at = ? WHERE url = ?", (expires_at, url)
+                )
+                self._conn.commit()
+            self._count("revalidated")
+            return snapshot["text"]
+
+        text = self.extract(body)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO snapshots (url, text, etag, last_modified, fetched_at, expires_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (url, text, response_headers.get("ETag"), response_headers.get("Last-Modified"),
+                 time.time(), expires_at)
+            )
+            self._conn.commit()
+        self._count("downloaded")
+        return text
+
+    def _max_age(self, headers) -> float:
+        match = _MAX_AGE_PATTERN.search(headers.get("Cache-Control") or "")
+        max_age = int(match.group(1)) if match else self.default_max_age
+        return max(max_age, self.min_refresh_interval)
+
+    def _load(self, url):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT text, etag, last_modified, expires_at FROM snapshots WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {"text": row[0], "etag": row[1], "last_modified": row[2], "expires_at": row[3]}
+
+    def _url_lock(self, url):
+        with self._lock:
+            return self._url_locks.setdefault(url, threading.Lock())
+
+    def _count(self, outcome):
+        with self._lock:
+            self.stats[outcome] += 1
+
+
+_snapshot_store = None
+_snapshot_store_lock = threading.Lock()
+
+
+def get_snapshot_store() -> SnapshotStore:
+    """
+    Return the process-wide snapshot store, creating it on first use
+    """
+    global _snapshot_store
+    from config.settings import (
+        SNAPSHOT_STORE_PATH, SNAPSHOT_DEFAULT_MAX_AGE, SNAPSHOT_MIN_REFRESH_INTERVAL,
+        SNAPSHOT_FETCH_TIMEOUT
+    )
+
+    with _snapshot_store_lock:
+        if _snapshot_store is None:
+            _snapshot_store = SnapshotStore(
+                SNAPSHOT_STORE_PATH,
+                default_max_age=SNAPSHOT_DEFAULT_MAX_AGE,
+                min_refresh_interval=SNAPSHOT_MIN_REFRESH_INTERVAL,
+                timeout=SNAPSHOT_FETCH_TIMEOUT
+            )
+    return _snapshot_store
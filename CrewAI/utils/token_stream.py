@@ -0,0 +1,18 @@
+"""
+Token Stream Handler
+====================
+
+LangChain callback handler publishing streamed LLM tokens as "token" events
+through utils.events, tagged with the task and agent currently running.
+"""
+from langchain_core.callbacks import BaseCallbackHandler
+
+from utils.events import emit
+
+
+class TokenStreamHandler(BaseCallbackHandler):
+    """Forward each streamed token chunk as a token event"""
+
+    def on_llm_new_token(self, token: str, **kwargs) -> None:
+        if token:
+            emit("token", text=token)